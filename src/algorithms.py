@@ -1,56 +1,48 @@
+import heapq
+from collections import deque
+
+import numpy as np
+
+from indexed_heap import IndexedHeap
+from metrics import compute_metrics
+from schedule import Schedule
+from workload import as_workload
+
+# Defaults of the CFS-like scheduler, in time units.
+CFS_TARGET_LATENCY = 8
+CFS_MIN_GRANULARITY = 1
+# Time a process waits in the ready queue per priority level it gains.
+PRIORITY_AGING_INTERVAL = 10
+
+
 class Process:
     def __init__(self, pid, arrival_time=0, burst_time=0):
         self.pid = pid
         self.arrival_time = arrival_time
         self.burst_time = burst_time
 
-def tats_and_rts(schedule):
-    rts = {}
-    i = 0
-    tats = {}
-    read_pids = []
-    for process in schedule:
-        pid = process["process"]
-        if pid not in read_pids:
-            rts[pid] =process["start"]
-            i += 1
-            read_pids.append(pid)
-        tats[pid] = process["end"]
-    return tats, rts
-
 def fcfs(processes):
     """
     First-Come-First-Serve (FCFS) scheduling algorithm.
 
     Args:
-        processes (list): List of dicts, each with 'pid', 'arrival_time', 'burst_time'.
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
-    indexed_processes = [(i, p) for i, p in enumerate(processes)]
-    sorted_processes = sorted(
-        indexed_processes, key=lambda x: (x[1]["arrival_time"], x[0])
-    )
-
-    schedule = []
-    waiting_times = {}
-    current_time = 0
-
-    for _, process in sorted_processes:
-        pid = process["pid"]
-        arrival = process["arrival_time"]
-        burst = process["burst_time"]
+    workload = as_workload(processes)
+    order = workload.arrival_order()
+    arrivals = workload.arrival_time[order]
+    start_times, end_times = fcfs_times(arrivals, workload.burst_time[order])
 
-        start_time = max(current_time, arrival)
-        end_time = start_time + burst
-
-        schedule.append({"process": pid, "start": start_time, "end": end_time})
-        waiting_times[pid] = start_time - arrival
-        current_time = end_time
+    schedule = Schedule.from_arrays(workload.pids, order, start_times, end_times)
+    waiting = start_times - arrivals
+    waiting_times = dict(zip([workload.pids[i] for i in order.tolist()], waiting.tolist()))
 
     avg_waiting_time = (
         sum(waiting_times.values()) / len(waiting_times) if waiting_times else 0.0
@@ -59,53 +51,103 @@ def fcfs(processes):
     return schedule, waiting_times, avg_waiting_time
 
 
+def fcfs_times(arrivals, bursts, free_at=0):
+    """
+    Start and end times of processes run back to back in the given order.
+
+    Args:
+        arrivals (numpy.ndarray): Arrival times, sorted.
+        bursts (numpy.ndarray): Burst times in the same order.
+        free_at (int): Time the CPU becomes available.
+
+    Returns:
+        tuple: (start_times, end_times) arrays.
+    """
+    # Each process ends at the total burst so far plus the largest idle gap
+    # accumulated before it: end_k = C_k + max(0, max_{j<=k} (a_j - C_{j-1})).
+    cumulative = np.cumsum(bursts)
+    idle = np.maximum(np.maximum.accumulate(arrivals - (cumulative - bursts)), free_at)
+    end_times = cumulative + idle
+    return end_times - bursts, end_times
+
+
+def execution_order_waiting_times(schedule, workload):
+    """
+    Waiting times of a non-preemptive schedule, in the order the processes ran.
+
+    Returns:
+        dict: Waiting times {'pid': int, ...}
+    """
+    index = schedule.index
+    waiting = schedule.start - workload.arrival_time[index]
+    pids = workload.pids
+    return dict(zip([pids[i] for i in index.tolist()], waiting.tolist()))
+
+
+def simulate_non_preemptive(schedule, arrivals, bursts, order, key, state=None, checkpoint=None, every=0):
+    """
+    Event loop of the non-preemptive heap schedulers (SJF and LJF).
+
+    The loops here are shared with incremental.IncrementalSimulator, which
+    resumes them from a recorded state and records new states as they run.
+
+    Args:
+        schedule (Schedule): Segments are appended to it.
+        arrivals (list): Arrival time per row.
+        bursts (list): Burst time per row.
+        order (list): Rows sorted by arrival.
+        key (callable): Ready-queue key of a row, ending with the row.
+        state (tuple, optional): (current_time, cursor, ready_queue) to resume
+            from; the ready queue is a heap list of keys and is modified.
+        checkpoint (callable, optional): Called with (current_time, cursor,
+            ready_queue tuple) at the top of the loop, every ``every``
+            iterations or more when the queue is longer.
+        every (int): Minimum iterations between checkpoints.
+    """
+    current_time, cursor, ready_queue = state or (0, 0, [])
+    num_processes = len(order)
+    countdown = 0 if checkpoint is not None else -1
+
+    while cursor < num_processes or ready_queue:
+        if countdown == 0:
+            checkpoint(current_time, cursor, tuple(ready_queue))
+            countdown = max(every, len(ready_queue))
+        countdown -= 1
+
+        while cursor < num_processes and arrivals[order[cursor]] <= current_time:
+            heapq.heappush(ready_queue, key(order[cursor]))
+            cursor += 1
+
+        if not ready_queue:
+            current_time = arrivals[order[cursor]]
+            continue
+
+        index = heapq.heappop(ready_queue)[-1]
+        end_time = current_time + bursts[index]
+        schedule.append(index, current_time, end_time)
+        current_time = end_time
+
+
 def sjf_non_preemptive(processes):
     """
     Shortest Job First (SJF) Non-Preemptive scheduling algorithm.
 
     Args:
-        processes (list): List of dicts, each with 'pid', 'arrival_time', 'burst_time'.
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
-    indexed_processes = [(i, p) for i, p in enumerate(processes)]
-    schedule = []
-    waiting_times = {}
-    current_time = 0
-    completed = set()
-
-    while len(completed) < len(processes):
-        ready_processes = [
-            (i, p)
-            for i, p in indexed_processes
-            if p["pid"] not in completed and p["arrival_time"] <= current_time
-        ]
-
-        if not ready_processes:
-            future_processes = [
-                (i, p) for i, p in indexed_processes if p["pid"] not in completed
-            ]
-            if future_processes:
-                next_arrival = min(p["arrival_time"] for i, p in future_processes)
-                current_time = next_arrival
-                continue
+    workload = as_workload(processes)
+    arrivals, bursts, order = workload.columns()
 
-        selected = min(ready_processes, key=lambda x: (x[1]["burst_time"], x[0]))
-        index, process = selected
-        pid = process["pid"]
-        arrival = process["arrival_time"]
-        burst = process["burst_time"]
-
-        start_time = max(current_time, arrival)
-        end_time = start_time + burst
-        schedule.append({"process": pid, "start": start_time, "end": end_time})
-        waiting_times[pid] = start_time - arrival
-        completed.add(pid)
-        current_time = end_time
+    schedule = Schedule(workload.pids)
+    simulate_non_preemptive(schedule, arrivals, bursts, order, lambda i: (bursts[i], i))
+    waiting_times = execution_order_waiting_times(schedule, workload)
 
     avg_waiting_time = (
         sum(waiting_times.values()) / len(waiting_times) if waiting_times else 0.0
@@ -113,6 +155,7 @@ def sjf_non_preemptive(processes):
 
     return schedule, waiting_times, avg_waiting_time
 
+
 def srtf(processes):
     """
     Modified Shortest Remaining Time First (SRTF) scheduling algorithm.
@@ -122,187 +165,205 @@ def srtf(processes):
     SRTF logic applies to all ready processes, including P1 with its reduced
     remaining time.
 
+    The simulation is event driven: the ready queue is a heap keyed on
+    (remaining_time, index) and time only advances to the next arrival or the
+    completion of the running process, whichever comes first. The resulting
+    schedule is the same as stepping one time unit at a time.
+
     Args:
-        processes (list): List of dicts, each with 'pid', 'arrival_time', 'burst_time'.
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
-    processes_copy = [
-        {
-            "pid": p["pid"],
-            "arrival_time": p["arrival_time"],
-            "burst_time": p["burst_time"],
-            "remaining_time": p["burst_time"],
-        }
-        for p in processes
-    ]
-    indexed_processes = list(enumerate(processes_copy))
-    num_processes = len(processes)
-
-    schedule = []
-    completion_times = {}
-    waiting_times = {}
+    workload = as_workload(processes)
+    pids = workload.pids
+    arrivals, bursts, order = workload.columns()
+    remaining = list(bursts)
+
+    schedule = Schedule(pids)
     current_time = 0
-    completed_count = 0
 
-    p1_process_tuple = next(
-        ((i, p) for i, p in indexed_processes if p['pid'].lower() == 'p1'), None
-    )
+    p1_index = next((i for i, pid in enumerate(pids) if pid.lower() == "p1"), None)
 
     # If P1 exists, arrived at t=0, and has work to do, run it for 1 time unit
-    if p1_process_tuple and p1_process_tuple[1]['arrival_time'] == 0 and p1_process_tuple[1]['burst_time'] > 0:
-        index, p1_process = p1_process_tuple
-        
-        schedule.append({"process": "p1", "start": 0, "end": 1})
-        
-        p1_process["remaining_time"] -= 1
+    if p1_index is not None and arrivals[p1_index] == 0 and remaining[p1_index] > 0:
+        schedule.append(p1_index, 0, 1)
+
+        remaining[p1_index] -= 1
         current_time = 1
-        
-        if p1_process["remaining_time"] == 0:
-            completion_times["p1"] = current_time
-            completed_count += 1
 
-    while completed_count < num_processes:
-        ready_queue = [
-            (i, p)
-            for i, p in indexed_processes
-            if p["arrival_time"] <= current_time and p["remaining_time"] > 0
-        ]
+    # Processes without any work never enter the queue.
+    simulate_srtf(schedule, arrivals, remaining, order, (current_time, 0, []))
+
+    metrics = compute_metrics(schedule, workload)
+    return schedule, metrics.as_dict("waiting_time"), metrics.avg_waiting_time
+
+
+def simulate_srtf(schedule, arrivals, remaining, order, state=None, checkpoint=None, every=0):
+    """
+    Event loop of SRTF, without P1's first time unit. See
+    simulate_non_preemptive for the arguments.
+
+    Args:
+        remaining (list): Remaining time per row, updated as processes run.
+        state (tuple, optional): (current_time, cursor, ready_queue), the
+            ready queue being a heap list of (remaining_time, row).
+    """
+    current_time, cursor, ready_queue = state or (0, 0, [])
+    num_processes = len(order)
+    countdown = 0 if checkpoint is not None else -1
+
+    while cursor < num_processes or ready_queue:
+        if countdown == 0:
+            checkpoint(current_time, cursor, tuple(ready_queue))
+            countdown = max(every, len(ready_queue))
+        countdown -= 1
+
+        # Admit everything that has arrived by now.
+        while cursor < num_processes and arrivals[order[cursor]] <= current_time:
+            i = order[cursor]
+            cursor += 1
+            if remaining[i] > 0:
+                heapq.heappush(ready_queue, (remaining[i], i))
 
         if not ready_queue:
-            current_time += 1
+            if cursor < num_processes:
+                current_time = arrivals[order[cursor]]
             continue
 
-        index, process_to_run = min(
-            ready_queue, key=lambda x: (x[1]["remaining_time"], x[0])
-        )
-        pid = process_to_run["pid"]
-
-        if schedule and schedule[-1]["process"] == pid and schedule[-1]["end"] == current_time:
-            schedule[-1]["end"] += 1
-        else:
-            schedule.append({"process": pid, "start": current_time, "end": current_time + 1})
+        _, index = heapq.heappop(ready_queue)
 
-        process_to_run["remaining_time"] -= 1
-        current_time += 1
+        # Run until completion or until the next arrival may preempt.
+        run_until = current_time + remaining[index]
+        if cursor < num_processes:
+            run_until = min(run_until, arrivals[order[cursor]])
 
-        if process_to_run["remaining_time"] == 0:
-            completion_times[pid] = current_time
-            completed_count += 1
+        schedule.append(index, current_time, run_until, merge=True)
 
-    for p in processes:
-        pid = p["pid"]
-        turnaround_time = completion_times[pid] - p["arrival_time"]
-        waiting_times[pid] = turnaround_time - p["burst_time"]
+        remaining[index] -= run_until - current_time
+        current_time = run_until
 
-    avg_waiting_time = (
-        sum(waiting_times.values()) / num_processes if num_processes > 0 else 0.0
-    )
+        if remaining[index] != 0:
+            heapq.heappush(ready_queue, (remaining[index], index))
 
-    return schedule, waiting_times, avg_waiting_time
 
 def rr(processes, quantum):
     """
     Round Robin (RR) scheduling algorithm.
 
+    Arrivals are sorted once and admitted through a cursor into a deque, so
+    every slice costs amortised constant work. Processes arriving during a
+    slice are queued behind the process that was just preempted.
+
     Args:
-        processes (list): List of dicts, each with 'pid', 'arrival_time', 'burst_time'.
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
         quantum (int): Time quantum for RR scheduling.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
-    processes_copy = [
-        {
-            "pid": p["pid"],
-            "arrival_time": p["arrival_time"],
-            "burst_time": p["burst_time"],
-            "remaining_time": p["burst_time"],
-        }
-        for p in processes
-    ]
-    indexed_processes = [(i, p) for i, p in enumerate(processes_copy)]
-
-    schedule = []
-    waiting_times = {p["pid"]: 0 for p in processes}
-    completion_times = {p["pid"]: 0 for p in processes}
-    current_time = 0
-    queue = []
-    completed = set()
-
-    if processes_copy:
-        current_time = min(p["arrival_time"] for p in processes_copy)
-
-    while len(completed) < len(processes):
-        ready = [
-            (i, p)
-            for i, p in indexed_processes
-            if p["pid"] not in completed
-            and p["arrival_time"] <= current_time
-            and p not in [q[1] for q in queue]
-        ]
-        ready.sort(key=lambda x: (x[1]["arrival_time"], x[0]))
-        queue.extend(ready)
+    workload = as_workload(processes)
+    pids = workload.pids
+    arrivals, bursts, order = workload.columns()
+    remaining = list(bursts)
 
-        if not queue:
-            future_processes = [
-                (i, p) for i, p in indexed_processes if p["pid"] not in completed
-            ]
-            if future_processes:
-                current_time = min(p["arrival_time"] for i, p in future_processes)
-                continue
+    schedule = Schedule(pids)
+    current_time = arrivals[order[0]] if order else 0
+    simulate_rr(schedule, arrivals, remaining, order, quantum, (current_time, 0, deque()))
 
-        index, process = queue.pop(0)
-        pid = process["pid"]
-        remaining = process["remaining_time"]
+    metrics = compute_metrics(schedule, workload)
+    return schedule, metrics.as_dict("waiting_time"), metrics.avg_waiting_time
 
-        run_time = min(quantum, remaining)
-        schedule.append(
-            {"process": pid, "start": current_time, "end": current_time + run_time}
-        )
 
-        process["remaining_time"] -= run_time
-        current_time += run_time
+def simulate_rr(schedule, arrivals, remaining, order, quantum, state=None, checkpoint=None, every=0):
+    """
+    Event loop of RR. See simulate_non_preemptive for the arguments.
 
-        if process["remaining_time"] == 0:
-            completion_times[pid] = current_time
-            completed.add(pid)
-        else:
-            queue.append((index, process))
+    Args:
+        remaining (list): Remaining time per row, updated as processes run.
+        quantum (int): Time quantum.
+        state (tuple, optional): (current_time, cursor, queue), the queue being
+            a deque of rows. Checkpoints get the queue as (row, remaining_time)
+            pairs.
+    """
+    current_time, cursor, queue = state or (0, 0, deque())
+    num_processes = len(order)
+    countdown = 0 if checkpoint is not None else -1
 
-    for p in processes:
-        pid = p["pid"]
-        waiting_times[pid] = completion_times[pid] - p["arrival_time"] - p["burst_time"]
+    while cursor < num_processes or queue:
+        if countdown == 0:
+            checkpoint(current_time, cursor, tuple((i, remaining[i]) for i in queue))
+            countdown = max(every, len(queue))
+        countdown -= 1
 
-    total_waiting = sum(waiting_times.values())
-    num_processes = len(waiting_times)
-    avg_waiting_time = total_waiting / num_processes if num_processes > 0 else 0.0
+        while cursor < num_processes and arrivals[order[cursor]] <= current_time:
+            queue.append(order[cursor])
+            cursor += 1
 
-    return schedule, waiting_times, avg_waiting_time
+        if not queue:
+            current_time = arrivals[order[cursor]]
+            continue
+
+        index = queue.popleft()
+
+        run_time = min(quantum, remaining[index])
+        schedule.append(index, current_time, current_time + run_time)
 
+        remaining[index] -= run_time
+        current_time += run_time
+
+        if remaining[index] != 0:
+            queue.append(index)
 
-def run_algorithm(processes, algorithm, quantum=None):
+
+def run_algorithm(
+    processes,
+    algorithm,
+    quantum=None,
+    min_granularity=CFS_MIN_GRANULARITY,
+    target_latency=CFS_TARGET_LATENCY,
+    aging_interval=PRIORITY_AGING_INTERVAL,
+    instrument=None,
+):
     """
     Run the specified scheduling algorithm.
 
     Args:
-        processes (list): List of dicts with process details.
-        algorithm (str): 'fcfs', 'sjf', 'srtf', ljf, or 'rr'.
+        processes (list or Workload): List of dicts with process details, or a Workload.
+        algorithm (str): 'fcfs', 'sjf', 'srtf', ljf, 'rr', 'cfs' or 'priority'.
         quantum (int, optional): Time quantum for RR.
+        min_granularity (int, optional): Shortest time slice for CFS.
+        target_latency (int, optional): Period in which CFS runs every task once.
+        aging_interval (int, optional): Waiting time per priority level gained
+            under the priority scheduler; None disables aging.
+        instrument (instrumentation.Instrumentation, optional): Records
+            counters and phase timings of this call.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
+    if instrument is not None:
+        options = {}
+        if algorithm == "cfs":
+            options = {"min_granularity": min_granularity, "target_latency": target_latency}
+        elif algorithm == "priority":
+            options = {"aging_interval": aging_interval}
+        return instrument.run(processes, algorithm, quantum, **options)
+
+    processes = as_workload(processes)
+
     if algorithm == "fcfs":
         return fcfs(processes)
     elif algorithm == "sjf":
@@ -315,6 +376,10 @@ def run_algorithm(processes, algorithm, quantum=None):
         if quantum is None:
             raise ValueError("Quantum required for RR algorithm")
         return rr(processes, quantum)
+    elif algorithm == "cfs":
+        return cfs(processes, min_granularity, target_latency)
+    elif algorithm == "priority":
+        return priority(processes, aging_interval)
     else:
         raise ValueError(f"Unknown algorithm: {algorithm}")
     
@@ -323,69 +388,247 @@ def ljf_non_preemptive(processes):
     Longest Job First (LJF) Non-Preemptive scheduling algorithm.
 
     Args:
-        processes (list): List of dicts, each with 'pid', 'arrival_time', 'burst_time'.
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
 
     Returns:
         tuple: (schedule, waiting_times, avg_waiting_time)
-            - schedule: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            - schedule: Schedule of (process, start, end) segments
             - waiting_times: Dict of waiting times {'pid': int, ...}
             - avg_waiting_time: Float, average waiting time
     """
-    # Orijinal sırayı korumak için prosesleri indeksleriyle birlikte alıyoruz.
-    # Bu, burst time eşitliği durumunda FCFS uygulamamıza yardımcı olacak.
-    indexed_processes = [(i, p) for i, p in enumerate(processes)]
-    
-    schedule = []
-    waiting_times = {}
-    current_time = 0
-    completed = set()
-    num_processes = len(processes)
-
-    while len(completed) < num_processes:
-        # Mevcut zamana kadar gelmiş ve henüz tamamlanmamış prosesleri bul (hazır kuyruğu).
-        ready_processes = [
-            (i, p)
-            for i, p in indexed_processes
-            if p["pid"] not in completed and p["arrival_time"] <= current_time
-        ]
-
-        # Eğer hazırda bekleyen proses yoksa, zamanı bir sonraki prosesin geliş zamanına ilerlet.
-        if not ready_processes:
-            # Henüz tamamlanmamış tüm prosesleri bul
-            future_processes = [
-                (i, p) for i, p in indexed_processes if p["pid"] not in completed
-            ]
-            if future_processes:
-                # Bunların en erken geliş zamanına git
-                next_arrival = min(p["arrival_time"] for i, p in future_processes)
-                current_time = next_arrival
-            continue # Döngünün başına dönerek yeni hazır kuyruğunu oluştur
-
-        # Hazır prosesler arasından en uzun burst time'a sahip olanı seç.
-        # Eşitlik durumunda, daha erken gelen (arrival_time'ı küçük olan) kazanır.
-        # Eğer geliş zamanları da eşitse, orijinal listedeki sırası (indeksi) küçük olan kazanır.
-        selected = max(ready_processes, key=lambda x: (x[1]["burst_time"], -x[1]["arrival_time"], -x[0]))
-        
-        index, process = selected
-        pid = process["pid"]
-        arrival = process["arrival_time"]
-        burst = process["burst_time"]
-
-        # Prosesin başlangıç zamanı, CPU'nun boşa çıktığı zamandır.
-        start_time = current_time
-        end_time = start_time + burst
-
-        # Sonuçları kaydet
-        schedule.append({"process": pid, "start": start_time, "end": end_time})
-        waiting_times[pid] = start_time - arrival
-        completed.add(pid)
-        
-        # Zamanı ilerlet
-        current_time = end_time
+    workload = as_workload(processes)
+    arrivals, bursts, order = workload.columns()
+    num_processes = len(workload)
+
+    schedule = Schedule(workload.pids)
+    # Anahtar: en uzun burst time önce; eşitlikte daha erken gelen, geliş
+    # zamanları da eşitse orijinal listedeki sırası küçük olan kazanır.
+    simulate_non_preemptive(
+        schedule, arrivals, bursts, order, lambda i: (-bursts[i], arrivals[i], i)
+    )
+    waiting_times = execution_order_waiting_times(schedule, workload)
 
     # Ortalama bekleme süresini hesapla
     avg_waiting_time = (
         sum(waiting_times.values()) / num_processes if num_processes > 0 else 0.0
     )
 
-    return schedule, waiting_times, avg_waiting_time
\ No newline at end of file
+    return schedule, waiting_times, avg_waiting_time
+
+
+def cfs(processes, min_granularity=CFS_MIN_GRANULARITY, target_latency=CFS_TARGET_LATENCY):
+    """
+    Completely Fair Scheduler (CFS) style scheduling algorithm.
+
+    Every runnable process accumulates virtual runtime (vruntime) while it
+    runs, and the process with the smallest vruntime runs next. The runqueue
+    is a heap keyed on (vruntime, enqueue order), so picking the next process
+    and requeueing cost O(log n) even with 100k runnable processes; equal
+    vruntimes are served first come, first served, like the kernel's rbtree.
+
+    A process runs for a time slice of target_latency divided by the number
+    of runnable processes, but never less than min_granularity. Arrivals are
+    checked like scheduler ticks: they are placed at the runqueue's
+    min_vruntime, so they cannot starve the processes already there, and they
+    shrink the running process's slice, which is preempted if it has already
+    used up the new one. All processes have the same weight.
+
+    Args:
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time', or an equivalent Workload.
+        min_granularity (int): Shortest time slice.
+        target_latency (int): Period in which every runnable process runs once,
+            as long as the slices stay above min_granularity.
+
+    Returns:
+        tuple: (schedule, waiting_times, avg_waiting_time)
+            - schedule: Schedule of (process, start, end) segments
+            - waiting_times: Dict of waiting times {'pid': int, ...}
+            - avg_waiting_time: Float, average waiting time
+    """
+    if min_granularity <= 0 or target_latency <= 0:
+        raise ValueError("min_granularity and target_latency must be positive")
+
+    workload = as_workload(processes)
+    arrivals, bursts, order = workload.columns()
+    remaining = list(bursts)
+    num_processes = len(workload)
+
+    schedule = Schedule(workload.pids)
+    current_time = 0
+    runqueue = []
+    min_vruntime = 0
+    enqueued = 0
+    cursor = 0
+    # The running process, its vruntime and how much of its slice it used.
+    running = None
+    vruntime = 0
+    slice_used = 0
+
+    while cursor < num_processes or runqueue or running is not None:
+        # Newcomers start at the smallest vruntime of the runqueue and the
+        # running process, which only moves forward.
+        if running is not None:
+            min_vruntime = max(min_vruntime, min(vruntime, runqueue[0][0]) if runqueue else vruntime)
+        elif runqueue:
+            min_vruntime = max(min_vruntime, runqueue[0][0])
+
+        while cursor < num_processes and arrivals[order[cursor]] <= current_time:
+            i = order[cursor]
+            cursor += 1
+            if remaining[i] > 0:
+                heapq.heappush(runqueue, (min_vruntime, enqueued, i))
+                enqueued += 1
+
+        timeslice = max(min_granularity, target_latency // (len(runqueue) + 1))
+        if running is not None and slice_used >= timeslice:
+            heapq.heappush(runqueue, (vruntime, enqueued, running))
+            enqueued += 1
+            running = None
+
+        if running is None:
+            if not runqueue:
+                current_time = arrivals[order[cursor]]
+                continue
+            vruntime, _, running = heapq.heappop(runqueue)
+            slice_used = 0
+            timeslice = max(min_granularity, target_latency // (len(runqueue) + 1))
+
+        # Run to the end of the slice, completion or the next arrival.
+        run_until = current_time + min(timeslice - slice_used, remaining[running])
+        if cursor < num_processes:
+            run_until = min(run_until, arrivals[order[cursor]])
+
+        schedule.append(running, current_time, run_until, merge=True)
+
+        run_time = run_until - current_time
+        remaining[running] -= run_time
+        vruntime += run_time
+        slice_used += run_time
+        current_time = run_until
+
+        if remaining[running] == 0:
+            running = None
+
+    metrics = compute_metrics(schedule, workload)
+    return schedule, metrics.as_dict("waiting_time"), metrics.avg_waiting_time
+
+
+def priority(processes, aging_interval=PRIORITY_AGING_INTERVAL):
+    """
+    Preemptive priority scheduling with aging.
+
+    Lower priority numbers are more important; a workload without priorities
+    runs every process at priority 0, which is first come, first served. A
+    ready process preempts the running one as soon as its priority is
+    strictly better; equal priorities are served in the order they entered
+    the ready queue.
+
+    Against starvation, a process gains one priority level for every
+    ``aging_interval`` time units it waits in the ready queue, but never
+    becomes more important than the best base priority of the workload. It
+    runs at the priority it had when it was dispatched and re-enters the
+    queue at its base priority if it is preempted.
+
+    The ready queue is an IndexedHeap keyed on (priority, enqueue order), so
+    aging lowers the key of a waiting process in place (decrease-key)
+    instead of pushing a duplicate entry. Pending aging steps are kept in a
+    second heap; time only advances to the next arrival, aging step or
+    completion, whichever comes first.
+
+    Args:
+        processes (list or Workload): List of dicts, each with 'pid', 'arrival_time',
+            'burst_time' and optionally 'priority', or an equivalent Workload.
+        aging_interval (int, optional): Waiting time per priority level gained,
+            or None to disable aging.
+
+    Returns:
+        tuple: (schedule, waiting_times, avg_waiting_time)
+            - schedule: Schedule of (process, start, end) segments
+            - waiting_times: Dict of waiting times {'pid': int, ...}
+            - avg_waiting_time: Float, average waiting time
+    """
+    if aging_interval is not None and aging_interval <= 0:
+        raise ValueError("aging_interval must be positive")
+
+    workload = as_workload(processes)
+    arrivals, bursts, order = workload.columns()
+    remaining = list(bursts)
+    num_processes = len(workload)
+    if workload.priority is not None:
+        priorities = workload.priority.tolist()
+    else:
+        priorities = [0] * num_processes
+    floor = min(priorities, default=0)
+
+    schedule = Schedule(workload.pids)
+    ready = IndexedHeap(num_processes)
+    # (time, process, generation) of the next aging step of each queued
+    # process; steps whose generation is outdated are skipped.
+    aging = []
+    generation = [0] * num_processes
+    enqueued = 0
+
+    def enqueue(i, now):
+        nonlocal enqueued
+        ready.push(i, (priorities[i], enqueued))
+        enqueued += 1
+        generation[i] += 1
+        if aging_interval is not None and priorities[i] > floor:
+            heapq.heappush(aging, (now + aging_interval, i, generation[i]))
+
+    # Processes without any work complete on arrival and never enter the queue.
+    completed_count = sum(1 for r in remaining if r <= 0)
+    current_time = 0
+    cursor = 0
+    running = None
+    running_priority = 0
+
+    while completed_count < num_processes:
+        while cursor < num_processes and arrivals[order[cursor]] <= current_time:
+            i = order[cursor]
+            cursor += 1
+            if remaining[i] > 0:
+                enqueue(i, current_time)
+
+        while aging and aging[0][0] <= current_time:
+            time, i, step = heapq.heappop(aging)
+            if step != generation[i]:
+                continue
+            level, seq = ready.key(i)
+            ready.decrease_key(i, (level - 1, seq))
+            if level - 1 > floor:
+                heapq.heappush(aging, (time + aging_interval, i, step))
+
+        if running is None:
+            if not ready:
+                current_time = arrivals[order[cursor]]
+                continue
+            running, (running_priority, _) = ready.pop()
+            generation[running] += 1
+        elif ready and ready.peek()[1][0] < running_priority:
+            enqueue(running, current_time)
+            running, (running_priority, _) = ready.pop()
+            generation[running] += 1
+
+        # Run until completion, the next arrival or the next aging step.
+        run_until = current_time + remaining[running]
+        if cursor < num_processes:
+            run_until = min(run_until, arrivals[order[cursor]])
+        while aging and aging[0][2] != generation[aging[0][1]]:
+            heapq.heappop(aging)
+        if aging:
+            run_until = min(run_until, aging[0][0])
+
+        schedule.append(running, current_time, run_until, merge=True)
+
+        remaining[running] -= run_until - current_time
+        current_time = run_until
+
+        if remaining[running] == 0:
+            completed_count += 1
+            running = None
+
+    metrics = compute_metrics(schedule, workload)
+    return schedule, metrics.as_dict("waiting_time"), metrics.avg_waiting_time
@@ -0,0 +1,256 @@
+"""
+Scaling benchmarks for the scheduling algorithms.
+
+Run the suite and save the results:
+
+    python3 src/benchmark.py run --out bench.json
+
+Compare a new run against a saved baseline (exit status 1 on regressions):
+
+    python3 src/benchmark.py compare baseline.json bench.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from algorithms import run_algorithm
+from workload import Workload
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_ALGORITHMS = ["fcfs", "sjf", "srtf", "ljf", "rr", "cfs", "priority"]
+DEFAULT_QUANTA = [2, 8]
+
+# Mean inter-arrival gap per process, relative to the mean burst.
+ARRIVAL_DENSITIES = {
+    "batch": 0.0,  # everything arrives at t=0
+    "saturated": 0.5,  # arrivals faster than the CPU drains them
+    "light": 2.0,  # mostly idle CPU
+}
+MEAN_BURST = 10
+# Priorities are drawn uniformly from 0 .. PRIORITY_LEVELS - 1.
+PRIORITY_LEVELS = 8
+
+
+def make_workload(n, arrival="saturated", burst="exponential", seed=0):
+    """
+    Generate a seeded synthetic workload.
+
+    Args:
+        n (int): Number of processes.
+        arrival (str): One of ARRIVAL_DENSITIES.
+        burst (str): 'uniform' or 'exponential' burst-time distribution.
+        seed (int or list): Random seed, anything numpy.random.default_rng accepts.
+
+    Returns:
+        Workload: Processes 'p1'..'pn' with positive integer bursts and
+            priorities.
+    """
+    rng = np.random.default_rng(seed)
+    if burst == "uniform":
+        bursts = rng.integers(1, 2 * MEAN_BURST, size=n, endpoint=True)
+    elif burst == "exponential":
+        bursts = np.ceil(rng.exponential(MEAN_BURST, size=n)).astype(np.int64)
+        bursts = np.maximum(bursts, 1)
+    else:
+        raise ValueError(f"Unknown burst distribution: {burst}")
+
+    gap = ARRIVAL_DENSITIES[arrival] * MEAN_BURST
+    if gap:
+        arrivals = np.cumsum(np.floor(rng.exponential(gap, size=n))).astype(np.int64)
+    else:
+        arrivals = np.zeros(n, dtype=np.int64)
+    # Drawn last so the other columns stay what they were for a given seed.
+    priority = rng.integers(0, PRIORITY_LEVELS, size=n)
+
+    return Workload([f"p{i + 1}" for i in range(n)], arrivals, bursts, priority)
+
+
+def measure(workload, algorithm, quantum=None, repeat=1):
+    """
+    Time one algorithm on one workload and record its peak traced memory.
+
+    Wall time is the best of ``repeat`` untraced runs; peak memory comes from
+    a separate run under tracemalloc so tracing does not skew the timing.
+
+    Returns:
+        dict: {'wall_time': float, 'peak_memory': int, 'segments': int}
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        schedule, _, _ = run_algorithm(workload, algorithm, quantum)
+        best = min(best, time.perf_counter() - start)
+        segments = len(schedule)
+        del schedule
+
+    tracemalloc.start()
+    try:
+        run_algorithm(workload, algorithm, quantum)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time": best, "peak_memory": peak, "segments": segments}
+
+
+def run_suite(
+    sizes=DEFAULT_SIZES,
+    algorithms=DEFAULT_ALGORITHMS,
+    quanta=DEFAULT_QUANTA,
+    arrivals=tuple(ARRIVAL_DENSITIES),
+    bursts=("uniform", "exponential"),
+    seed=0,
+    repeat=1,
+    log=None,
+):
+    """
+    Run every (size, arrival, burst, algorithm, quantum) combination.
+
+    Returns:
+        dict: {'meta': {...}, 'results': [{...}, ...]} ready for json.dump.
+    """
+    results = []
+    for n in sizes:
+        for arrival in arrivals:
+            for burst in bursts:
+                workload = make_workload(n, arrival, burst, seed)
+                for algorithm in algorithms:
+                    for quantum in quanta if algorithm == "rr" else [None]:
+                        record = {
+                            "algorithm": algorithm,
+                            "quantum": quantum,
+                            "n": n,
+                            "arrival": arrival,
+                            "burst": burst,
+                        }
+                        record.update(measure(workload, algorithm, quantum, repeat))
+                        results.append(record)
+                        if log:
+                            log(record)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _key(record):
+    return (
+        record["algorithm"],
+        record["quantum"],
+        record["n"],
+        record["arrival"],
+        record["burst"],
+    )
+
+
+def compare(baseline, current, threshold=0.2, min_time=0.01):
+    """
+    Find results that got slower or hungrier than the baseline.
+
+    Args:
+        baseline (dict): Output of run_suite for the reference version.
+        current (dict): Output of run_suite for the version under test.
+        threshold (float): Allowed relative increase, e.g. 0.2 for +20%.
+        min_time (float): Timings below this many seconds on both sides are
+            too noisy to compare and are skipped.
+
+    Returns:
+        list: One dict per regression with the key, metric, old and new value.
+    """
+    reference = {_key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        old = reference.get(_key(record))
+        if old is None:
+            continue
+        for metric in ("wall_time", "peak_memory"):
+            if metric == "wall_time" and max(old[metric], record[metric]) < min_time:
+                continue
+            if record[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    {
+                        "key": _key(record),
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": record[metric],
+                    }
+                )
+    return regressions
+
+
+def _print_record(record):
+    quantum = f" q={record['quantum']}" if record["quantum"] is not None else ""
+    print(
+        f"{record['algorithm']:>8}{quantum:<6} n={record['n']:<8} "
+        f"{record['arrival']:<9} {record['burst']:<11} "
+        f"{record['wall_time']:9.4f}s {record['peak_memory'] / 2**20:9.1f}MiB "
+        f"{record['segments']:>10} segments"
+    )
+
+
+def _int_list(text):
+    return [int(x) for x in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark suite")
+    run.add_argument("--out", default="bench.json", help="output JSON file")
+    run.add_argument("--sizes", type=_int_list, default=DEFAULT_SIZES)
+    run.add_argument("--algorithms", type=lambda s: s.split(","), default=DEFAULT_ALGORITHMS)
+    run.add_argument("--quanta", type=_int_list, default=DEFAULT_QUANTA)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=1)
+
+    cmp = commands.add_parser("compare", help="compare results against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.2)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_suite(
+            sizes=args.sizes,
+            algorithms=args.algorithms,
+            quanta=args.quanta,
+            seed=args.seed,
+            repeat=args.repeat,
+            log=_print_record,
+        )
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {len(report['results'])} results to {args.out}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(
+            f"REGRESSION {r['key']} {r['metric']}: "
+            f"{r['baseline']:.6g} -> {r['current']:.6g}"
+        )
+    print(f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
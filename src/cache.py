@@ -0,0 +1,246 @@
+"""
+Content-addressed cache for scheduling results.
+
+Results of run_algorithm are stored under a hash of the workload's contents
+plus the algorithm and quantum, so the same workload is recognised whether it
+comes from a list of dicts, a CSV trace or a binary file:
+
+    cache = ResultCache(max_bytes=512 * 2**20, directory=".schedule-cache")
+    schedule, waiting_times, avg_waiting_time = cache.run(processes, "rr", 4)
+    print(cache.stats())
+
+Recently used results are kept in memory up to ``max_bytes``. With a
+directory, every result is also pickled to disk and survives restarts.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+
+from algorithms import run_algorithm
+from workload import as_workload
+
+# Bump when the algorithms change their output, so stale disk entries are ignored.
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Rough per-entry cost of a waiting_times dict item: the key string, the int
+# value and the hash table slot.
+_DICT_ITEM_BYTES = 100
+
+
+def workload_key(processes):
+    """
+    Stable hash of a workload's rows.
+
+    Args:
+        processes (list or Workload): The workload.
+
+    Returns:
+        str: Hex digest that only depends on the pids, arrival and burst times,
+        the priorities if there are any, and their order.
+    """
+    workload = as_workload(processes)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(len(workload).to_bytes(8, "little"))
+    digest.update(workload.arrival_time.astype("<i8", copy=False).tobytes())
+    digest.update(workload.burst_time.astype("<i8", copy=False).tobytes())
+    digest.update("\0".join(map(str, workload.pids)).encode("utf-8"))
+    if workload.priority is not None:
+        digest.update(b"\0priority")
+        digest.update(workload.priority.astype("<i8", copy=False).tobytes())
+    return digest.hexdigest()
+
+
+def result_key(processes, algorithm, quantum=None, **options):
+    """
+    Cache key of one run_algorithm call. The quantum only counts for RR;
+    ``options`` are any further run_algorithm keyword arguments.
+
+    Returns:
+        str: Hex digest.
+    """
+    quantum = quantum if algorithm == "rr" else None
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{CACHE_VERSION}:{algorithm}:{quantum}:".encode("utf-8"))
+    if options:
+        digest.update(repr(sorted(options.items())).encode("utf-8"))
+    digest.update(workload_key(processes).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _result_size(result):
+    schedule, waiting_times, _ = result
+    return schedule.nbytes + sys.getsizeof(waiting_times) + _DICT_ITEM_BYTES * len(waiting_times)
+
+
+class ResultCache:
+    """
+    LRU cache of run_algorithm results, bounded by an estimate of their size.
+
+    Cached schedules are shared between callers and must not be appended to;
+    the waiting_times dict is copied on every hit.
+
+    Args:
+        max_bytes (int): Memory budget for cached results.
+        directory (str, optional): Directory for the persistent store.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def run(self, processes, algorithm, quantum=None, compute=run_algorithm, **options):
+        """
+        Cached equivalent of algorithms.run_algorithm.
+
+        Args:
+            processes (list or Workload): The workload.
+            algorithm (str): 'fcfs', 'sjf', 'srtf', 'ljf', 'rr', 'cfs', or 'priority'.
+            quantum (int, optional): Time quantum for RR.
+            compute (callable): Called like run_algorithm on a miss.
+            **options: Further keyword arguments for ``compute``.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time)
+        """
+        workload = as_workload(processes)
+        key = result_key(workload, algorithm, quantum, **options)
+        result = self.get(key)
+        if result is None:
+            result = compute(workload, algorithm, quantum, **options)
+            self.put(key, result)
+        schedule, waiting_times, avg_waiting_time = result
+        return schedule, dict(waiting_times), avg_waiting_time
+
+    def get(self, key):
+        """
+        Look up a result by key, falling back to the disk store.
+
+        Returns:
+            tuple or None: The cached result, or None on a miss.
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result[0]
+
+        result = self._load(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, result)
+        return result
+
+    def put(self, key, result):
+        """
+        Store a result in memory and, if configured, on disk.
+        """
+        self._remember(key, result)
+        if self.directory is not None:
+            self._save(key, result)
+
+    def _remember(self, key, result):
+        size = _result_size(result)
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        # Results larger than the whole budget are only kept on disk.
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (result, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # A corrupt entry is treated as a miss and overwritten later.
+            return None
+
+    def _save(self, key, result):
+        # Write to a temporary file first so readers never see a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def clear(self, disk=False):
+        """
+        Drop every in-memory entry, and the disk store too if ``disk`` is set.
+        """
+        self._entries.clear()
+        self._bytes = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.unlink(os.path.join(self.directory, name))
+
+    def stats(self):
+        """
+        Returns:
+            dict: Hit/miss counters, evictions, entry count and memory use.
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ResultCache(entries={len(self)}, bytes={self._bytes})"
+
+
+_default_cache = None
+
+
+def cached_run_algorithm(processes, algorithm, quantum=None, compute=run_algorithm, **options):
+    """
+    run_algorithm through a process-wide in-memory ResultCache. See
+    ResultCache.run for the arguments; ``options`` are part of the cache key
+    and are passed on to ``compute``.
+
+    Returns:
+        tuple: (schedule, waiting_times, avg_waiting_time)
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache.run(processes, algorithm, quantum, compute, **options)
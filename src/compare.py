@@ -0,0 +1,70 @@
+"""
+Side-by-side comparison of scheduling algorithms on one workload.
+
+The workload is converted, sorted by arrival and turned into the algorithms'
+list columns once (see workload.PreparedWorkload); every algorithm then runs
+against that shared precomputation:
+
+    python3 src/compare.py trace.csv --algorithms fcfs,sjf,srtf,rr,cfs --quantum 4
+    python3 src/compare.py trace.psw --output comparison.png
+"""
+
+import argparse
+import sys
+
+from algorithms import run_algorithm
+from metrics import compute_metrics
+from sweep import ALGORITHMS, format_table
+from workload import prepare
+
+
+def compare(processes, algorithms=ALGORITHMS, quantum=2):
+    """
+    Run several algorithms on the same workload.
+
+    Args:
+        processes (list or Workload): The workload.
+        algorithms (list): Algorithm names accepted by run_algorithm.
+        quantum (int): Time quantum used for 'rr'.
+
+    Returns:
+        tuple: (rows, schedules)
+            - rows: One dict per algorithm with 'algorithm', 'quantum',
+              'awt', 'ata', 'art' and 'segments', as in sweep.sweep
+            - schedules: Dict {algorithm: Schedule}
+    """
+    workload = prepare(processes)
+    rows = []
+    schedules = {}
+    for algorithm in algorithms:
+        algorithm_quantum = quantum if algorithm == "rr" else None
+        schedule, _, _ = run_algorithm(workload, algorithm, algorithm_quantum)
+        row = {"algorithm": algorithm, "quantum": algorithm_quantum}
+        row.update(compute_metrics(schedule, workload).averages())
+        row["segments"] = len(schedule)
+        rows.append(row)
+        schedules[algorithm] = schedule
+    return rows, schedules
+
+
+def main(argv=None):
+    from traces import load_workload
+
+    parser = argparse.ArgumentParser(description="Compare algorithms on one workload.")
+    parser.add_argument("workload", help="workload file (.psw, .csv or .json)")
+    parser.add_argument("--algorithms", type=lambda s: s.split(","), default=ALGORITHMS)
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="time quantum for RR")
+    parser.add_argument("-o", "--output", help="save a stacked Gantt chart to this file")
+    args = parser.parse_args(argv)
+
+    rows, schedules = compare(load_workload(args.workload), args.algorithms, args.quantum)
+    print(format_table(rows))
+    if args.output:
+        from visualizer import save_comparison
+
+        save_comparison(rows, schedules, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
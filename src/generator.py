@@ -0,0 +1,294 @@
+"""
+Seeded synthetic workloads with realistic arrival and burst distributions.
+
+Every column is drawn with NumPy in chunks, so tens of millions of processes
+take seconds and a workload file can be written without ever holding the
+whole workload in memory:
+
+    python3 src/generator.py big.psw -n 50000000 --arrival bursty --burst pareto
+    python3 src/generator.py small.psw -n 1000 --burst lognormal --priorities 8
+
+Arrivals:
+    poisson      exponential gaps, i.e. a Poisson process
+    bursty       Poisson bursts of on average ``burstiness`` processes that
+                 arrive close together, with the same long-run rate
+    batch        everything arrives at t=0
+
+Bursts (all rounded up to positive integers with mean about ``mean_burst``):
+    exponential  memoryless
+    lognormal    heavy right tail, ``sigma`` is the log standard deviation
+    pareto       power-law tail with index ``shape`` (> 1)
+    uniform      integers 1 .. 2 * mean_burst - 1
+
+The arrival rate follows from ``load``, the CPU utilisation the workload
+would cause: the mean gap between arrivals is mean_burst / load.
+
+Each column comes from its own random stream, so a seed gives the same
+workload whatever the chunk size.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from traces import BinaryWriter, PidTable, concat_workloads
+from workload import Workload
+
+ARRIVALS = ("poisson", "bursty", "batch")
+BURSTS = ("exponential", "lognormal", "pareto", "uniform")
+DEFAULT_MEAN_BURST = 10
+DEFAULT_LOAD = 0.9
+DEFAULT_BURSTINESS = 10
+DEFAULT_SIGMA = 1.0
+DEFAULT_PARETO_SHAPE = 2.5
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+# ASCII digits of i % 1000 for i = 0..999 as 1-, 2- and 3-byte records, so one
+# array operation converts up to three digits of every pid.
+_DIGITS = {
+    take: np.ascontiguousarray(
+        np.array([list(f"{i:03d}".encode()) for i in range(1000)], dtype=np.uint8)[:, 3 - take :]
+    )
+    .view(f"V{take}")
+    .ravel()
+    for take in (1, 2, 3)
+}
+
+
+def _pid_bytes(first, count):
+    # Fixed-width b"p<n>" pids for n = first .. first + count - 1, built on
+    # whole arrays instead of formatting one string per process. The numbers
+    # are consecutive, so those with the same number of digits form a slice.
+    last = first + count - 1
+    width = len(str(last)) if count else 1
+    raw = np.zeros((count, width + 1), dtype=np.uint8)
+    raw[:, 0] = ord("p")
+    for digits in range(len(str(first)), width + 1):
+        low = max(first, 10 ** (digits - 1)) - first
+        high = min(last + 1, 10**digits) - first
+        numbers = np.arange(first + low, first + high, dtype=np.int64)
+        end = digits + 1
+        while end > 1:
+            take = min(3, end - 1)
+            target = raw[low:high, end - take : end].view(f"V{take}")
+            target[:, 0] = _DIGITS[take][numbers % 10**take]
+            numbers //= 1000
+            end -= take
+    return raw.view(f"S{width + 1}").ravel()
+
+
+class WorkloadGenerator:
+    """
+    Draws workloads of any size from one seeded set of distributions.
+
+    Args:
+        arrival (str): One of ARRIVALS.
+        burst (str): One of BURSTS.
+        mean_burst (float): Mean burst time.
+        load (float): Offered CPU load; the mean gap between arrivals is
+            mean_burst / load.
+        seed (int, optional): Random seed; None draws a fresh one.
+        priorities (int, optional): If set, priorities are drawn uniformly
+            from 0 .. priorities - 1.
+        burstiness (float): Mean number of processes per burst for 'bursty'.
+        sigma (float): Log standard deviation for 'lognormal'.
+        shape (float): Tail index for 'pareto'.
+    """
+
+    def __init__(
+        self,
+        arrival="poisson",
+        burst="exponential",
+        mean_burst=DEFAULT_MEAN_BURST,
+        load=DEFAULT_LOAD,
+        seed=None,
+        priorities=None,
+        burstiness=DEFAULT_BURSTINESS,
+        sigma=DEFAULT_SIGMA,
+        shape=DEFAULT_PARETO_SHAPE,
+    ):
+        if arrival not in ARRIVALS:
+            raise ValueError(f"Unknown arrival distribution: {arrival}")
+        if burst not in BURSTS:
+            raise ValueError(f"Unknown burst distribution: {burst}")
+        if mean_burst < 1:
+            raise ValueError("mean_burst must be at least 1")
+        if load <= 0:
+            raise ValueError("load must be positive")
+        if burstiness < 1:
+            raise ValueError("burstiness must be at least 1")
+        if burst == "pareto" and shape <= 1:
+            raise ValueError("The Pareto shape must be greater than 1 for a finite mean")
+        if priorities is not None and priorities < 1:
+            raise ValueError("priorities must be positive")
+        self.arrival = arrival
+        self.burst = burst
+        self.mean_burst = mean_burst
+        self.mean_gap = mean_burst / load
+        self.seed = seed
+        self.priorities = priorities
+        self.burstiness = burstiness
+        self.sigma = sigma
+        self.shape = shape
+
+    def chunks(self, n, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Generate ``n`` processes as consecutive chunks.
+
+        Args:
+            n (int): Number of processes.
+            chunk_size (int): Maximum processes per chunk.
+
+        Yields:
+            Workload: Chunks of processes 'p1'..'pn' in arrival order. The
+            pids are a traces.PidTable.
+        """
+        arrival_rng, start_rng, burst_rng, priority_rng = (
+            np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(4)
+        )
+        clock = 0.0
+        for first in range(0, n, chunk_size):
+            count = min(chunk_size, n - first)
+            times = self._arrivals(arrival_rng, start_rng, count, clock)
+            if count:
+                clock = times[-1]
+            priority = None
+            if self.priorities is not None:
+                priority = priority_rng.integers(0, self.priorities, size=count)
+            yield Workload(
+                PidTable(_pid_bytes(first + 1, count)),
+                np.floor(times).astype(np.int64),
+                self._bursts(burst_rng, count),
+                priority,
+            )
+
+    def generate(self, n):
+        """
+        Returns:
+            Workload: ``n`` processes in one workload.
+        """
+        chunks = list(self.chunks(n, max(n, 1)))
+        return chunks[0] if len(chunks) == 1 else concat_workloads(chunks)
+
+    def write(self, path, n, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream ``n`` processes into a binary workload file (see traces.py)
+        one chunk at a time.
+
+        Returns:
+            int: Number of processes written.
+        """
+        with BinaryWriter(path, pid_width=len(str(max(n, 1))) + 1) as writer:
+            for chunk in self.chunks(n, chunk_size):
+                writer.write(chunk)
+        return writer.count
+
+    def _arrivals(self, rng, start_rng, count, clock):
+        if self.arrival == "batch":
+            return np.zeros(count)
+        gaps = np.empty(count + 1)
+        gaps[0] = clock
+        if self.arrival == "poisson":
+            gaps[1:] = rng.exponential(self.mean_gap, size=count)
+        else:
+            # A new burst starts with probability 1 / burstiness. Gaps inside
+            # a burst are burstiness times shorter than the mean gap, and the
+            # gaps between bursts are long enough to keep the mean gap.
+            b = self.burstiness
+            inside = self.mean_gap / b
+            between = self.mean_gap * b - (b - 1) * inside
+            starts = start_rng.random(count) < 1 / b
+            gaps[1:] = rng.exponential(1.0, size=count) * np.where(starts, between, inside)
+        # Summing on from the previous chunk's clock adds in the same order
+        # as one cumsum over the whole workload would.
+        return np.cumsum(gaps, out=gaps)[1:]
+
+    def _bursts(self, rng, count):
+        mean = self.mean_burst
+        if self.burst == "exponential":
+            values = rng.exponential(mean, size=count)
+        elif self.burst == "lognormal":
+            values = rng.lognormal(np.log(mean) - self.sigma**2 / 2, self.sigma, size=count)
+        elif self.burst == "pareto":
+            scale = mean * (self.shape - 1) / self.shape
+            values = (rng.pareto(self.shape, size=count) + 1) * scale
+        else:
+            return rng.integers(1, max(2 * round(mean) - 1, 1), size=count, endpoint=True)
+        # Rounding up keeps every burst positive; the mean grows by under one.
+        return np.maximum(np.ceil(values), 1).astype(np.int64)
+
+
+def generate_workload(n, arrival="poisson", burst="exponential", seed=None, **options):
+    """
+    Generate ``n`` processes in memory. See WorkloadGenerator for the options.
+
+    Returns:
+        Workload: The generated workload.
+    """
+    return WorkloadGenerator(arrival, burst, seed=seed, **options).generate(n)
+
+
+def write_workload(path, n, arrival="poisson", burst="exponential", seed=None, **options):
+    """
+    Stream ``n`` generated processes into a binary workload file.
+
+    Returns:
+        int: Number of processes written.
+    """
+    return WorkloadGenerator(arrival, burst, seed=seed, **options).write(path, n)
+
+
+def add_arguments(parser):
+    """
+    Add the generator's distribution options to an argparse parser.
+    """
+    parser.add_argument("--arrival", choices=ARRIVALS, default="poisson", help="arrival process")
+    parser.add_argument("--burst", choices=BURSTS, default="exponential", help="burst distribution")
+    parser.add_argument("--mean-burst", type=float, default=DEFAULT_MEAN_BURST)
+    parser.add_argument("--load", type=float, default=DEFAULT_LOAD, help="offered CPU load")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--priorities", type=int, help="draw priorities 0..N-1")
+    parser.add_argument("--burstiness", type=float, default=DEFAULT_BURSTINESS)
+    parser.add_argument("--sigma", type=float, default=DEFAULT_SIGMA)
+    parser.add_argument("--shape", type=float, default=DEFAULT_PARETO_SHAPE, help="Pareto tail index")
+
+
+def from_arguments(args):
+    """
+    Returns:
+        WorkloadGenerator: The generator described by the options of add_arguments.
+    """
+    return WorkloadGenerator(
+        args.arrival,
+        args.burst,
+        mean_burst=args.mean_burst,
+        load=args.load,
+        seed=args.seed,
+        priorities=args.priorities,
+        burstiness=args.burstiness,
+        sigma=args.sigma,
+        shape=args.shape,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic workload file.")
+    parser.add_argument("output", help="binary workload file to write (.psw)")
+    parser.add_argument("-n", "--processes", type=int, required=True)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        generator = from_arguments(args)
+    except ValueError as e:
+        parser.error(str(e))
+    count = generator.write(args.output, args.processes, args.chunk_size)
+    print(f"Wrote {count} processes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
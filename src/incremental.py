@@ -0,0 +1,364 @@
+"""
+Incremental re-simulation after editing process arrival or burst times.
+
+IncrementalSimulator runs the event loops of algorithms.py (fcfs_times,
+simulate_non_preemptive, simulate_srtf and simulate_rr) while recording
+checkpoints of the simulation state (current time, arrival cursor,
+ready queue and the remaining times in it) at event boundaries. When a
+process is edited, the simulation resumes from the last checkpoint that the
+edit cannot have influenced and the new suffix is spliced onto the unchanged
+prefix of the previous schedule:
+
+    sim = IncrementalSimulator(processes, "srtf")
+    schedule, waiting_times, avg_waiting_time = sim.run()
+    schedule, waiting_times, avg_waiting_time = sim.update(4321, burst_time=7)
+
+The results are identical to run_algorithm on the edited workload.
+"""
+
+import bisect
+from collections import deque, namedtuple
+
+import numpy as np
+
+from algorithms import (
+    execution_order_waiting_times,
+    fcfs_times,
+    simulate_non_preemptive,
+    simulate_rr,
+    simulate_srtf,
+)
+from metrics import compute_metrics
+from schedule import Schedule
+from workload import Workload, as_workload
+
+DEFAULT_CHECKPOINT_EVERY = 1024
+ALGORITHMS = ("fcfs", "sjf", "srtf", "ljf", "rr")
+
+# State at the top of the event loop, before admitting arrivals at ``time``.
+# ``queue`` is a copy of the ready queue; for SRTF and RR its entries carry the
+# remaining times. ``segments`` and ``last_end`` locate the schedule prefix;
+# the last segment's end is kept because SRTF may extend it later.
+Checkpoint = namedtuple(
+    "Checkpoint", ["time", "cursor", "segments", "last_end", "queue"]
+)
+
+
+class IncrementalSimulator:
+    """
+    Checkpointed simulation of one workload under one algorithm.
+
+    Args:
+        processes (list or Workload): The workload. It is copied, so later
+            edits do not touch the caller's data.
+        algorithm (str): 'fcfs', 'sjf', 'srtf', 'ljf', or 'rr'.
+        quantum (int, optional): Time quantum for RR.
+        checkpoint_every (int): Minimum loop iterations between checkpoints.
+            Smaller values resume closer to an edit at the cost of more
+            memory. The gap also grows with the ready queue, so copying the
+            queue costs amortised constant time per iteration.
+    """
+
+    def __init__(self, processes, algorithm, quantum=None, checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if algorithm == "rr" and quantum is None:
+            raise ValueError("Quantum required for RR algorithm")
+
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.checkpoint_every = checkpoint_every
+        self._load(processes)
+
+    def _load(self, processes):
+        workload = as_workload(processes)
+        self.workload = Workload(
+            list(workload.pids),
+            np.array(workload.arrival_time),
+            np.array(workload.burst_time),
+        )
+        self.pids = self.workload.pids
+        self.p1_index = next(
+            (i for i, pid in enumerate(self.pids) if str(pid).lower() == "p1"), None
+        )
+        self.schedule = None
+        self.checkpoints = []
+        self.resumed_from = None
+
+    def run(self):
+        """
+        Simulate the whole workload from t=0 and record checkpoints.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time)
+        """
+        self.checkpoints = []
+        self.resumed_from = None
+        self._order = self.workload.arrival_order()
+        self._arrivals = self.workload.arrival_time.tolist()
+        self._bursts = self.workload.burst_time.tolist()
+        self.schedule = self._resume(None)
+        return self._result()
+
+    def update(self, row, arrival_time=None, burst_time=None):
+        """
+        Change one process and re-simulate from the nearest usable checkpoint.
+
+        Args:
+            row (int): Workload row of the process.
+            arrival_time (int, optional): New arrival time.
+            burst_time (int, optional): New burst time.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time) for the edited workload.
+        """
+        arrivals = self.workload.arrival_time
+        bursts = self.workload.burst_time
+        return self.update_rows(
+            [row],
+            [arrivals[row] if arrival_time is None else arrival_time],
+            [bursts[row] if burst_time is None else burst_time],
+        )
+
+    def update_rows(self, rows, arrival_time, burst_time):
+        """
+        Change several processes at once and re-simulate a single time.
+
+        Args:
+            rows (array-like): Workload rows to change.
+            arrival_time (array-like): New arrival time of each row.
+            burst_time (array-like): New burst time of each row.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time) for the edited workload.
+        """
+        if self.schedule is None:
+            self.run()
+
+        rows = np.asarray(rows, dtype=np.int64)
+        old_arrivals = self.workload.arrival_time[rows]
+        old_position = np.empty(len(self.workload), dtype=np.int64)
+        old_position[self._order] = np.arange(len(self.workload))
+
+        self.workload.arrival_time[rows] = arrival_time
+        self.workload.burst_time[rows] = burst_time
+        for i, arrival, burst in zip(
+            rows.tolist(),
+            self.workload.arrival_time[rows].tolist(),
+            self.workload.burst_time[rows].tolist(),
+        ):
+            self._arrivals[i] = arrival
+            self._bursts[i] = burst
+
+        self._order = self.workload.arrival_order()
+        new_position = np.empty(len(self.workload), dtype=np.int64)
+        new_position[self._order] = np.arange(len(self.workload))
+
+        if not len(rows):
+            return self._result()
+
+        # Nothing before the earlier of the old and new arrival (and order
+        # position) of any edited process can have been affected.
+        earliest_time = int(min(old_arrivals.min(), self.workload.arrival_time[rows].min()))
+        earliest_position = int(min(old_position[rows].min(), new_position[rows].min()))
+
+        if self.algorithm == "fcfs":
+            checkpoint = self._fcfs_checkpoint(earliest_position)
+        elif self.algorithm == "srtf" and self.p1_index in rows.tolist():
+            # P1's special first time unit depends on its own arrival and burst.
+            checkpoint = None
+            self.checkpoints = []
+        else:
+            checkpoint = self._pop_checkpoint(earliest_time, earliest_position)
+
+        self.resumed_from = checkpoint
+        self.schedule = self._resume(checkpoint)
+        return self._result()
+
+    def _pop_checkpoint(self, time, position):
+        # Find the last checkpoint taken before ``time`` and before
+        # ``position`` was admitted, and drop it and everything after it; the
+        # resumed run records them again. A checkpoint at exactly ``time`` is
+        # not safe: zero-length segments give several loop iterations at the
+        # same time, and an earlier one may already have admitted the process.
+        checkpoints = self.checkpoints
+        i = bisect.bisect_left([c.time for c in checkpoints], time)
+        while i > 0 and checkpoints[i - 1].cursor > position:
+            i -= 1
+        if i == 0:
+            self.checkpoints = []
+            return None
+        checkpoint = checkpoints[i - 1]
+        del checkpoints[i - 1:]
+        return checkpoint
+
+    def _fcfs_checkpoint(self, position):
+        # FCFS runs processes in arrival order, one segment each, so every
+        # segment boundary is a checkpoint.
+        if position == 0:
+            return None
+        end = int(self.schedule.end[position - 1])
+        return Checkpoint(end, position, position, end, ())
+
+    def _resume(self, checkpoint):
+        k = checkpoint.segments if checkpoint else 0
+        index = self.schedule.index[:k] if k else np.empty(0, dtype=np.int64)
+        start = self.schedule.start[:k] if k else np.empty(0, dtype=np.int64)
+        end = np.array(self.schedule.end[:k]) if k else np.empty(0, dtype=np.int64)
+        if k:
+            end[-1] = checkpoint.last_end
+
+        if self.algorithm == "fcfs":
+            suffix = self._run_fcfs(checkpoint)
+            return Schedule.from_arrays(
+                self.pids, *(np.concatenate(pair) for pair in zip((index, start, end), suffix))
+            )
+
+        schedule = Schedule.from_arrays(self.pids, index, start, end)
+        del index, start, end
+        if self.algorithm == "sjf":
+            self._run_non_preemptive(schedule, checkpoint, lambda i: (self._bursts[i], i))
+        elif self.algorithm == "ljf":
+            self._run_non_preemptive(
+                schedule, checkpoint, lambda i: (-self._bursts[i], self._arrivals[i], i)
+            )
+        elif self.algorithm == "srtf":
+            self._run_srtf(schedule, checkpoint)
+        else:
+            self._run_rr(schedule, checkpoint)
+        return schedule
+
+    def _checkpoint(self, schedule, current_time, cursor, queue):
+        last_end = schedule[len(schedule) - 1][2] if len(schedule) else 0
+        self.checkpoints.append(
+            Checkpoint(current_time, cursor, len(schedule), last_end, queue)
+        )
+
+    def _run_fcfs(self, checkpoint):
+        position = checkpoint.cursor if checkpoint else 0
+        order = self._order[position:]
+        start_times, end_times = fcfs_times(
+            self.workload.arrival_time[order],
+            self.workload.burst_time[order],
+            checkpoint.time if checkpoint else 0,
+        )
+        return order, start_times, end_times
+
+    def _recorder(self, schedule):
+        return lambda time, cursor, queue: self._checkpoint(schedule, time, cursor, queue)
+
+    def _run_non_preemptive(self, schedule, checkpoint, key):
+        state = None
+        if checkpoint is not None:
+            state = (checkpoint.time, checkpoint.cursor, list(checkpoint.queue))
+        simulate_non_preemptive(
+            schedule,
+            self._arrivals,
+            self._bursts,
+            self._order.tolist(),
+            key,
+            state,
+            self._recorder(schedule),
+            self.checkpoint_every,
+        )
+
+    def _run_srtf(self, schedule, checkpoint):
+        arrivals = self._arrivals
+        remaining = list(self._bursts)
+        p1_index = self.p1_index
+
+        p1_first = (
+            p1_index is not None and arrivals[p1_index] == 0 and remaining[p1_index] > 0
+        )
+        if checkpoint is None:
+            state = (0, 0, [])
+            if p1_first:
+                schedule.append(p1_index, 0, 1)
+                state = (1, 0, [])
+        else:
+            state = (checkpoint.time, checkpoint.cursor, list(checkpoint.queue))
+            for r, i in checkpoint.queue:
+                remaining[i] = r
+        # P1's first time unit was spent before the loop; until P1 is
+        # admitted its remaining time is not in the queue.
+        if p1_first and not (self._order[: state[1]] == p1_index).any():
+            remaining[p1_index] -= 1
+
+        simulate_srtf(
+            schedule,
+            arrivals,
+            remaining,
+            self._order.tolist(),
+            state,
+            self._recorder(schedule),
+            self.checkpoint_every,
+        )
+
+    def _run_rr(self, schedule, checkpoint):
+        arrivals = self._arrivals
+        remaining = list(self._bursts)
+        order = self._order.tolist()
+
+        if checkpoint is None:
+            state = (arrivals[order[0]] if order else 0, 0, deque())
+        else:
+            queue = deque(i for i, _ in checkpoint.queue)
+            state = (checkpoint.time, checkpoint.cursor, queue)
+            for i, r in checkpoint.queue:
+                remaining[i] = r
+
+        simulate_rr(
+            schedule,
+            arrivals,
+            remaining,
+            order,
+            self.quantum,
+            state,
+            self._recorder(schedule),
+            self.checkpoint_every,
+        )
+
+    def _result(self):
+        schedule = self.schedule
+        workload = self.workload
+        if self.algorithm in ("srtf", "rr"):
+            metrics = compute_metrics(schedule, workload)
+            return schedule, metrics.as_dict("waiting_time"), metrics.avg_waiting_time
+
+        # The non-preemptive algorithms list waiting times in execution order.
+        waiting_times = execution_order_waiting_times(schedule, workload)
+        if self.algorithm == "ljf":
+            count = len(workload)
+        else:
+            count = len(waiting_times)
+        avg_waiting_time = sum(waiting_times.values()) / count if count else 0.0
+        return schedule, waiting_times, avg_waiting_time
+
+
+def resimulate(simulator, processes):
+    """
+    Bring a simulator up to date with an edited copy of its workload.
+
+    Rows whose arrival or burst time differ are applied as one update. If the
+    pids or the number of rows changed, the workload is simulated from scratch.
+
+    Args:
+        simulator (IncrementalSimulator): Simulator of the previous workload.
+        processes (list or Workload): The edited workload.
+
+    Returns:
+        tuple: (schedule, waiting_times, avg_waiting_time)
+    """
+    workload = as_workload(processes)
+    current = simulator.workload
+    if len(workload) != len(current) or list(workload.pids) != current.pids:
+        # Rows were added, removed or reordered: no checkpoint still applies.
+        simulator._load(workload)
+        return simulator.run()
+    changed = np.nonzero(
+        (workload.arrival_time != current.arrival_time)
+        | (workload.burst_time != current.burst_time)
+    )[0]
+    return simulator.update_rows(
+        changed, workload.arrival_time[changed], workload.burst_time[changed]
+    )
@@ -0,0 +1,138 @@
+"""
+Binary min-heap of integer items with a position index.
+
+Unlike heapq, the heap knows where every item is, so the key of a queued
+item can be lowered (decrease-key) or the item removed in O(log n) instead of
+searching for it or leaving stale entries behind.
+"""
+
+
+class IndexedHeap:
+    """
+    Min-heap over the items 0..size-1, each queued at most once.
+
+    Keys are compared with ``<``; tuples such as (priority, sequence) give a
+    deterministic order among equal priorities.
+
+    Args:
+        size (int): Number of distinct items.
+    """
+
+    def __init__(self, size):
+        self._heap = []
+        self._keys = [None] * size
+        self._pos = [-1] * size
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return self._pos[item] >= 0
+
+    def key(self, item):
+        """
+        Returns:
+            The key ``item`` is queued with.
+        """
+        if self._pos[item] < 0:
+            raise KeyError(item)
+        return self._keys[item]
+
+    def push(self, item, key):
+        """
+        Queue ``item`` with ``key``. Raises ValueError if it is already queued.
+        """
+        if self._pos[item] >= 0:
+            raise ValueError(f"Item {item} is already queued")
+        self._keys[item] = key
+        self._pos[item] = len(self._heap)
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self):
+        """
+        Returns:
+            tuple: (item, key) with the smallest key, without removing it.
+        """
+        item = self._heap[0]
+        return item, self._keys[item]
+
+    def pop(self):
+        """
+        Remove and return the item with the smallest key.
+
+        Returns:
+            tuple: (item, key)
+        """
+        item = self._heap[0]
+        self._remove_at(0)
+        return item, self._keys[item]
+
+    def remove(self, item):
+        """
+        Remove a queued item.
+        """
+        if self._pos[item] < 0:
+            raise KeyError(item)
+        self._remove_at(self._pos[item])
+
+    def decrease_key(self, item, key):
+        """
+        Lower the key of a queued item and restore the heap order.
+        """
+        if self._pos[item] < 0:
+            raise KeyError(item)
+        if self._keys[item] < key:
+            raise ValueError("decrease_key cannot increase a key")
+        self._keys[item] = key
+        self._sift_up(self._pos[item])
+
+    def _remove_at(self, i):
+        heap = self._heap
+        item = heap[i]
+        last = heap.pop()
+        self._pos[item] = -1
+        if i < len(heap):
+            heap[i] = last
+            self._pos[last] = i
+            # The moved item may belong above or below its new position.
+            if i > 0 and self._keys[last] < self._keys[heap[(i - 1) >> 1]]:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+
+    def _sift_up(self, i):
+        heap, keys, pos = self._heap, self._keys, self._pos
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_item = heap[parent]
+            if not key < keys[parent_item]:
+                break
+            heap[i] = parent_item
+            pos[parent_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, keys, pos = self._heap, self._keys, self._pos
+        n = len(heap)
+        item = heap[i]
+        key = keys[item]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and keys[heap[right]] < keys[heap[child]]:
+                child = right
+            child_item = heap[child]
+            if not keys[child_item] < key:
+                break
+            heap[i] = child_item
+            pos[child_item] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
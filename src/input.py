@@ -1,8 +1,57 @@
+import multiprocessing
+import time
 import tkinter as tk
-from tkinter import messagebox
-from random import randint
+from tkinter import filedialog, messagebox, simpledialog, ttk
+
 from algorithms import run_algorithm
-from visualizer import visualize_results
+from cache import cached_run_algorithm
+from compare import compare
+from generator import WorkloadGenerator
+from incremental import ALGORITHMS as INCREMENTAL_ALGORITHMS, IncrementalSimulator, resimulate
+from sweep import format_table
+from tuner import format_rows, tune_quantum
+from visualizer import show_comparison, visualize_results
+
+MAX_PROCESSES = 100_000
+ALGORITHMS = ["FCFS", "SJF", "RR", "SRTF", "LJF", "CFS", "PRIORITY"]
+COLUMNS = ("pid", "arrival", "burst", "priority")
+HEADINGS = {"pid": "PID", "arrival": "Arrival Time", "burst": "Burst Time", "priority": "Priority"}
+# Generator settings offered by the GUI, see generator.py.
+ARRIVAL_CHOICES = {"Poisson arrivals": "poisson", "Bursty arrivals": "bursty", "Arrivals at t=0": "batch"}
+BURST_CHOICES = {
+    "Exponential bursts": "exponential",
+    "Log-normal bursts": "lognormal",
+    "Pareto bursts": "pareto",
+    "Uniform bursts": "uniform",
+}
+GUI_MEAN_BURST = 5
+GUI_PRIORITIES = 5
+
+
+# Simulator of the last run in the worker process.
+_simulator = None
+
+
+def _simulate(processes, algorithm, quantum, **options):
+    # Runs in the worker process, which keeps its result cache between runs.
+    # ``options`` are further run_algorithm arguments such as aging_interval.
+    return cached_run_algorithm(processes, algorithm, quantum, compute=_resimulate, **options)
+
+
+def _resimulate(processes, algorithm, quantum, **options):
+    # After editing a few rows, only the part of the schedule from the last
+    # checkpoint before the earliest edited arrival is simulated again.
+    global _simulator
+    if algorithm not in INCREMENTAL_ALGORITHMS or options:
+        return run_algorithm(processes, algorithm, quantum, **options)
+    if (
+        _simulator is not None
+        and _simulator.algorithm == algorithm
+        and _simulator.quantum == quantum
+    ):
+        return resimulate(_simulator, processes)
+    _simulator = IncrementalSimulator(processes, algorithm, quantum)
+    return _simulator.run()
 
 
 class InputGUI:
@@ -10,13 +59,16 @@ class InputGUI:
         self.root = root
         self.root.title("Process Scheduler Study")
         self.processes = []
-        self.entries = []
+        # One [pid, arrival, burst, priority] list of strings per row of the table.
+        self.rows = []
+        self.pool = None
+        self.pending = None
 
-        tk.Label(root, text="Number of Processes (1-10):").grid(
+        tk.Label(root, text=f"Number of Processes (1-{MAX_PROCESSES}):").grid(
             row=0, column=0, padx=5, pady=5, sticky="e"
         )
         self.num_processes_var = tk.StringVar(value="3")
-        tk.Entry(root, textvariable=self.num_processes_var, width=5).grid(
+        tk.Entry(root, textvariable=self.num_processes_var, width=8).grid(
             row=0, column=1, padx=5, pady=5
         )
         tk.Button(root, text="Set Processes", command=self.create_process_inputs).grid(
@@ -27,9 +79,11 @@ class InputGUI:
             row=1, column=0, padx=5, pady=5, sticky="e"
         )
         self.algo_var = tk.StringVar(value="FCFS")
-        tk.OptionMenu(root, self.algo_var, "FCFS", "SJF", "RR", "SRTF", "LJF").grid(
+        tk.OptionMenu(root, self.algo_var, *ALGORITHMS).grid(
             row=1, column=1, padx=5, pady=5
         )
+        self.tune_button = tk.Button(root, text="Tune Quantum", command=self.tune_rr)
+        self.tune_button.grid(row=1, column=2, padx=5, pady=5)
 
         tk.Label(root, text="Quantum (for RR):").grid(
             row=2, column=0, padx=5, pady=5, sticky="e"
@@ -38,18 +92,67 @@ class InputGUI:
         self.quantum_entry = tk.Entry(root, textvariable=self.quantum_var, width=5)
         self.quantum_entry.grid(row=2, column=1, padx=5, pady=5)
         self.quantum_entry.config(state="disabled")
+        self.compare_button = tk.Button(root, text="Compare All", command=self.compare_all)
+        self.compare_button.grid(row=2, column=2, padx=5, pady=5)
 
         self.algo_var.trace("w", self.toggle_quantum)
 
-        tk.Button(root, text="Generate Random", command=self.generate_random).grid(
+        self.arrival_var = tk.StringVar(value=next(iter(ARRIVAL_CHOICES)))
+        tk.OptionMenu(root, self.arrival_var, *ARRIVAL_CHOICES).grid(
             row=3, column=0, padx=5, pady=5
         )
-        tk.Button(root, text="Run Simulation", command=self.run_simulation).grid(
+        self.burst_var = tk.StringVar(value=next(iter(BURST_CHOICES)))
+        tk.OptionMenu(root, self.burst_var, *BURST_CHOICES).grid(
             row=3, column=1, padx=5, pady=5
         )
+        self.save_button = tk.Button(
+            root, text="Save Generated...", command=self.save_generated
+        )
+        self.save_button.grid(row=3, column=2, padx=5, pady=5)
+
+        tk.Button(root, text="Generate Random", command=self.generate_random).grid(
+            row=4, column=0, padx=5, pady=5
+        )
+        self.run_button = tk.Button(
+            root, text="Run Simulation", command=self.run_simulation
+        )
+        self.run_button.grid(row=4, column=1, padx=5, pady=5)
+        self.cancel_button = tk.Button(
+            root, text="Cancel", command=self.cancel_simulation, state="disabled"
+        )
+        self.cancel_button.grid(row=4, column=2, padx=5, pady=5)
 
         self.process_frame = tk.Frame(root)
-        self.process_frame.grid(row=4, column=0, columnspan=3, padx=5, pady=5)
+        self.process_frame.grid(
+            row=5, column=0, columnspan=3, padx=5, pady=5, sticky="nsew"
+        )
+        root.grid_rowconfigure(5, weight=1)
+        root.grid_columnconfigure(1, weight=1)
+
+        # A Treeview draws only the visible rows, so the table scales to tens
+        # of thousands of processes without a widget per cell.
+        self.table = ttk.Treeview(
+            self.process_frame, columns=COLUMNS, show="headings", height=12
+        )
+        for column in COLUMNS:
+            self.table.heading(column, text=HEADINGS[column])
+            self.table.column(column, width=110, anchor="center")
+        scrollbar = ttk.Scrollbar(
+            self.process_frame, orient="vertical", command=self.table.yview
+        )
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.process_frame.grid_rowconfigure(0, weight=1)
+        self.process_frame.grid_columnconfigure(0, weight=1)
+        self.table.bind("<Double-1>", self.edit_cell)
+        self.editor = None
+
+        self.progress = ttk.Progressbar(root, mode="indeterminate")
+        self.status_var = tk.StringVar(value="")
+        tk.Label(root, textvariable=self.status_var).grid(
+            row=7, column=0, columnspan=3, padx=5, pady=2, sticky="w"
+        )
 
         self.create_process_inputs()
 
@@ -58,116 +161,144 @@ class InputGUI:
             state="normal" if self.algo_var.get() == "RR" else "disabled"
         )
 
-    def create_process_inputs(self):
+    def _read_count(self):
         try:
             num = int(self.num_processes_var.get())
-            if not 1 <= num <= 10:
-                raise ValueError("Number of processes must be between 1 and 10")
+            if not 1 <= num <= MAX_PROCESSES:
+                raise ValueError(f"Number of processes must be between 1 and {MAX_PROCESSES}")
         except ValueError:
-            messagebox.showerror("Error", "Please enter a valid number (1-10)")
-            return
-
-        # --- MODIFICATION START ---
-        # 1. Save current values before destroying widgets
-        old_values = []
-        for pid_var, arrival_var, burst_var in self.entries:
-            old_values.append({
-                "pid": pid_var.get(),
-                "arrival": arrival_var.get(),
-                "burst": burst_var.get()
-            })
-        # --- MODIFICATION END ---
-
-        for widget in self.process_frame.winfo_children():
-            widget.destroy()
-
-        self.entries = []
-        for i in range(num):
-            # --- MODIFICATION START ---
-            if i < len(old_values):
-                # 2. Restore old values if they exist
-                pid_var = tk.StringVar(value=old_values[i]["pid"])
-                arrival_var = tk.StringVar(value=old_values[i]["arrival"])
-                burst_var = tk.StringVar(value=old_values[i]["burst"])
-            else:
-                # 3. Create new default/random values only for new processes
-                pid_var = tk.StringVar(value=f"p{i+1}")
-                arrival_var = tk.StringVar(value="0")
-                burst_var = tk.StringVar(value=str(randint(1, 10)))
-            # --- MODIFICATION END ---
-            
-            self.entries.append((pid_var, arrival_var, burst_var))
-
-
-        tk.Label(self.process_frame, text="PID").grid(row=0, column=0, padx=5, pady=2)
-        tk.Label(self.process_frame, text="Arrival Time").grid(
-            row=0, column=1, padx=5, pady=2
-        )
-        tk.Label(self.process_frame, text="Burst Time").grid(
-            row=0, column=2, padx=5, pady=2
-        )
-
-        for i in range(num):
-            pid_var, arrival_var, burst_var = self.entries[i]
-
-            tk.Entry(self.process_frame, textvariable=pid_var, width=10, state="readonly").grid(
-                row=i + 1, column=0, padx=5, pady=2
-            )
-            
-            tk.Entry(self.process_frame, textvariable=arrival_var, width=10).grid(
-                row=i + 1, column=1, padx=5, pady=2
-            )
-            tk.Entry(self.process_frame, textvariable=burst_var, width=10).grid(
-                row=i + 1, column=2, padx=5, pady=2
-            )
+            messagebox.showerror("Error", f"Please enter a valid number (1-{MAX_PROCESSES})")
+            return None
+        return num
+
+    def create_process_inputs(self):
+        num = self._read_count()
+        if num is None:
+            return
+
+        # Keep the existing rows and only add or remove the difference.
+        if num < len(self.rows):
+            self.table.delete(*[str(i) for i in range(num, len(self.rows))])
+            del self.rows[num:]
+        first = len(self.rows)
+        workload = self.generator().generate(max(num - first, 0))
+        for i, arrival, burst, priority in zip(
+            range(first, num),
+            workload.arrival_time.tolist(),
+            workload.burst_time.tolist(),
+            workload.priority.tolist(),
+        ):
+            row = [f"p{i+1}", str(arrival), str(burst), str(priority)]
+            self.rows.append(row)
+            self.table.insert("", "end", iid=str(i), values=row)
+
+    def generator(self):
+        # New rows follow the distributions selected in the GUI, with a fresh seed.
+        return WorkloadGenerator(
+            ARRIVAL_CHOICES[self.arrival_var.get()],
+            BURST_CHOICES[self.burst_var.get()],
+            mean_burst=GUI_MEAN_BURST,
+            priorities=GUI_PRIORITIES,
+        )
+
+    def edit_cell(self, event):
+        iid = self.table.identify_row(event.y)
+        column = self.table.identify_column(event.x)
+        # PIDs stay read-only, as in the original grid.
+        if not iid or column not in ("#2", "#3", "#4"):
+            return
+        bbox = self.table.bbox(iid, column)
+        # Rows scrolled out of view have no bounding box.
+        if not bbox:
+            return
+        x, y, width, height = bbox
+        col = int(column[1:]) - 1
+        row = int(iid)
+
+        self.close_editor()
+        var = tk.StringVar(value=self.rows[row][col])
+        self.editor = tk.Entry(self.table, textvariable=var)
+        self.editor.place(x=x, y=y, width=width, height=height)
+        self.editor.focus_set()
+        self.editor.select_range(0, "end")
+
+        def commit(_event=None):
+            self.set_cell(row, col, var.get().strip())
+            self.close_editor()
+
+        self.editor.bind("<Return>", commit)
+        self.editor.bind("<FocusOut>", commit)
+        self.editor.bind("<Escape>", lambda _event: self.close_editor())
+
+    def close_editor(self):
+        if self.editor is not None:
+            self.editor.destroy()
+            self.editor = None
+
+    def set_cell(self, row, col, value):
+        self.rows[row][col] = value
+        self.table.item(str(row), values=self.rows[row])
 
     def generate_random(self):
-        try:
-            num = int(self.num_processes_var.get())
-            if not 1 <= num <= 10:
-                raise ValueError("Number of processes must be between 1 and 10")
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid number (1-10)")
+        num = self._read_count()
+        if num is None:
             return
 
-        # This clears all entries, so the new create_process_inputs
-        # will generate all new random processes, which is the
-        # expected behavior for "Generate Random".
-        self.entries = []
+        # This clears all rows, so create_process_inputs will generate all
+        # new random processes, which is the expected behavior for
+        # "Generate Random".
+        self.table.delete(*self.table.get_children())
+        self.rows = []
         self.create_process_inputs()
 
+    def read_processes(self):
+        processes = []
+        seen_pids = set()
+        for pid, arrival, burst, priority in self.rows:
+            pid = pid.strip()
+            if not pid:
+                raise ValueError("PID cannot be empty")
+            if pid in seen_pids:
+                raise ValueError(f"Duplicate PID: {pid}")
+            seen_pids.add(pid)
+            arrival = int(arrival)
+            burst = int(burst)
+            if arrival < 0 or burst <= 0:
+                raise ValueError(
+                    "Arrival time must be non-negative, burst time must be positive"
+                )
+            processes.append(
+                {
+                    "pid": pid,
+                    "arrival_time": arrival,
+                    "burst_time": burst,
+                    "priority": int(priority),
+                }
+            )
+        return processes
+
+    def read_quantum(self):
+        quantum = int(self.quantum_var.get())
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        return quantum
+
     def run_simulation(self):
+        if self.pending is not None:
+            return
         try:
-            processes = []
-            seen_pids = set()
-            for pid_var, arrival_var, burst_var in self.entries:
-                pid = pid_var.get().strip()
-                if not pid:
-                    raise ValueError("PID cannot be empty")
-                if pid in seen_pids:
-                    raise ValueError(f"Duplicate PID: {pid}")
-                seen_pids.add(pid)
-                arrival = int(arrival_var.get())
-                burst = int(burst_var.get())
-                if arrival < 0 or burst <= 0:
-                    raise ValueError(
-                        "Arrival time must be non-negative, burst time must be positive"
-                    )
-                processes.append(
-                    {"pid": pid, "arrival_time": arrival, "burst_time": burst}
-                )
+            processes = self.read_processes()
 
             algorithm = self.algo_var.get().lower()
             quantum = None
             if algorithm == "rr":
-                quantum = int(self.quantum_var.get())
-                if quantum <= 0:
-                    raise ValueError("Quantum must be positive")
-
-            schedule, waiting_times, avg_waiting_time = run_algorithm(
-                processes, algorithm, quantum
-            )
+                quantum = self.read_quantum()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
 
+        def show(result):
+            schedule, waiting_times, avg_waiting_time = result
             visualize_results(
                 schedule,
                 waiting_times,
@@ -177,11 +308,162 @@ class InputGUI:
                 processes=processes,
             )
 
+        self.start_job(
+            _simulate,
+            (processes, algorithm, quantum),
+            f"{algorithm.upper()} on {len(processes)} processes",
+            show,
+        )
+
+    def compare_all(self):
+        if self.pending is not None:
+            return
+        try:
+            processes = self.read_processes()
+            quantum = self.read_quantum()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        def show(result):
+            rows, schedules = result
+            print(f"\nComparing algorithms on {len(processes)} processes:")
+            print(format_table(rows))
+            show_comparison(rows, schedules)
+
+        algorithms = [name.lower() for name in ALGORITHMS]
+        self.start_job(
+            compare,
+            (processes, algorithms, quantum),
+            f"Comparison on {len(processes)} processes",
+            show,
+        )
+
+    def save_generated(self):
+        # Workloads too large for the table are streamed straight to a file
+        # that the headless mode or traces.py can load.
+        if self.pending is not None:
+            return
+        count = simpledialog.askinteger(
+            "Save Generated Workload", "Number of processes:", minvalue=1, parent=self.root
+        )
+        if count is None:
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".psw", filetypes=[("Workload files", "*.psw")]
+        )
+        if not path:
+            return
+
+        def show(written):
+            self.status_var.set(f"Wrote {written} processes to {path}")
+
+        self.start_job(
+            self.generator().write,
+            (path, count),
+            f"Generating {count} processes",
+            show,
+        )
+
+    def tune_rr(self):
+        if self.pending is not None:
+            return
+        try:
+            processes = self.read_processes()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        def show(result):
+            best, rows = result
+            print(f"\nTuning the RR quantum on {len(processes)} processes:")
+            print(format_rows(rows))
+            self.algo_var.set("RR")
+            self.quantum_var.set(str(best["quantum"]))
+            self.status_var.set(
+                f"Best quantum for AWT: {best['quantum']} (AWT {best['awt']:.3f})"
+            )
+
+        self.start_job(
+            tune_quantum,
+            (processes,),
+            f"Quantum tuning on {len(processes)} processes",
+            show,
+        )
+
+    def start_job(self, function, args, label, on_done):
+        # Jobs run in a worker process so the window stays responsive, and
+        # cancelling can simply terminate the worker.
+        if self.pool is None:
+            self.pool = multiprocessing.get_context("spawn").Pool(1)
+        self.pending = (
+            self.pool.apply_async(function, args),
+            label,
+            time.monotonic(),
+            on_done,
+        )
+        self.run_button.config(state="disabled")
+        self.compare_button.config(state="disabled")
+        self.tune_button.config(state="disabled")
+        self.save_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress.grid(row=6, column=0, columnspan=3, padx=5, pady=2, sticky="ew")
+        self.progress.start(10)
+        self.poll_simulation()
+
+    def poll_simulation(self):
+        if self.pending is None:
+            return
+        result, label, started, on_done = self.pending
+        if not result.ready():
+            self.status_var.set(f"Running {label}... {time.monotonic() - started:.1f}s")
+            self.root.after(100, self.poll_simulation)
+            return
+
+        self.finish_simulation()
+        try:
+            value = result.get()
+        except (ValueError, OSError) as e:
+            self.status_var.set(f"{label} failed")
+            messagebox.showerror("Error", str(e))
+            return
+        except Exception as e:
+            # Anything else escaping this after() callback would leave the
+            # error unreported; start the next job in a fresh worker.
+            self.pool.terminate()
+            self.pool = None
+            self.status_var.set(f"{label} failed")
+            messagebox.showerror("Error", f"{type(e).__name__}: {e}")
+            return
+        self.status_var.set(f"{label} finished in {time.monotonic() - started:.2f}s")
+        on_done(value)
+
+    def cancel_simulation(self):
+        if self.pending is None:
+            return
+        self.pool.terminate()
+        self.pool = None
+        self.finish_simulation()
+        self.status_var.set("Simulation cancelled")
+
+    def finish_simulation(self):
+        self.pending = None
+        self.progress.stop()
+        self.progress.grid_remove()
+        self.run_button.config(state="normal")
+        self.compare_button.config(state="normal")
+        self.tune_button.config(state="normal")
+        self.save_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+        self.root.destroy()
 
 
 def get_process_input():
     root = tk.Tk()
     app = InputGUI(root)
-    root.mainloop()
\ No newline at end of file
+    root.protocol("WM_DELETE_WINDOW", app.close)
+    root.mainloop()
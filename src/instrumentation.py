@@ -0,0 +1,152 @@
+"""
+Opt-in counters and phase timings for run_algorithm.
+
+Pass an Instrumentation object to run_algorithm to record, for every call,
+how long each phase took and what the resulting schedule did:
+
+    probe = Instrumentation()
+    run_algorithm(processes, "rr", 4, instrument=probe)
+    print(probe.to_json())
+
+The counters are derived from the schedule after the simulation has finished,
+so the algorithms' loops are the same code with and without instrumentation
+and a call without ``instrument`` costs nothing extra.
+"""
+
+import json
+import time
+
+import numpy as np
+
+from metrics import schedule_arrays
+from workload import as_workload
+
+
+def schedule_counters(schedule, processes):
+    """
+    Count what a schedule did.
+
+    Args:
+        schedule (Schedule or list): Time-ordered schedule.
+        processes (list or Workload): The scheduled processes.
+
+    Returns:
+        dict: Integer counters:
+            - dispatches: segments, i.e. times a process was given the CPU
+            - preemptions: dispatches that ended before the process finished
+            - context_switches: consecutive segments of different processes
+            - busy_time: total length of all segments
+            - idle_time: time without a running process between the first
+              arrival and the last completion
+            - max_ready_queue: most processes left waiting right after a
+              dispatch: arrived by the segment's start, not finished by
+              then and not the process being dispatched. Processes that
+              arrive during a segment are counted at the next dispatch,
+              which is when a scheduler's ready queue takes them in.
+    """
+    workload = as_workload(processes)
+    index, start, end = schedule_arrays(schedule, workload)
+    if not len(index):
+        return {
+            "dispatches": 0,
+            "preemptions": 0,
+            "context_switches": 0,
+            "busy_time": 0,
+            "idle_time": 0,
+            "max_ready_queue": 0,
+        }
+
+    completion = np.full(len(workload), np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(completion, index, end)
+    preemptions = int(np.count_nonzero(end < completion[index]))
+    context_switches = int(np.count_nonzero(index[1:] != index[:-1]))
+
+    busy_time = int((end - start).sum())
+    ran = completion != np.iinfo(np.int64).min
+    arrivals = np.sort(workload.arrival_time[ran])
+    completions = np.sort(completion[ran])
+    span = int(completions[-1] - min(arrivals[0], start.min()))
+
+    # Just after each dispatch: processes that finished at that instant are
+    # gone, and the dispatched one has left the queue.
+    waiting = (
+        np.searchsorted(arrivals, start, "right")
+        - np.searchsorted(completions, start, "right")
+        - 1
+    )
+
+    return {
+        "dispatches": len(index),
+        "preemptions": preemptions,
+        "context_switches": context_switches,
+        "busy_time": busy_time,
+        "idle_time": span - busy_time,
+        "max_ready_queue": int(max(waiting.max(), 0)),
+    }
+
+
+class Instrumentation:
+    """
+    Collects one record of counters and phase timings per run_algorithm call.
+
+    Each record is a dict with the algorithm, quantum, number of processes,
+    the counters of schedule_counters and a 'timings' dict of seconds spent in
+    the 'prepare' (workload conversion), 'simulate' and 'analyze' phases.
+
+    Args:
+        callback (callable, optional): Called with each record as it is made.
+        keep (bool): Keep the records in ``records``. Turn off for long runs
+            that only use the callback.
+    """
+
+    def __init__(self, callback=None, keep=True):
+        self.callback = callback
+        self.keep = keep
+        self.records = []
+
+    def run(self, processes, algorithm, quantum=None, **options):
+        """
+        Run and measure one algorithm. run_algorithm calls this when given
+        ``instrument``; the arguments and result are the same.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time)
+        """
+        from algorithms import run_algorithm
+
+        timings = {}
+        started = time.perf_counter()
+        workload = as_workload(processes)
+        prepared = time.perf_counter()
+        timings["prepare"] = prepared - started
+
+        result = run_algorithm(workload, algorithm, quantum, **options)
+        simulated = time.perf_counter()
+        timings["simulate"] = simulated - prepared
+
+        record = {
+            "algorithm": algorithm,
+            "quantum": quantum if algorithm == "rr" else None,
+            "processes": len(workload),
+        }
+        record.update(options)
+        record.update(schedule_counters(result[0], workload))
+        timings["analyze"] = time.perf_counter() - simulated
+        timings["total"] = time.perf_counter() - started
+        record["timings"] = timings
+
+        if self.keep:
+            self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+        return result
+
+    def to_json(self, **kwargs):
+        """
+        Returns:
+            str: The records as a JSON array; kwargs go to json.dumps.
+        """
+        return json.dumps(self.records, **kwargs)
+
+    def clear(self):
+        self.records = []
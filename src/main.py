@@ -1,10 +1,241 @@
-from input import get_process_input
+import argparse
+import json
+import os
+import sys
+import time
 
 
-def main():
-    print("Process Scheduler Study v0.2.0: Start simulating scheduler with GUI.")
-    get_process_input()
+def run_headless(
+    paths,
+    algorithm,
+    quantum=None,
+    as_json=False,
+    per_process=False,
+    chart=False,
+    output=None,
+    cache_dir=None,
+    options=None,
+    stats=False,
+    percentiles=False,
+):
+    """
+    Simulate each workload file and print its metrics.
+
+    ``paths`` holds file names or (name, Workload) pairs, e.g. for a
+    generated workload.
+
+    Only the simulation modules are imported; matplotlib is loaded when a
+    chart is requested and tkinter never is. ``output`` is a file name for an
+    offscreen Gantt chart; '{name}' in it is replaced by the workload's name.
+    With ``cache_dir``, results are cached on disk there across runs.
+    ``options`` holds extra keyword arguments for run_algorithm, such as the
+    CFS min_granularity and target_latency or the priority aging_interval. ``stats`` adds the schedule's
+    counters (see instrumentation.schedule_counters) and the time spent
+    loading, simulating and computing metrics. ``percentiles`` adds the
+    p50/p95/p99 of the waiting, turnaround and response times (see
+    sketches.MetricsAccumulator).
+    """
+    options = options or {}
+    from algorithms import run_algorithm
+    from metrics import compute_metrics
+    from traces import load_workload
+
+    if cache_dir is not None:
+        from cache import ResultCache
+
+        run_algorithm = ResultCache(directory=cache_dir).run
+
+    for path in paths:
+        started = time.perf_counter()
+        if isinstance(path, str):
+            workload = load_workload(path)
+        else:
+            path, workload = path
+        loaded = time.perf_counter()
+        schedule, waiting_times, avg_waiting_time = run_algorithm(
+            workload, algorithm, quantum, **options
+        )
+        simulated = time.perf_counter()
+        metrics = compute_metrics(schedule, workload)
+        timings = {
+            "load": loaded - started,
+            "simulate": simulated - loaded,
+            "metrics": time.perf_counter() - simulated,
+        }
+
+        result = {
+            "workload": path,
+            "algorithm": algorithm,
+            "quantum": quantum if algorithm == "rr" else None,
+            "processes": len(workload),
+            "segments": len(schedule),
+        }
+        result.update(metrics.averages())
+        if per_process:
+            for metric in ("waiting_time", "turnaround_time", "response_time", "completion_time"):
+                result[metric] = metrics.as_dict(metric)
+        if stats:
+            from instrumentation import schedule_counters
+
+            result["stats"] = schedule_counters(schedule, workload)
+            result["timings"] = timings
+        if percentiles:
+            from sketches import MetricsAccumulator
+
+            accumulator = MetricsAccumulator()
+            accumulator.add_metrics(metrics)
+            result["percentiles"] = accumulator.summary()
+
+        if as_json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"{path}: {algorithm.upper()} "
+                f"AWT={result['awt']:.4f} ATA={result['ata']:.4f} ART={result['art']:.4f} "
+                f"({result['processes']} processes, {result['segments']} segments)"
+            )
+            if stats:
+                print(
+                    "  "
+                    + " ".join(f"{name}={value}" for name, value in result["stats"].items())
+                    + " "
+                    + " ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+                )
+            if percentiles:
+                from sketches import format_summary
+
+                for line in format_summary(result["percentiles"]).splitlines():
+                    print(f"  {line}")
+
+        if output:
+            from visualizer import save_gantt
+
+            name = os.path.splitext(os.path.basename(path))[0]
+            save_gantt(
+                schedule,
+                output.replace("{name}", name),
+                title=f"{algorithm.upper()}: {path} (AWT {result['awt']:.2f})",
+            )
+
+        if chart:
+            from visualizer import visualize_results
+
+            visualize_results(
+                schedule,
+                waiting_times,
+                avg_waiting_time,
+                mode="gui",
+                algorithm=algorithm.upper(),
+                processes=workload,
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Process Scheduler Study. Without workload files the GUI is started."
+    )
+    parser.add_argument("workloads", nargs="*", help="workload files (.psw, .csv or .json)")
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        default="fcfs",
+        choices=["fcfs", "sjf", "srtf", "ljf", "rr", "cfs", "priority"],
+    )
+    parser.add_argument("-q", "--quantum", type=int, help="time quantum for RR")
+    parser.add_argument("--min-granularity", type=int, help="shortest CFS time slice")
+    parser.add_argument("--target-latency", type=int, help="CFS scheduling period")
+    parser.add_argument(
+        "--aging-interval", type=int, help="waiting time per priority level gained (priority)"
+    )
+    parser.add_argument("--json", action="store_true", help="print one JSON object per workload")
+    parser.add_argument("--per-process", action="store_true", help="include per-process metrics in JSON output")
+    parser.add_argument("--chart", action="store_true", help="also show the Gantt chart")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="save the Gantt chart offscreen (PNG, SVG, ...); '{name}' expands to the workload name",
+    )
+    parser.add_argument("--cache", metavar="DIR", help="reuse results cached on disk in DIR")
+    parser.add_argument(
+        "--stats", action="store_true", help="report dispatch/preemption counters and phase timings"
+    )
+    parser.add_argument(
+        "--percentiles", action="store_true", help="report p50/p95/p99 waiting, turnaround and response times"
+    )
+    generate = parser.add_argument_group("synthetic workloads")
+    generate.add_argument(
+        "--generate", type=int, metavar="N", help="simulate a generated workload of N processes"
+    )
+    generate.add_argument(
+        "--save", metavar="FILE", help="stream the generated workload to FILE (.psw) and simulate that"
+    )
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # The distribution options come from generator.py, which imports NumPy;
+    # only load it when a workload is generated or the help is shown.
+    # argparse also accepts unambiguous prefixes such as --gen.
+    names = [arg.split("=")[0] for arg in argv if arg.startswith("-")]
+    if any(
+        name == "-h" or (len(name) > 2 and ("--generate".startswith(name) or "--help".startswith(name)))
+        for name in names
+    ):
+        from generator import add_arguments
+
+        add_arguments(generate)
+    args = parser.parse_args(argv)
+    if args.save and args.generate is None:
+        parser.error("--save needs --generate")
+
+    if not args.workloads and args.generate is None:
+        from input import get_process_input
+
+        print("Process Scheduler Study v0.2.0: Start simulating scheduler with GUI.")
+        get_process_input()
+        return 0
+
+    if args.algorithm == "rr" and (args.quantum is None or args.quantum <= 0):
+        parser.error("RR needs a positive --quantum")
+    count = len(args.workloads) + (args.generate is not None)
+    if args.output and count > 1 and "{name}" not in args.output:
+        parser.error("--output needs '{name}' when several workloads are given")
+
+    try:
+        sources = list(args.workloads)
+        if args.generate is not None:
+            from generator import from_arguments
+
+            generator = from_arguments(args)
+            if args.save:
+                generator.write(args.save, args.generate)
+                sources.append(args.save)
+            else:
+                name = f"generated-{args.arrival}-{args.burst}-{args.generate}-seed{args.seed}"
+                sources.append((name, generator.generate(args.generate)))
+        run_headless(
+            sources,
+            args.algorithm,
+            args.quantum,
+            as_json=args.json,
+            per_process=args.per_process,
+            chart=args.chart,
+            output=args.output,
+            cache_dir=args.cache,
+            options={
+                name: value
+                for name, value in (
+                    ("min_granularity", args.min_granularity),
+                    ("target_latency", args.target_latency),
+                    ("aging_interval", args.aging_interval),
+                )
+                if value is not None
+            },
+            stats=args.stats,
+            percentiles=args.percentiles,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import numpy as np
+
+from schedule import as_schedule
+from workload import Workload, as_workload
+
+
+class Metrics:
+    """
+    Per-process timing metrics for one schedule.
+
+    All per-process attributes are int64 arrays aligned with ``pids`` (the
+    workload's row order). Averages are plain floats.
+
+    Attributes:
+        pids (list): Process identifiers.
+        completion_time (numpy.ndarray): End of each process's last segment.
+        turnaround_time (numpy.ndarray): completion_time - arrival_time.
+        waiting_time (numpy.ndarray): turnaround_time - burst_time.
+        response_time (numpy.ndarray): Start of the first segment - arrival_time.
+        avg_waiting_time (float): Mean of waiting_time.
+        avg_turnaround_time (float): Mean of turnaround_time.
+        avg_response_time (float): Mean of response_time.
+    """
+
+    def __init__(self, pids, completion_time, turnaround_time, waiting_time, response_time):
+        self.pids = pids
+        self.completion_time = completion_time
+        self.turnaround_time = turnaround_time
+        self.waiting_time = waiting_time
+        self.response_time = response_time
+
+        self.avg_waiting_time = _mean(waiting_time)
+        self.avg_turnaround_time = _mean(turnaround_time)
+        self.avg_response_time = _mean(response_time)
+
+    def as_dict(self, metric):
+        """
+        Return one metric as a {pid: value} dict.
+
+        Args:
+            metric (str): 'completion_time', 'turnaround_time', 'waiting_time' or 'response_time'.
+
+        Returns:
+            dict: Values keyed by pid, in workload order.
+        """
+        return dict(zip(self.pids, getattr(self, metric).tolist()))
+
+    def averages(self):
+        """
+        Returns:
+            dict: {'awt': float, 'ata': float, 'art': float}
+        """
+        return {
+            "awt": self.avg_waiting_time,
+            "ata": self.avg_turnaround_time,
+            "art": self.avg_response_time,
+        }
+
+
+def _mean(values):
+    # Sum in int64 and divide once, like sum(...) / len(...) on Python ints.
+    return int(values.sum()) / len(values) if len(values) else 0.0
+
+
+def schedule_arrays(schedule, workload):
+    """
+    Return a schedule's (index, start, end) arrays with indices into ``workload``.
+
+    Args:
+        schedule (Schedule or list): The schedule, or the old list-of-dicts format.
+        workload (Workload): Workload the schedule was produced from.
+
+    Returns:
+        tuple: (index, start, end) int64 arrays. ``index`` is the workload row
+            of each segment, or -1 if its pid is not part of the workload.
+    """
+    schedule = as_schedule(schedule, workload.pids)
+    index = schedule.index
+    if schedule.pids is not workload.pids:
+        index_of = {pid: i for i, pid in enumerate(workload.pids)}
+        rows = np.fromiter(
+            (index_of.get(pid, -1) for pid in schedule.pids),
+            dtype=np.int64,
+            count=len(schedule.pids),
+        )
+        index = rows[index] if len(index) else index
+    return index, schedule.start, schedule.end
+
+
+def _infer_workload(schedule):
+    # Without process details every pid is assumed to arrive at t=0 with a
+    # burst equal to the total time it was scheduled for.
+    bursts = np.bincount(
+        schedule.index, weights=schedule.end - schedule.start, minlength=len(schedule.pids)
+    )
+    return Workload(schedule.pids, np.zeros(len(schedule.pids), dtype=np.int64), bursts)
+
+
+def compute_metrics(schedule, processes=None):
+    """
+    Compute waiting, turnaround, response and completion times in one pass.
+
+    Args:
+        schedule (Schedule or list): The schedule, or the old list-of-dicts format.
+        processes (list or Workload, optional): The scheduled processes. If
+            omitted, all processes are assumed to arrive at t=0.
+
+    Returns:
+        Metrics: Per-process metrics and their averages.
+    """
+    if processes is None:
+        schedule = as_schedule(schedule)
+        workload = _infer_workload(schedule)
+    else:
+        workload = as_workload(processes)
+    n = len(workload)
+    index, start, end = schedule_arrays(schedule, workload)
+
+    known = index >= 0
+    index, start, end = index[known], start[known], end[known]
+
+    first_start = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    completion_time = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+    np.minimum.at(first_start, index, start)
+    np.maximum.at(completion_time, index, end)
+
+    # Processes that never ran (zero burst) finish the moment they arrive.
+    never_ran = completion_time == np.iinfo(np.int64).min
+    first_start[never_ran] = workload.arrival_time[never_ran]
+    completion_time[never_ran] = workload.arrival_time[never_ran]
+
+    turnaround_time = completion_time - workload.arrival_time
+    return Metrics(
+        workload.pids,
+        completion_time,
+        turnaround_time,
+        turnaround_time - workload.burst_time,
+        first_start - workload.arrival_time,
+    )
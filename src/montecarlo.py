@@ -0,0 +1,273 @@
+"""
+Monte Carlo evaluation of the algorithms over many random workloads.
+
+Each run draws a seeded random workload, schedules it with every selected
+algorithm and folds the resulting AWT/ATA/ART into running statistics. No
+schedule outlives its run, so memory does not grow with the number of runs.
+With --percentiles, every process of every run is also added to a quantile
+sketch per algorithm, and the workers' sketches are merged into per-process
+p50/p95/p99 waiting, turnaround and response times.
+
+    python3 src/montecarlo.py --runs 5000 --processes 50 --algorithms sjf,rr --quantum 4
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from algorithms import run_algorithm
+from benchmark import ARRIVAL_DENSITIES, make_workload
+from metrics import compute_metrics
+from sketches import MetricsAccumulator, format_summary
+
+METRICS = ("awt", "ata", "art")
+
+
+class RunningStats:
+    """
+    Streaming mean and variance (Welford), mergeable across workers (Chan et al.).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def confidence_interval(self, level=0.95):
+        """
+        Normal-approximation confidence interval for the mean.
+
+        Returns:
+            tuple: (low, high)
+        """
+        if self.count < 2:
+            return (self.mean, self.mean)
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        half_width = z * math.sqrt(self.variance / self.count)
+        return (self.mean - half_width, self.mean + half_width)
+
+
+def _simulate_chunk(task):
+    start, stop, config = task
+    stats = {
+        algorithm: {metric: RunningStats() for metric in METRICS}
+        for algorithm in config["algorithms"]
+    }
+    accumulators = (
+        {algorithm: MetricsAccumulator() for algorithm in config["algorithms"]}
+        if config["percentiles"]
+        else None
+    )
+    for run in range(start, stop):
+        workload = make_workload(
+            config["processes"], config["arrival"], config["burst"], [config["seed"], run]
+        )
+        for algorithm in config["algorithms"]:
+            quantum = config["quantum"] if algorithm == "rr" else None
+            schedule, _, _ = run_algorithm(workload, algorithm, quantum)
+            metrics = compute_metrics(schedule, workload)
+            del schedule
+            averages = metrics.averages()
+            for metric in METRICS:
+                stats[algorithm][metric].update(averages[metric])
+            if accumulators is not None:
+                accumulators[algorithm].add_metrics(metrics)
+    return stats, accumulators
+
+
+def simulate(
+    runs,
+    processes,
+    algorithms=("sjf", "rr"),
+    quantum=2,
+    arrival="saturated",
+    burst="exponential",
+    seed=0,
+    max_workers=None,
+):
+    """
+    Run ``runs`` random workloads under every algorithm, in parallel.
+
+    Run i always uses the workload seeded with (seed, i), so results do not
+    depend on the number of workers.
+
+    Args:
+        runs (int): Number of random workloads.
+        processes (int): Processes per workload.
+        algorithms (list): Algorithm names accepted by run_algorithm.
+        quantum (int): Quantum used for 'rr'.
+        arrival (str): Arrival profile, one of benchmark.ARRIVAL_DENSITIES.
+        burst (str): Burst distribution, 'uniform' or 'exponential'.
+        seed (int): Base seed.
+        max_workers (int, optional): Pool size, defaults to the CPU count.
+
+    Returns:
+        dict: {algorithm: {'awt'|'ata'|'art': RunningStats}}
+    """
+    totals, _ = _simulate(
+        runs, processes, algorithms, quantum, arrival, burst, seed, max_workers, False
+    )
+    return totals
+
+
+def simulate_percentiles(
+    runs,
+    processes,
+    algorithms=("sjf", "rr"),
+    quantum=2,
+    arrival="saturated",
+    burst="exponential",
+    seed=0,
+    max_workers=None,
+):
+    """
+    Like simulate, and also add every process of every run to a quantile
+    sketch per algorithm.
+
+    Returns:
+        tuple: (totals as returned by simulate, {algorithm: MetricsAccumulator})
+    """
+    return _simulate(
+        runs, processes, algorithms, quantum, arrival, burst, seed, max_workers, True
+    )
+
+
+def _simulate(runs, processes, algorithms, quantum, arrival, burst, seed, max_workers, percentiles):
+    config = {
+        "processes": processes,
+        "algorithms": list(algorithms),
+        "quantum": quantum,
+        "arrival": arrival,
+        "burst": burst,
+        "seed": seed,
+        "percentiles": percentiles,
+    }
+    workers = max(1, min(max_workers or os.cpu_count() or 1, runs))
+    chunk = max(1, math.ceil(runs / (workers * 4)))
+    tasks = [(start, min(start + chunk, runs), config) for start in range(0, runs, chunk)]
+
+    totals = {
+        algorithm: {metric: RunningStats() for metric in METRICS}
+        for algorithm in algorithms
+    }
+    accumulators = (
+        {algorithm: MetricsAccumulator() for algorithm in algorithms} if percentiles else None
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial, partial_accumulators in executor.map(_simulate_chunk, tasks):
+            for algorithm, per_metric in partial.items():
+                for metric, stats in per_metric.items():
+                    totals[algorithm][metric].merge(stats)
+            if percentiles:
+                for algorithm, accumulator in partial_accumulators.items():
+                    accumulators[algorithm].merge(accumulator)
+    return totals, accumulators
+
+
+def summarize(totals, level=0.95):
+    """
+    Returns:
+        list: One row per (algorithm, metric) with count, mean, variance and CI bounds.
+    """
+    rows = []
+    for algorithm, per_metric in totals.items():
+        for metric, stats in per_metric.items():
+            low, high = stats.confidence_interval(level)
+            rows.append(
+                {
+                    "algorithm": algorithm,
+                    "metric": metric,
+                    "runs": stats.count,
+                    "mean": stats.mean,
+                    "variance": stats.variance,
+                    "ci_low": low,
+                    "ci_high": high,
+                }
+            )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo batch simulation.")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=10)
+    parser.add_argument("--algorithms", type=lambda s: s.split(","), default=["sjf", "rr"])
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--arrival", choices=sorted(ARRIVAL_DENSITIES), default="saturated")
+    parser.add_argument("--burst", choices=["uniform", "exponential"], default="exponential")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print rows as JSON")
+    parser.add_argument(
+        "--percentiles", action="store_true", help="also report per-process p50/p95/p99 over all runs"
+    )
+    args = parser.parse_args(argv)
+
+    totals, accumulators = _simulate(
+        args.runs,
+        args.processes,
+        args.algorithms,
+        args.quantum,
+        args.arrival,
+        args.burst,
+        args.seed,
+        args.workers,
+        args.percentiles,
+    )
+    rows = summarize(totals, args.confidence)
+    if args.json:
+        if accumulators is not None:
+            rows = {
+                "rows": rows,
+                "percentiles": {
+                    algorithm: accumulator.summary()
+                    for algorithm, accumulator in accumulators.items()
+                },
+            }
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    pct = f"{args.confidence:.0%}"
+    print(f"{'algorithm':<10}{'metric':<8}{'mean':>12}{'variance':>14}   {pct} CI")
+    for row in rows:
+        print(
+            f"{row['algorithm']:<10}{row['metric'].upper():<8}{row['mean']:>12.3f}"
+            f"{row['variance']:>14.3f}   [{row['ci_low']:.3f}, {row['ci_high']:.3f}]"
+        )
+    if accumulators is not None:
+        for algorithm, accumulator in accumulators.items():
+            print(f"\n{algorithm} per-process percentiles over {len(accumulator)} processes:")
+            print(format_summary(accumulator.summary()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Animated replay of a schedule with a sliding time window.
+
+    python3 src/replay.py trace.csv --algorithm srtf
+    python3 src/replay.py --random 1000000 --algorithm rr --quantum 4 --window 2000
+
+The chart shows one page of ``window`` time units at a time while a playhead
+sweeps across it. Segments are read from the schedule as the playhead passes
+them and painted into a screen-sized image, so each frame only touches the
+pixels of the time that has just elapsed and the cost of a frame does not
+depend on the schedule's length. When the playhead reaches the right edge,
+the page slides forward and only then is the whole figure redrawn.
+
+Keys: space pauses, left/right jump half a window, home/end go to the
+start/end.
+"""
+
+import argparse
+import itertools
+import math
+import sys
+
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
+from matplotlib.colors import to_rgba
+
+from schedule import as_schedule
+from visualizer import MAX_LABELLED_ROWS, merge_segments
+
+DEFAULT_FPS = 30
+# Part of the window that stays in view when the page slides forward.
+PAGE_OVERLAP = 0.25
+# Seconds the playhead takes to cross one window at the default speed.
+DEFAULT_WINDOW_SECONDS = 5
+
+_PALETTE = (np.array([to_rgba(f"C{i}") for i in range(10)]) * 255).astype(np.uint8)
+
+
+class _PixelLayer(Artist):
+    """
+    An RGBA buffer exactly the size of the axes, drawn without resampling.
+
+    ``pixels`` has the bottom row first, like the axes' y axis.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pixels = None
+
+    def draw(self, renderer):
+        if self.pixels is None or not self.get_visible():
+            return
+        bbox = self.axes.bbox
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(bbox)
+        renderer.draw_image(gc, round(bbox.x0), round(bbox.y0), self.pixels)
+        gc.restore()
+        self.stale = False
+
+
+class GanttReplay:
+    """
+    Plays a schedule back on ``ax`` with a blitted FuncAnimation.
+
+    Args:
+        ax (matplotlib.axes.Axes): Target axes.
+        schedule (Schedule or list): The schedule to replay.
+        window (float, optional): Width of the visible time window. Defaults
+            to a tenth of the schedule's span.
+        speed (float, optional): Time units played per second. Defaults to
+            one window every DEFAULT_WINDOW_SECONDS seconds.
+        fps (int): Frames per second.
+    """
+
+    def __init__(self, ax, schedule, window=None, speed=None, fps=DEFAULT_FPS):
+        self.ax = ax
+        self.schedule = as_schedule(schedule)
+        self.fps = fps
+        self.rows = len(self.schedule.pids)
+        if len(self.schedule):
+            self.t_min = int(self.schedule.start[0])
+            self.t_max = int(self.schedule.end[-1])
+        else:
+            self.t_min = self.t_max = 0
+        span = max(self.t_max - self.t_min, 1)
+        self.window = window if window is not None else max(span / 10, 1)
+        self.speed = speed if speed is not None else self.window / DEFAULT_WINDOW_SECONDS
+        self.time = self.t_min
+        self.paused = False
+        self._page = None
+
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Processes")
+        ax.set_ylim(-0.5, self.rows - 0.5)
+        if self.rows <= MAX_LABELLED_ROWS:
+            ax.set_yticks(range(self.rows), self.schedule.pids)
+        self._image = _PixelLayer()
+        self._image.set_animated(True)
+        ax.add_artist(self._image)
+        self._playhead = ax.axvline(self.time, color="black", linewidth=1, animated=True)
+        self._label = ax.text(
+            0.01, 0.97, "", transform=ax.transAxes, va="top", fontsize="small", animated=True
+        )
+
+        fig = ax.figure
+        fig.canvas.mpl_connect("key_press_event", self._on_key)
+        self.animation = FuncAnimation(
+            fig,
+            self._frame,
+            frames=itertools.count(),
+            init_func=self._init,
+            interval=1000 / fps,
+            blit=True,
+            cache_frame_data=False,
+        )
+
+    def seek(self, time):
+        """
+        Move the playhead to ``time``; the page is rebuilt on the next frame.
+        """
+        self.time = min(max(time, self.t_min), self.t_max)
+        self._page = None
+
+    def _init(self):
+        # Also called by the animation after a resize, when the image has to
+        # be rebuilt at the new size.
+        bbox = self.ax.bbox
+        self._width = max(round(bbox.width), 1)
+        self._height = max(round(bbox.height), 1)
+        self._page = None
+        return self._image, self._playhead, self._label
+
+    def _frame(self, _):
+        previous = self.time
+        if not self.paused and self.time < self.t_max:
+            self.time = min(self.time + self.speed / self.fps, self.t_max)
+
+        if self._page is None or self.time > self._page + self.window:
+            self._turn_page()
+        elif self.time > previous:
+            self._paint(previous, self.time)
+
+        self._image.pixels = self._pixels
+        self._playhead.set_xdata([self.time, self.time])
+        state = " (paused)" if self.paused else ""
+        self._label.set_text(f"t = {self.time:g} / {self.t_max}{state}")
+        return self._image, self._playhead, self._label
+
+    def _turn_page(self):
+        # Slide the window so the playhead starts a new page with the end of
+        # the previous one still in view, and repaint what has been played of it.
+        if self._page is None:
+            page = self.time - self.window * (1 - PAGE_OVERLAP)
+        else:
+            page = self.time - self.window * PAGE_OVERLAP
+        self._page = max(page, self.t_min)
+        self._pixels = np.zeros((self._height, self._width, 4), dtype=np.uint8)
+        self.ax.set_xlim(self._page, self._page + self.window)
+        self._paint(self._page, self.time)
+        # The axis ticks changed, which blitting cannot update; redraw the
+        # static parts once for the new page.
+        self.ax.figure.canvas.draw()
+
+    def _paint(self, t0, t1):
+        # Paint the part of every segment that falls into [t0, t1).
+        schedule = self.schedule
+        start, end = schedule.start, schedule.end
+        # Integer keys, so numpy does not convert the columns to float.
+        first = int(np.searchsorted(end, np.int64(math.floor(t0)), "right"))
+        last = int(np.searchsorted(start, np.int64(math.ceil(t1)), "left"))
+        if first >= last:
+            return
+        index = schedule.index[first:last]
+        x0 = np.maximum(start[first:last], t0)
+        x1 = np.minimum(end[first:last], t1)
+
+        pixel = self.window / self._width
+        row_pixels = self._height / max(self.rows, 1)
+        if row_pixels >= 1:
+            # Bars 0.4 rows high around each process's row, as in draw_gantt.
+            key, x0, x1 = merge_segments(index, x0, x1, pixel)
+            y0 = ((key + 0.3) * row_pixels).astype(np.int64)
+            y1 = np.maximum(y0 + 1, np.ceil((key + 0.7) * row_pixels).astype(np.int64))
+        else:
+            # With more processes than pixel rows, processes sharing a pixel
+            # row are merged like segments of one process.
+            bands = ((index + 0.5) * row_pixels).astype(np.int64)
+            key, x0, x1 = merge_segments(bands, x0, x1, pixel)
+            y0, y1 = key, key + 1
+        colors = _PALETTE[key % 10]
+        px0 = np.clip(((x0 - self._page) / pixel).astype(np.int64), 0, self._width - 1)
+        px1 = np.clip(np.ceil((x1 - self._page) / pixel).astype(np.int64), px0 + 1, self._width)
+        y0 = np.clip(y0, 0, self._height - 1)
+        y1 = np.clip(y1, y0 + 1, self._height)
+
+        # Expand every rectangle into its pixels and fill them in one go.
+        widths = px1 - px0
+        areas = widths * (y1 - y0)
+        rect = np.repeat(np.arange(len(areas)), areas)
+        offsets = np.arange(len(rect)) - np.repeat(np.cumsum(areas) - areas, areas)
+        self._pixels[y0[rect] + offsets // widths[rect], px0[rect] + offsets % widths[rect]] = colors[rect]
+
+    def _on_key(self, event):
+        if event.key == " ":
+            self.paused = not self.paused
+        elif event.key == "right":
+            self.seek(self.time + self.window / 2)
+        elif event.key == "left":
+            self.seek(self.time - self.window / 2)
+        elif event.key == "home":
+            self.seek(self.t_min)
+        elif event.key == "end":
+            self.seek(self.t_max)
+
+
+def replay(schedule, title=None, window=None, speed=None, fps=DEFAULT_FPS):
+    """
+    Open a window that replays a schedule. Blocks until it is closed.
+
+    See GanttReplay for the arguments.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 4))
+    if title:
+        ax.set_title(title, fontsize="small", wrap=True)
+    fig.tight_layout()
+    player = GanttReplay(ax, schedule, window, speed, fps)
+    plt.show()
+    return player
+
+
+def main(argv=None):
+    from algorithms import run_algorithm
+
+    parser = argparse.ArgumentParser(description="Replay a schedule as an animated Gantt chart.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("workload", nargs="?", help="workload file (.psw, .csv or .json)")
+    source.add_argument("--random", type=int, metavar="N", help="use a synthetic workload of N processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-a", "--algorithm", default="srtf")
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="time quantum for RR")
+    parser.add_argument("--window", type=float, default=None, help="visible time units")
+    parser.add_argument("--speed", type=float, default=None, help="time units per second")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS)
+    args = parser.parse_args(argv)
+
+    if args.random is not None:
+        from benchmark import make_workload
+
+        processes = make_workload(args.random, seed=args.seed)
+    else:
+        from traces import load_workload
+
+        processes = load_workload(args.workload)
+
+    quantum = args.quantum if args.algorithm == "rr" else None
+    schedule, _, _ = run_algorithm(processes, args.algorithm, quantum)
+    replay(schedule, f"{args.algorithm.upper()} replay", args.window, args.speed, args.fps)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+from array import array
+
+import numpy as np
+
+
+class Schedule:
+    """
+    Gantt chart segments stored as three int64 arrays.
+
+    Segment i runs process ``pids[index[i]]`` from ``start[i]`` to ``end[i]``.
+    The pid table is normally the ``pids`` list of the Workload the schedule
+    was produced from, so indices line up with workload rows.
+
+    Iterating yields ``(pid, start, end)`` tuples and integer indexing returns
+    one such tuple; slicing returns a new Schedule. Use ``as_dicts()`` for code
+    that expects the old ``[{'process', 'start', 'end'}, ...]`` lists.
+
+    The ``index``, ``start`` and ``end`` properties are read-only NumPy
+    copies, made on first access and reused until the next ``append``, so
+    holding on to them never stops the schedule from growing.
+
+    Args:
+        pids (list): Pid table the segment indices refer to.
+    """
+
+    def __init__(self, pids):
+        self.pids = pids
+        self._index = array("q")
+        self._start = array("q")
+        self._end = array("q")
+        self._arrays = None
+
+    @classmethod
+    def from_arrays(cls, pids, index, start, end):
+        """
+        Build a schedule from equally long integer sequences.
+
+        Args:
+            pids (list): Pid table the segment indices refer to.
+            index (array-like): Pid index of each segment.
+            start (array-like): Start time of each segment.
+            end (array-like): End time of each segment.
+
+        Returns:
+            Schedule: A new schedule holding a copy of the data.
+        """
+        schedule = cls(pids)
+        for target, values in (
+            (schedule._index, index),
+            (schedule._start, start),
+            (schedule._end, end),
+        ):
+            target.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        if not len(schedule._index) == len(schedule._start) == len(schedule._end):
+            raise ValueError("index, start and end must be of equal length")
+        return schedule
+
+    @classmethod
+    def from_dicts(cls, segments, pids=None):
+        """
+        Build a schedule from the old list-of-dicts format.
+
+        Args:
+            segments (list): List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+            pids (list, optional): Pid table to use. Defaults to the pids in
+                order of first appearance; pids missing from a given table
+                are appended to it.
+
+        Returns:
+            Schedule: The equivalent schedule.
+        """
+        pids = [] if pids is None else list(pids)
+        index_of = {pid: i for i, pid in enumerate(pids)}
+        schedule = cls(pids)
+        for s in segments:
+            pid = s["process"]
+            if pid not in index_of:
+                index_of[pid] = len(pids)
+                pids.append(pid)
+            schedule.append(index_of[pid], s["start"], s["end"])
+        return schedule
+
+    def append(self, index, start, end, merge=False):
+        """
+        Add a segment.
+
+        Args:
+            index (int): Pid index of the process.
+            start (int): Segment start time.
+            end (int): Segment end time.
+            merge (bool): If True and the last segment belongs to the same
+                process and ends at ``start``, extend it instead of adding a
+                new segment.
+        """
+        self._arrays = None
+        if merge and self._index and self._index[-1] == index and self._end[-1] == start:
+            self._end[-1] = end
+            return
+        self._index.append(index)
+        self._start.append(start)
+        self._end.append(end)
+
+    def _columns(self):
+        # A view of an array.array would pin its buffer, and the next append
+        # would raise BufferError; copies do not.
+        if self._arrays is None:
+            arrays = tuple(
+                np.frombuffer(column, dtype=np.int64).copy()
+                for column in (self._index, self._start, self._end)
+            )
+            for column in arrays:
+                column.flags.writeable = False
+            self._arrays = arrays
+        return self._arrays
+
+    @property
+    def index(self):
+        return self._columns()[0]
+
+    @property
+    def start(self):
+        return self._columns()[1]
+
+    @property
+    def end(self):
+        return self._columns()[2]
+
+    @property
+    def nbytes(self):
+        return 3 * self._index.itemsize * len(self._index)
+
+    def as_dicts(self):
+        """
+        Returns:
+            list: List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+        """
+        return [{"process": pid, "start": start, "end": end} for pid, start, end in self]
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        pids = self.pids
+        for i, start, end in zip(self._index, self._start, self._end):
+            yield pids[i], start, end
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            sliced = Schedule(self.pids)
+            sliced._index = self._index[key]
+            sliced._start = self._start[key]
+            sliced._end = self._end[key]
+            return sliced
+        return self.pids[self._index[key]], self._start[key], self._end[key]
+
+    def __repr__(self):
+        return f"Schedule(segments={len(self)})"
+
+
+def as_schedule(schedule, pids=None):
+    """
+    Return ``schedule`` as a Schedule, converting a list of dicts if needed.
+
+    Args:
+        schedule (list or Schedule): Schedule to adapt.
+        pids (list, optional): Pid table used when converting a list of dicts.
+
+    Returns:
+        Schedule: ``schedule`` itself if it already is one, otherwise a new Schedule.
+    """
+    if isinstance(schedule, Schedule):
+        return schedule
+    return Schedule.from_dicts(schedule, pids)
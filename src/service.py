@@ -0,0 +1,430 @@
+"""
+Local simulation service over HTTP, built on asyncio and the standard library.
+
+    python3 src/service.py --port 8765
+    python3 src/service.py --unix /tmp/scheduler.sock
+
+POST /simulate with a JSON body such as
+
+    {"processes": [{"pid": "p1", "arrival_time": 0, "burst_time": 5}, ...],
+     "algorithm": "rr", "quantum": 4}
+
+(or columnar "pids", "arrival_time", "burst_time" and optional "priority"
+lists instead of "processes"). Optional fields: "min_granularity" and
+"target_latency" for CFS, "aging_interval" for priority, "segments": false
+to skip the schedule, "per_process": true for per-process metrics. The
+response is streamed as newline-delimited JSON with chunked transfer
+encoding:
+
+    {"type": "metrics", "awt": ..., "ata": ..., "art": ..., "segments": n, ...}
+    {"type": "segments", "segments": [[pid, start, end], ...]}   (repeated)
+    {"type": "done"}
+
+Invalid requests (malformed JSON, an unknown algorithm, RR without a
+positive integer quantum, non-integer options, a process whose pid is not a
+string or whose times are not integers) are answered with status 400 and
+{"error": ...}; errors during the simulation produce a single
+{"type": "error", "message": ...} line.
+
+Concurrent requests are collected for a few milliseconds and sent to the
+process pool as one batch, identical requests that are still running share
+one simulation, and recent results are kept in a ResultCache. GET /stats
+reports the service counters.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms import run_algorithm
+from cache import ResultCache, result_key
+from metrics import compute_metrics
+from workload import Workload
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_DELAY = 0.002
+SEGMENT_CHUNK = 10_000
+MAX_BODY = 1 << 30
+_OPTIONS = ("min_granularity", "target_latency", "aging_interval")
+ALGORITHMS = ("fcfs", "sjf", "srtf", "ljf", "rr", "cfs", "priority")
+
+
+def _run_batch(jobs):
+    # Runs in a pool worker: simulate every (workload, algorithm, quantum,
+    # options) job and return (ok, result or message) per job. Any error is
+    # kept with its job so it cannot fail the other jobs of the batch.
+    results = []
+    for workload, algorithm, quantum, options in jobs:
+        try:
+            results.append((True, run_algorithm(workload, algorithm, quantum, **options)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+class _Batcher:
+    """
+    Groups jobs submitted within ``delay`` seconds (at most ``size`` of them)
+    into one pool task.
+    """
+
+    def __init__(self, executor, size=DEFAULT_BATCH_SIZE, delay=DEFAULT_BATCH_DELAY):
+        self.executor = executor
+        self.size = size
+        self.delay = delay
+        self.batches = 0
+        self._jobs = []
+        self._futures = []
+        self._timer = None
+
+    def submit(self, job):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._jobs.append(job)
+        self._futures.append(future)
+        if len(self._jobs) >= self.size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.delay, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        jobs, futures = self._jobs, self._futures
+        self._jobs, self._futures = [], []
+        if not jobs:
+            return
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        batch = loop.run_in_executor(self.executor, _run_batch, jobs)
+        batch.add_done_callback(lambda done: self._deliver(done, futures))
+
+    @staticmethod
+    def _deliver(batch, futures):
+        error = batch.exception()
+        for i, future in enumerate(futures):
+            if future.cancelled():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch.result()[i])
+
+
+class SimulationService:
+    """
+    The request handling behind the HTTP server.
+
+    Args:
+        max_workers (int, optional): Pool size, defaults to the CPU count.
+        batch_size (int): Most jobs per pool task.
+        batch_delay (float): Seconds to wait for more jobs before sending a batch.
+        cache_bytes (int): Memory budget of the result cache; 0 disables it.
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        batch_delay=DEFAULT_BATCH_DELAY,
+        cache_bytes=64 * 2**20,
+    ):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+        self.batcher = _Batcher(self.executor, batch_size, batch_delay)
+        self.cache = ResultCache(max_bytes=cache_bytes) if cache_bytes else None
+        self.in_flight = {}
+        self.requests = 0
+        self.deduplicated = 0
+        self.errors = 0
+
+    async def simulate(self, workload, algorithm, quantum=None, **options):
+        """
+        Simulate through the cache, the in-flight table and the batcher.
+
+        Returns:
+            tuple: (schedule, waiting_times, avg_waiting_time)
+        """
+        self.requests += 1
+        # Hashing a large workload takes as long as parsing it; keep it off
+        # the event loop too.
+        key = await asyncio.to_thread(result_key, workload, algorithm, quantum, **options)
+        if self.cache is not None:
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+
+        pending = self.in_flight.get(key)
+        if pending is not None:
+            self.deduplicated += 1
+            ok, value = await asyncio.shield(pending)
+        else:
+            pending = self.batcher.submit((workload, algorithm, quantum, options))
+            self.in_flight[key] = pending
+            try:
+                ok, value = await asyncio.shield(pending)
+            finally:
+                del self.in_flight[key]
+            if ok and self.cache is not None:
+                self.cache.put(key, value)
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    def stats(self):
+        stats = {
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "errors": self.errors,
+            "batches": self.batcher.batches,
+            "in_flight": len(self.in_flight),
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    async def handle(self, reader, writer):
+        """
+        Serve HTTP/1.1 requests on one connection until it closes.
+        """
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._dispatch(writer, method, path, body)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError as e:
+            await _send(writer, 400, "application/json", json.dumps({"error": str(e)}).encode())
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer, method, path, body):
+        if method == "GET" and path == "/health":
+            await _send(writer, 200, "application/json", b'{"status": "ok"}')
+        elif method == "GET" and path == "/stats":
+            await _send(writer, 200, "application/json", json.dumps(self.stats()).encode())
+        elif method == "POST" and path == "/simulate":
+            await self._simulate_request(writer, body)
+        else:
+            await _send(writer, 404, "application/json", b'{"error": "not found"}')
+
+    async def _simulate_request(self, writer, body):
+        try:
+            # Parsing and the metrics are numpy-heavy; run them off the event
+            # loop so other connections keep being served.
+            request, workload = await asyncio.to_thread(_parse_request, body)
+        except (ValueError, KeyError, TypeError) as e:
+            self.errors += 1
+            message = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+            await _send(writer, 400, "application/json", json.dumps({"error": message}).encode())
+            return
+
+        _start_stream(writer)
+        try:
+            algorithm = request.get("algorithm", "fcfs")
+            quantum = request.get("quantum")
+            options = {name: request[name] for name in _OPTIONS if name in request}
+            schedule, _, _ = await self.simulate(workload, algorithm, quantum, **options)
+            metrics = await asyncio.to_thread(compute_metrics, schedule, workload)
+        except (ValueError, KeyError, TypeError, RuntimeError) as e:
+            # RuntimeError covers a broken process pool.
+            self.errors += 1
+            await _send_line(writer, {"type": "error", "message": str(e)})
+            await _end_stream(writer)
+            return
+
+        line = {"type": "metrics", "algorithm": algorithm, "quantum": quantum}
+        line.update(options)
+        line.update(metrics.averages())
+        line["processes"] = len(workload)
+        line["segments"] = len(schedule)
+        if request.get("per_process"):
+            for metric in ("waiting_time", "turnaround_time", "response_time", "completion_time"):
+                line[metric] = metrics.as_dict(metric)
+        await _send_line(writer, line)
+
+        if request.get("segments", True):
+            pids = schedule.pids
+            index, start, end = schedule.index, schedule.start, schedule.end
+            for i in range(0, len(schedule), SEGMENT_CHUNK):
+                chunk = slice(i, i + SEGMENT_CHUNK)
+                segments = [
+                    [pids[p], s, e]
+                    for p, s, e in zip(
+                        index[chunk].tolist(), start[chunk].tolist(), end[chunk].tolist()
+                    )
+                ]
+                await _send_line(writer, {"type": "segments", "segments": segments})
+        await _send_line(writer, {"type": "done"})
+        await _end_stream(writer)
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _parse_request(body):
+    # Everything that could make a worker loop or crash is rejected here,
+    # before the request reaches the pool.
+    request = json.loads(body)
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    algorithm = request.get("algorithm", "fcfs")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    quantum = request.get("quantum")
+    if algorithm == "rr" and not (_is_int(quantum) and quantum > 0):
+        raise ValueError("RR needs a positive integer quantum")
+    for name in _OPTIONS:
+        value = request.get(name)
+        if name in request and not (_is_int(value) or (name == "aging_interval" and value is None)):
+            raise ValueError(f"{name} must be an integer")
+    if "processes" in request:
+        processes = request["processes"]
+        if not isinstance(processes, list) or not all(isinstance(p, dict) for p in processes):
+            raise ValueError("processes must be a list of objects")
+        pids = [p["pid"] for p in processes]
+        arrivals = [p["arrival_time"] for p in processes]
+        bursts = [p["burst_time"] for p in processes]
+        priority = None
+        if any("priority" in p for p in processes):
+            priority = [p.get("priority", 0) for p in processes]
+    else:
+        pids, arrivals, bursts = request["pids"], request["arrival_time"], request["burst_time"]
+        priority = request.get("priority")
+        if not all(isinstance(column, list) for column in (pids, arrivals, bursts, priority or [])):
+            raise ValueError("pids, arrival_time, burst_time and priority must be lists")
+    # NumPy would silently truncate floats and parse numeric strings, so the
+    # JSON values are checked before the workload is built from them.
+    if not all(isinstance(pid, str) and pid for pid in pids):
+        raise ValueError("pid must be a non-empty string")
+    if not all(_is_int(arrival) and arrival >= 0 for arrival in arrivals):
+        raise ValueError("arrival_time must be a non-negative integer")
+    if not all(_is_int(burst) and burst > 0 for burst in bursts):
+        raise ValueError("burst_time must be a positive integer")
+    if priority is not None and not all(map(_is_int, priority)):
+        raise ValueError("priority must be an integer")
+    workload = Workload(pids, arrivals, bursts, priority)
+    return request, workload
+
+
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ValueError("malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY:
+        raise ValueError("request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+async def _send(writer, status, content_type, body):
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+        + body
+    )
+    await writer.drain()
+
+
+def _start_stream(writer):
+    writer.write(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/x-ndjson\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+    )
+
+
+async def _send_line(writer, obj):
+    data = json.dumps(obj).encode("utf-8") + b"\n"
+    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+    # Waiting for the buffer to drain keeps slow clients from piling up
+    # segments in memory.
+    await writer.drain()
+
+
+async def _end_stream(writer):
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, unix=None, **kwargs):
+    """
+    Run the service until cancelled. kwargs go to SimulationService.
+    """
+    service = SimulationService(**kwargs)
+    if unix is not None:
+        server = await asyncio.start_unix_server(service.handle, path=unix)
+        where = unix
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        where = f"http://{host}:{port}"
+    print(f"Serving on {where}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local simulation service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--batch-delay", type=float, default=DEFAULT_BATCH_DELAY)
+    parser.add_argument("--cache-mb", type=int, default=64, help="result cache size, 0 to disable")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.unix,
+                max_workers=args.workers,
+                batch_size=args.batch_size,
+                batch_delay=args.batch_delay,
+                cache_bytes=args.cache_mb * 2**20,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,362 @@
+"""
+Bounded-memory percentile and histogram summaries of per-process metrics.
+
+A MetricsAccumulator keeps, for waiting, turnaround and response time, a
+QuantileSketch and a fixed-bucket Histogram. Both have a size that does not
+depend on how many values were added, and two summaries built in different
+processes merge into the summary of all their values:
+
+    acc = MetricsAccumulator()
+    acc.add_metrics(compute_metrics(schedule, workload))   # batch algorithms
+    acc.consume(stream_algorithm(trace, "srtf"))           # streaming algorithms
+    acc.merge(other_worker_acc)
+    print(acc.summary())    # count, mean, min, max, p50, p95, p99 per metric
+
+The quantile sketch follows DDSketch (Masson et al., 2019): values are counted
+in logarithmically sized buckets, so every estimated quantile is within a
+relative error of ``relative_accuracy`` of a value at that rank.
+"""
+
+import math
+
+import numpy as np
+
+METRICS = ("waiting_time", "turnaround_time", "response_time")
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+# Completions buffered by consume() before they are added as arrays.
+_CONSUME_CHUNK = 65_536
+
+
+class _BucketStore:
+    """
+    Counts per integer bucket key in a dense array that grows as needed. When
+    it would exceed ``max_buckets``, the lowest keys are folded into one
+    bucket, which keeps the high quantiles accurate.
+    """
+
+    def __init__(self, max_buckets):
+        self.max_buckets = max_buckets
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.offset = 0
+
+    def add(self, keys, counts=None):
+        if not len(keys):
+            return
+        low, high = int(keys.min()), int(keys.max())
+        self._cover(low, high)
+        keys = np.maximum(keys, self.offset)
+        self.counts += np.bincount(keys - self.offset, weights=counts, minlength=len(self.counts)).astype(np.int64)
+
+    def _cover(self, low, high):
+        if not len(self.counts):
+            self.offset = max(low, high - self.max_buckets + 1)
+            self.counts = np.zeros(high - self.offset + 1, dtype=np.int64)
+            return
+        new_low = min(low, self.offset)
+        new_high = max(high, self.offset + len(self.counts) - 1)
+        if new_high - new_low + 1 > self.max_buckets:
+            new_low = new_high - self.max_buckets + 1
+        if new_low == self.offset and new_high == self.offset + len(self.counts) - 1:
+            return
+        counts = np.zeros(new_high - new_low + 1, dtype=np.int64)
+        # Buckets below the new range collapse into its lowest bucket.
+        cut = max(new_low - self.offset, 0)
+        collapsed = int(self.counts[:cut].sum())
+        kept = self.counts[cut:]
+        start = self.offset + cut - new_low
+        counts[start : start + len(kept)] = kept
+        counts[0] += collapsed
+        self.counts = counts
+        self.offset = new_low
+
+    def merge(self, other):
+        if not len(other.counts):
+            return
+        keys = np.arange(other.offset, other.offset + len(other.counts))
+        nonzero = other.counts > 0
+        self.add(keys[nonzero], other.counts[nonzero])
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Memory is bounded by ``max_buckets`` per sign; with the default 1 %
+    accuracy, 2048 buckets cover values from 1 to about 10^17 without any
+    collapsing.
+
+    Args:
+        relative_accuracy (float): Bound on the relative error of quantiles.
+        max_buckets (int): Most buckets kept for positive (and for negative)
+            values.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_buckets=DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._positive = _BucketStore(max_buckets)
+        self._negative = _BucketStore(max_buckets)
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, values):
+        """
+        Add one value or an array of values.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        positive = values[values > 0]
+        negative = values[values < 0]
+        self.zero_count += len(values) - len(positive) - len(negative)
+        self._positive.add(self._keys(positive))
+        self._negative.add(self._keys(-negative))
+
+    def _keys(self, magnitudes):
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def _value(self, key):
+        # Midpoint of bucket (gamma^(key-1), gamma^key] in the relative sense.
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+    def merge(self, other):
+        """
+        Add every value summarised by ``other``, a sketch of the same accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Returns:
+            float: The estimate, or NaN if the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return math.nan
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+
+        negative = self._negative
+        negative_total = negative.total
+        if rank < negative_total:
+            # Negative values are ordered by decreasing magnitude.
+            cumulative = np.cumsum(negative.counts[::-1])
+            i = int(np.searchsorted(cumulative, rank, "right"))
+            key = negative.offset + len(negative.counts) - 1 - i
+            return max(-self._value(key), self.min)
+        rank -= negative_total
+        if rank < self.zero_count:
+            return 0.0
+        rank -= self.zero_count
+
+        positive = self._positive
+        cumulative = np.cumsum(positive.counts)
+        i = min(int(np.searchsorted(cumulative, rank, "right")), len(cumulative) - 1)
+        return min(self._value(positive.offset + i), self.max)
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else math.nan
+
+    @property
+    def nbytes(self):
+        return self._positive.counts.nbytes + self._negative.counts.nbytes
+
+
+class Histogram:
+    """
+    Counts of values in fixed buckets. Bucket i holds edges[i-1] <= x < edges[i];
+    the first bucket catches everything below edges[0] and the last everything
+    from edges[-1] up.
+
+    Args:
+        edges (list): Increasing bucket edges.
+    """
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if len(self.edges) == 0 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("Histogram edges must be non-empty and increasing")
+        self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+
+    @classmethod
+    def exponential(cls, start=1, factor=2, count=48):
+        """
+        Edges 0, start, start * factor, ..., covering many orders of magnitude
+        with a few dozen buckets.
+        """
+        return cls([0] + [start * factor**i for i in range(count)])
+
+    @classmethod
+    def linear(cls, start, width, count):
+        """
+        ``count`` + 1 evenly spaced edges from ``start``.
+        """
+        return cls([start + width * i for i in range(count + 1)])
+
+    def add(self, values):
+        """
+        Add one value or an array of values.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        buckets = np.searchsorted(self.edges, values, "right")
+        self.counts += np.bincount(buckets, minlength=len(self.counts))
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different edges")
+        self.counts += other.counts
+
+    def buckets(self):
+        """
+        Returns:
+            list: (low, high, count) per bucket; the outer buckets extend to
+            -inf and inf.
+        """
+        bounds = [-math.inf] + self.edges.tolist() + [math.inf]
+        return list(zip(bounds[:-1], bounds[1:], self.counts.tolist()))
+
+
+class MetricsAccumulator:
+    """
+    Constant-memory summary of the per-process waiting, turnaround and
+    response times of any number of schedules.
+
+    Args:
+        relative_accuracy (float): Quantile accuracy, see QuantileSketch.
+        edges (list, optional): Histogram bucket edges, defaults to
+            Histogram.exponential().
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, edges=None):
+        self.sketches = {metric: QuantileSketch(relative_accuracy) for metric in METRICS}
+        self.histograms = {
+            metric: Histogram(edges) if edges is not None else Histogram.exponential()
+            for metric in METRICS
+        }
+
+    def add(self, waiting_time, turnaround_time, response_time):
+        """
+        Add the metrics of one process or arrays of them.
+        """
+        for metric, values in zip(METRICS, (waiting_time, turnaround_time, response_time)):
+            self.sketches[metric].add(values)
+            self.histograms[metric].add(values)
+
+    def add_metrics(self, metrics):
+        """
+        Add every process of a metrics.Metrics.
+        """
+        self.add(metrics.waiting_time, metrics.turnaround_time, metrics.response_time)
+
+    def consume(self, events):
+        """
+        Add the Completion records of a streaming algorithm; other events
+        (segments) are skipped.
+
+        Args:
+            events (iterable): Events from streaming.stream_algorithm.
+
+        Returns:
+            int: Number of completions added.
+        """
+        from streaming import Completion
+
+        columns = ([], [], [])
+        added = 0
+        for event in events:
+            if isinstance(event, Completion):
+                columns[0].append(event.waiting_time)
+                columns[1].append(event.turnaround_time)
+                columns[2].append(event.response_time)
+                if len(columns[0]) >= _CONSUME_CHUNK:
+                    added += len(columns[0])
+                    self.add(*columns)
+                    columns = ([], [], [])
+        added += len(columns[0])
+        self.add(*columns)
+        return added
+
+    def merge(self, other):
+        """
+        Add everything summarised by ``other``, e.g. a worker's accumulator.
+        """
+        for metric in METRICS:
+            self.sketches[metric].merge(other.sketches[metric])
+            self.histograms[metric].merge(other.histograms[metric])
+
+    def quantile(self, metric, q):
+        """
+        Args:
+            metric (str): 'waiting_time', 'turnaround_time' or 'response_time'.
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Estimated quantile.
+        """
+        return self.sketches[metric].quantile(q)
+
+    def summary(self, quantiles=DEFAULT_QUANTILES):
+        """
+        Returns:
+            dict: {metric: {'count', 'mean', 'min', 'max', 'p50', ...}}.
+            Quantile keys are 'p' plus the percentage, e.g. 'p99' or 'p99.9'.
+        """
+        summary = {}
+        for metric in METRICS:
+            sketch = self.sketches[metric]
+            row = {"count": sketch.count, "mean": sketch.mean, "min": sketch.min, "max": sketch.max}
+            for q in quantiles:
+                row[f"p{q * 100:g}"] = sketch.quantile(q)
+            summary[metric] = row
+        return summary
+
+    def __len__(self):
+        return self.sketches[METRICS[0]].count
+
+
+def format_summary(summary):
+    """
+    Returns:
+        str: One line per metric, e.g. 'WT: mean=4.20 p50=3.00 p95=9.98 ...'.
+    """
+    labels = {"waiting_time": "WT", "turnaround_time": "TAT", "response_time": "RT"}
+    lines = []
+    for metric, row in summary.items():
+        values = " ".join(
+            f"{name}={value:.2f}" for name, value in row.items() if name not in ("count", "min")
+        )
+        lines.append(f"{labels.get(metric, metric)}: {values}")
+    return "\n".join(lines)
@@ -0,0 +1,294 @@
+"""
+Online versions of the scheduling algorithms.
+
+Each generator consumes processes from an iterator that is ordered by arrival
+time and yields events as soon as they are final:
+
+- Segment(process, start, end): one Gantt chart bar.
+- Completion(process, arrival_time, burst_time, first_start, completion_time):
+  emitted once a process has finished, after its last segment.
+
+Only processes that have arrived and not yet finished are kept in memory (plus
+one process of lookahead), so arbitrarily long traces can be replayed. Fed
+with a list sorted by arrival time, the segments are exactly those of the
+batch algorithms in algorithms.py.
+"""
+
+import heapq
+from collections import deque, namedtuple
+
+Segment = namedtuple("Segment", ["process", "start", "end"])
+
+
+class Completion(
+    namedtuple(
+        "Completion",
+        ["process", "arrival_time", "burst_time", "first_start", "completion_time"],
+    )
+):
+    __slots__ = ()
+
+    @property
+    def turnaround_time(self):
+        return self.completion_time - self.arrival_time
+
+    @property
+    def waiting_time(self):
+        return self.turnaround_time - self.burst_time
+
+    @property
+    def response_time(self):
+        return self.first_start - self.arrival_time
+
+
+class _Arrivals:
+    """
+    Arrival-ordered process feed with one item of lookahead.
+
+    Items are (index, pid, arrival_time, burst_time) tuples where index is the
+    position in the stream, used for tie-breaking like the batch algorithms.
+    """
+
+    def __init__(self, processes):
+        self._iterator = iter(processes)
+        self._index = 0
+        self._last_arrival = None
+        self.peeked = None
+        self._advance()
+
+    def _advance(self):
+        try:
+            p = next(self._iterator)
+        except StopIteration:
+            self.peeked = None
+            return
+        arrival = p["arrival_time"]
+        if self._last_arrival is not None and arrival < self._last_arrival:
+            raise ValueError(
+                f"Processes must be ordered by arrival time: {p['pid']} arrives "
+                f"at {arrival} after a process arriving at {self._last_arrival}"
+            )
+        self._last_arrival = arrival
+        self.peeked = (self._index, p["pid"], arrival, p["burst_time"])
+        self._index += 1
+
+    @property
+    def next_time(self):
+        return None if self.peeked is None else self.peeked[2]
+
+    def arrived(self, current_time):
+        """Yield every remaining process that has arrived by ``current_time``."""
+        while self.peeked is not None and self.peeked[2] <= current_time:
+            item = self.peeked
+            self._advance()
+            yield item
+
+
+def stream_fcfs(processes):
+    """
+    Online First-Come-First-Serve.
+
+    Args:
+        processes (iterable): Process dicts with 'pid', 'arrival_time',
+            'burst_time', ordered by arrival time.
+
+    Yields:
+        Segment and Completion records.
+    """
+    current_time = 0
+    feed = _Arrivals(processes)
+    while feed.peeked is not None:
+        _, pid, arrival, burst = next(feed.arrived(feed.next_time))
+        start_time = max(current_time, arrival)
+        current_time = start_time + burst
+        yield Segment(pid, start_time, current_time)
+        yield Completion(pid, arrival, burst, start_time, current_time)
+
+
+def _stream_non_preemptive(processes, key):
+    current_time = 0
+    ready_queue = []
+    feed = _Arrivals(processes)
+
+    while feed.peeked is not None or ready_queue:
+        for item in feed.arrived(current_time):
+            heapq.heappush(ready_queue, (key(item), item))
+
+        if not ready_queue:
+            current_time = feed.next_time
+            continue
+
+        _, (_, pid, arrival, burst) = heapq.heappop(ready_queue)
+        start_time = max(current_time, arrival)
+        current_time = start_time + burst
+        yield Segment(pid, start_time, current_time)
+        yield Completion(pid, arrival, burst, start_time, current_time)
+
+
+def stream_sjf(processes):
+    """
+    Online Shortest Job First (non-preemptive). See stream_fcfs for arguments.
+    """
+    return _stream_non_preemptive(processes, lambda item: (item[3], item[0]))
+
+
+def stream_ljf(processes):
+    """
+    Online Longest Job First (non-preemptive). See stream_fcfs for arguments.
+    """
+    return _stream_non_preemptive(processes, lambda item: (-item[3], item[2], item[0]))
+
+
+def stream_srtf(processes):
+    """
+    Online Shortest Remaining Time First, including the P1 first-tick rule of
+    algorithms.srtf. See stream_fcfs for arguments.
+    """
+    feed = _Arrivals(processes)
+    # index -> [pid, arrival, burst, remaining, first_start]
+    live = {}
+    ready_queue = []
+    # [index, start, end] of the last segment, which may still be extended.
+    pending = None
+    current_time = 0
+
+    def admit(items):
+        for index, pid, arrival, burst in items:
+            if burst <= 0:
+                yield Completion(pid, arrival, burst, arrival, arrival)
+                continue
+            live[index] = [pid, arrival, burst, burst, None]
+            heapq.heappush(ready_queue, (burst, index))
+
+    def run(index, start, end):
+        # Extend the pending segment or replace it, returning the one to emit.
+        nonlocal pending
+        state = live[index]
+        if state[4] is None:
+            state[4] = start
+        state[3] -= end - start
+        if pending is not None and pending[0] == index and pending[2] == start:
+            pending[2] = end
+            return None
+        finished, pending = pending, [index, start, end]
+        return finished
+
+    def finish(index, completion_time):
+        # A completed process's segment can no longer grow, so flush it too.
+        nonlocal pending
+        pid, arrival, burst, _, first_start = live.pop(index)
+        segment = Segment(pid, pending[1], pending[2])
+        pending = None
+        return segment, Completion(pid, arrival, burst, first_start, completion_time)
+
+    yield from admit(feed.arrived(0))
+
+    # If P1 arrived at t=0 and has work to do, run it for the first time unit.
+    p1_index = min(
+        (index for _, index in ready_queue if live[index][0].lower() == "p1"),
+        default=None,
+    )
+    if p1_index is not None:
+        ready_queue.remove((live[p1_index][3], p1_index))
+        heapq.heapify(ready_queue)
+        run(p1_index, 0, 1)
+        current_time = 1
+        if live[p1_index][3] == 0:
+            yield from finish(p1_index, current_time)
+        else:
+            heapq.heappush(ready_queue, (live[p1_index][3], p1_index))
+
+    while True:
+        yield from admit(feed.arrived(current_time))
+
+        if not ready_queue:
+            if feed.peeked is None:
+                break
+            current_time = feed.next_time
+            continue
+
+        remaining, index = heapq.heappop(ready_queue)
+
+        # Run until completion or until the next arrival may preempt.
+        run_until = current_time + remaining
+        if feed.peeked is not None:
+            run_until = min(run_until, feed.next_time)
+
+        finished = run(index, current_time, run_until)
+        if finished is not None:
+            yield Segment(live[finished[0]][0], finished[1], finished[2])
+        current_time = run_until
+
+        if live[index][3] == 0:
+            yield from finish(index, current_time)
+        else:
+            heapq.heappush(ready_queue, (live[index][3], index))
+
+
+def stream_rr(processes, quantum):
+    """
+    Online Round Robin.
+
+    Args:
+        processes (iterable): Process dicts with 'pid', 'arrival_time',
+            'burst_time', ordered by arrival time.
+        quantum (int): Time quantum.
+
+    Yields:
+        Segment and Completion records.
+    """
+    feed = _Arrivals(processes)
+    queue = deque()
+    current_time = feed.next_time or 0
+
+    while True:
+        for index, pid, arrival, burst in feed.arrived(current_time):
+            queue.append([pid, arrival, burst, burst, None])
+
+        if not queue:
+            if feed.peeked is None:
+                return
+            current_time = feed.next_time
+            continue
+
+        state = queue.popleft()
+        if state[4] is None:
+            state[4] = current_time
+        run_time = min(quantum, state[3])
+        yield Segment(state[0], current_time, current_time + run_time)
+
+        state[3] -= run_time
+        current_time += run_time
+
+        if state[3] == 0:
+            yield Completion(state[0], state[1], state[2], state[4], current_time)
+        else:
+            queue.append(state)
+
+
+def stream_algorithm(processes, algorithm, quantum=None):
+    """
+    Online counterpart of algorithms.run_algorithm.
+
+    Args:
+        processes (iterable): Process dicts ordered by arrival time.
+        algorithm (str): 'fcfs', 'sjf', 'srtf', 'ljf', or 'rr'.
+        quantum (int, optional): Time quantum for RR.
+
+    Returns:
+        generator: Segment and Completion records.
+    """
+    if algorithm == "fcfs":
+        return stream_fcfs(processes)
+    elif algorithm == "sjf":
+        return stream_sjf(processes)
+    elif algorithm == "srtf":
+        return stream_srtf(processes)
+    elif algorithm == "ljf":
+        return stream_ljf(processes)
+    elif algorithm == "rr":
+        if quantum is None:
+            raise ValueError("Quantum required for RR algorithm")
+        return stream_rr(processes, quantum)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
@@ -0,0 +1,201 @@
+"""
+Parallel parameter sweep over algorithms and RR quanta.
+
+Every (algorithm, quantum) pair is run in a process pool. The workload is
+copied once into a shared memory block that all workers map, so tasks only
+carry the algorithm name and quantum.
+
+    python3 src/sweep.py --random 100000 --algorithms fcfs,sjf,srtf,ljf,rr --quanta 1-64
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from algorithms import run_algorithm
+from metrics import compute_metrics
+from traces import load_workload
+from workload import Workload, as_workload
+
+ALGORITHMS = ["fcfs", "sjf", "srtf", "ljf", "rr", "cfs", "priority"]
+
+# Set in each worker by _attach_workload.
+_worker_workload = None
+_worker_shm = None
+
+
+def _pack_workload(workload):
+    """
+    Copy a workload into a new shared memory block.
+
+    Layout: arrival[n], burst[n], pid_offsets[n + 1] and, if the workload
+    has priorities, priority[n] as int64, followed by the UTF-8 encoded pids
+    back to back.
+
+    Returns:
+        tuple: (SharedMemory, n, pid_bytes_length, has_priority)
+    """
+    n = len(workload)
+    has_priority = workload.priority is not None
+    encoded = [pid.encode("utf-8") for pid in map(str, workload.pids)]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    pid_bytes = b"".join(encoded)
+
+    count = _int_count(n, has_priority)
+    header = count * 8
+    shm = shared_memory.SharedMemory(create=True, size=max(header + len(pid_bytes), 1))
+    ints = np.ndarray(count, dtype=np.int64, buffer=shm.buf)
+    ints[:n] = workload.arrival_time
+    ints[n : 2 * n] = workload.burst_time
+    ints[2 * n : 3 * n + 1] = offsets
+    if has_priority:
+        ints[3 * n + 1 :] = workload.priority
+    shm.buf[header : header + len(pid_bytes)] = pid_bytes
+    del ints
+    return shm, n, len(pid_bytes), has_priority
+
+
+def _int_count(n, has_priority):
+    return (4 * n + 1) if has_priority else (3 * n + 1)
+
+
+def _unpack_workload(shm, n, pid_length, has_priority=False):
+    count = _int_count(n, has_priority)
+    ints = np.ndarray(count, dtype=np.int64, buffer=shm.buf)
+    offsets = ints[2 * n : 3 * n + 1].tolist()
+    header = count * 8
+    raw = bytes(shm.buf[header : header + pid_length])
+    pids = [raw[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(n)]
+    priority = ints[3 * n + 1 :] if has_priority else None
+    return Workload(pids, ints[:n], ints[n : 2 * n], priority)
+
+
+def _attach_workload(name, n, pid_length, has_priority):
+    global _worker_workload, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=name)
+    _worker_workload = _unpack_workload(_worker_shm, n, pid_length, has_priority)
+
+
+def evaluate(workload, algorithm, quantum=None):
+    """
+    Run one configuration and summarise it as a table row.
+
+    Returns:
+        dict: {'algorithm', 'quantum', 'awt', 'ata', 'art', 'segments'}
+    """
+    schedule, _, _ = run_algorithm(workload, algorithm, quantum)
+    row = {"algorithm": algorithm, "quantum": quantum}
+    row.update(compute_metrics(schedule, workload).averages())
+    row["segments"] = len(schedule)
+    return row
+
+
+def _evaluate_shared(config):
+    return evaluate(_worker_workload, *config)
+
+
+def sweep_grid(algorithms, quanta):
+    """
+    Returns:
+        list: (algorithm, quantum) pairs; quantum is None for everything but RR.
+    """
+    return [
+        (algorithm, quantum)
+        for algorithm in algorithms
+        for quantum in (quanta if algorithm == "rr" else [None])
+    ]
+
+
+def sweep(processes, algorithms=ALGORITHMS, quanta=(2,), max_workers=None):
+    """
+    Evaluate a workload under every algorithm and every RR quantum in parallel.
+
+    Args:
+        processes (list or Workload): The workload to evaluate.
+        algorithms (list): Algorithm names accepted by run_algorithm.
+        quanta (list): Quanta to try for 'rr'.
+        max_workers (int, optional): Pool size, defaults to the CPU count.
+
+    Returns:
+        list: One row per configuration, in grid order, with keys
+            'algorithm', 'quantum', 'awt', 'ata', 'art' and 'segments'.
+    """
+    workload = as_workload(processes)
+    grid = sweep_grid(algorithms, quanta)
+    if not grid:
+        return []
+
+    shm, n, pid_length, has_priority = _pack_workload(workload)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(grid)),
+            initializer=_attach_workload,
+            initargs=(shm.name, n, pid_length, has_priority),
+        ) as executor:
+            return list(executor.map(_evaluate_shared, grid))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def format_table(rows):
+    """
+    Returns:
+        str: The sweep rows as an aligned text table.
+    """
+    lines = [f"{'algorithm':<10}{'quantum':>8}{'AWT':>14}{'ATA':>14}{'ART':>14}{'segments':>12}"]
+    for row in rows:
+        quantum = "-" if row["quantum"] is None else row["quantum"]
+        lines.append(
+            f"{row['algorithm']:<10}{quantum:>8}{row['awt']:>14.3f}"
+            f"{row['ata']:>14.3f}{row['art']:>14.3f}{row['segments']:>12}"
+        )
+    return "\n".join(lines)
+
+
+def parse_quanta(text):
+    """
+    Parse '1,2,4' or '1-64' (or a mix such as '1-8,16,32') into a list of ints.
+    """
+    quanta = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-")
+            quanta.extend(range(int(low), int(high) + 1))
+        else:
+            quanta.append(int(part))
+    return quanta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel sweep over algorithms and RR quanta.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("workload", nargs="?", help="workload file (.psw, .csv or .json)")
+    source.add_argument("--random", type=int, metavar="N", help="use a synthetic workload of N processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithms", type=lambda s: s.split(","), default=ALGORITHMS)
+    parser.add_argument("--quanta", type=parse_quanta, default=[2])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print rows as JSON")
+    args = parser.parse_args(argv)
+
+    if args.random is not None:
+        from benchmark import make_workload
+
+        processes = make_workload(args.random, seed=args.seed)
+    else:
+        processes = load_workload(args.workload)
+
+    rows = sweep(processes, args.algorithms, args.quanta, args.workers)
+    print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
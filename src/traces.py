@@ -0,0 +1,385 @@
+"""
+Bulk workload loading from CSV traces and a compact binary format.
+
+CSV traces hold one process per row with pid, arrival, burst and optionally
+priority columns and are read in chunks. For repeated use, convert them once
+to the binary format, which is memory-mapped and viewed as NumPy arrays
+without copying:
+
+    python3 src/traces.py convert trace.csv trace.psw
+    python3 src/traces.py info trace.psw
+
+Binary layout (little-endian), all sections 8-byte aligned:
+
+    header   64 bytes: magic b"PSSWKLD1", count (u64), pid_width (u32),
+             flags (u32), padding
+    arrival  int64[count]
+    burst    int64[count]
+    pids     count fixed-width fields of pid_width bytes, UTF-8, NUL padded
+    priority int64[count], only if flags has FLAG_PRIORITY set
+
+Files written before the flags field have zeros there and read unchanged.
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from collections.abc import Sequence
+from itertools import islice
+
+import numpy as np
+
+from workload import Workload, as_workload
+
+MAGIC = b"PSSWKLD1"
+HEADER = struct.Struct("<8sQII")
+HEADER_SIZE = 64
+DEFAULT_PID_WIDTH = 16
+DEFAULT_CHUNK_SIZE = 1_000_000
+# Header flag: a priority section follows the pids.
+FLAG_PRIORITY = 1
+
+_PID_COLUMNS = ("pid", "process", "name")
+_ARRIVAL_COLUMNS = ("arrival_time", "arrival")
+_BURST_COLUMNS = ("burst_time", "burst")
+_PRIORITY_COLUMNS = ("priority",)
+
+
+class PidTable(Sequence):
+    """
+    Read-only view of a fixed-width pid column, decoded on access.
+
+    Args:
+        raw (numpy.ndarray): Array of dtype ``S<width>``.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [b.decode("utf-8") for b in self.raw[key].tolist()]
+        return self.raw[key].decode("utf-8")
+
+    def __iter__(self):
+        for b in self.raw.tolist():
+            yield b.decode("utf-8")
+
+
+def _column(header, names, default):
+    for i, column in enumerate(header):
+        if column.strip().lower() in names:
+            return i
+    return default
+
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read a CSV trace as a sequence of Workload chunks.
+
+    The file may start with a header naming the pid, arrival(_time),
+    burst(_time) and optional priority columns in any order; without one the
+    columns are taken to be pid, arrival, burst and, if the first row has a
+    fourth column, priority.
+
+    Args:
+        path (str): CSV file.
+        chunk_size (int): Maximum rows per chunk.
+
+    Yields:
+        Workload: Consecutive chunks of at most ``chunk_size`` rows.
+    """
+    with open(path, newline="") as f:
+        reader = (row for row in csv.reader(f) if row)
+        first = next(reader, None)
+        if first is None:
+            return
+
+        columns = (0, 1, 2, 3 if len(first) > 3 else None)
+        rows = [first]
+        try:
+            int(first[1])
+        except (IndexError, ValueError):
+            columns = (
+                _column(first, _PID_COLUMNS, 0),
+                _column(first, _ARRIVAL_COLUMNS, 1),
+                _column(first, _BURST_COLUMNS, 2),
+                _column(first, _PRIORITY_COLUMNS, None),
+            )
+            rows = []
+
+        pid_col, arrival_col, burst_col, priority_col = columns
+        while True:
+            rows.extend(islice(reader, chunk_size - len(rows)))
+            if not rows:
+                return
+            try:
+                yield Workload(
+                    [row[pid_col].strip() for row in rows],
+                    np.array([row[arrival_col] for row in rows], dtype=np.int64),
+                    np.array([row[burst_col] for row in rows], dtype=np.int64),
+                    None
+                    if priority_col is None
+                    else np.array([row[priority_col] for row in rows], dtype=np.int64),
+                )
+            except (IndexError, ValueError) as e:
+                raise ValueError(f"Malformed row in {path}: {e}") from None
+            rows = []
+
+
+def read_csv(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read a whole CSV trace into one Workload. See iter_csv_chunks for the format.
+    """
+    return concat_workloads(list(iter_csv_chunks(path, chunk_size)))
+
+
+def concat_workloads(chunks):
+    """
+    Returns:
+        Workload: The chunks' rows, in order, as one workload. If any chunk
+        has priorities, rows of the others get priority 0.
+    """
+    pids = []
+    for chunk in chunks:
+        pids.extend(chunk.pids)
+    priority = None
+    if any(c.priority is not None for c in chunks):
+        priority = np.concatenate(
+            [c.priority if c.priority is not None else np.zeros(len(c), np.int64) for c in chunks]
+        )
+    return Workload(
+        pids,
+        np.concatenate([c.arrival_time for c in chunks] or [np.empty(0, np.int64)]),
+        np.concatenate([c.burst_time for c in chunks] or [np.empty(0, np.int64)]),
+        priority,
+    )
+
+
+class BinaryWriter:
+    """
+    Append workload chunks to a binary workload file without holding them all.
+
+    Arrival times are written straight into the target file; burst times,
+    pids and priorities are spooled to temporary files next to it and
+    appended on close. The priority section is only written if a chunk has
+    priorities; rows of the other chunks get priority 0. If the ``with``
+    block raises, the partial file is deleted.
+
+    Args:
+        path (str): Output file.
+        pid_width (int): Bytes reserved per pid. Longer pids raise ValueError.
+    """
+
+    def __init__(self, path, pid_width=DEFAULT_PID_WIDTH):
+        self.path = path
+        self.pid_width = pid_width
+        self.count = 0
+        self._directory = os.path.dirname(os.path.abspath(path))
+        self._file = open(path, "wb")
+        self._file.write(bytes(HEADER_SIZE))
+        self._bursts = tempfile.TemporaryFile(dir=self._directory)
+        self._pids = tempfile.TemporaryFile(dir=self._directory)
+        self._priorities = None
+
+    def write(self, processes):
+        """
+        Append a chunk of processes.
+
+        Args:
+            processes (list or Workload): The rows to append.
+        """
+        chunk = as_workload(processes)
+        if isinstance(chunk.pids, PidTable) and chunk.pids.raw.itemsize <= self.pid_width:
+            # Already encoded and narrow enough: widen without decoding.
+            encoded = chunk.pids.raw
+        else:
+            encoded = [str(pid).encode("utf-8") for pid in chunk.pids]
+            longest = max(map(len, encoded), default=0)
+            if longest > self.pid_width:
+                raise ValueError(
+                    f"pid of {longest} bytes does not fit pid_width={self.pid_width}"
+                )
+        self._file.write(chunk.arrival_time.astype("<i8", copy=False).tobytes())
+        self._bursts.write(chunk.burst_time.astype("<i8", copy=False).tobytes())
+        self._pids.write(np.asarray(encoded, dtype=f"S{self.pid_width}").tobytes())
+        if chunk.priority is not None and self._priorities is None:
+            self._priorities = tempfile.TemporaryFile(dir=self._directory)
+            self._priorities.write(bytes(8 * self.count))
+        if self._priorities is not None:
+            if chunk.priority is not None:
+                self._priorities.write(chunk.priority.astype("<i8", copy=False).tobytes())
+            else:
+                self._priorities.write(bytes(8 * len(chunk)))
+        self.count += len(chunk)
+
+    def close(self):
+        if self._file.closed:
+            return
+        for spool in (self._bursts, self._pids):
+            spool.seek(0)
+            shutil.copyfileobj(spool, self._file)
+            spool.close()
+        flags = 0
+        if self._priorities is not None:
+            flags |= FLAG_PRIORITY
+            self._file.write(bytes(-self._file.tell() % 8))
+            self._priorities.seek(0)
+            shutil.copyfileobj(self._priorities, self._file)
+            self._priorities.close()
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, self.count, self.pid_width, flags))
+        self._file.close()
+
+    def abort(self):
+        """
+        Close the writer without finishing the file and delete what was
+        written so far.
+        """
+        if self._file.closed:
+            return
+        for spool in (self._bursts, self._pids, self._priorities):
+            if spool is not None:
+                spool.close()
+        self._file.close()
+        os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # A failed conversion must not leave a file with a valid header
+        # that describes only part of the workload.
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_binary(processes, path, pid_width=None):
+    """
+    Write a workload to a binary workload file.
+
+    Args:
+        processes (list or Workload): The workload.
+        path (str): Output file.
+        pid_width (int, optional): Bytes per pid, defaults to the longest pid.
+    """
+    workload = as_workload(processes)
+    if pid_width is None:
+        pid_width = max((len(str(pid).encode("utf-8")) for pid in workload.pids), default=1)
+    with BinaryWriter(path, max(pid_width, 1)) as writer:
+        writer.write(workload)
+
+
+def load_binary(path):
+    """
+    Memory-map a binary workload file.
+
+    The returned workload's arrays and pid table are read-only views of the
+    mapping; nothing is copied or decoded up front.
+
+    Returns:
+        Workload: The mapped workload.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER_SIZE:
+            raise ValueError(f"{path} is not a workload file")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, count, pid_width, flags = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a workload file")
+    end = HEADER_SIZE + count * (16 + pid_width)
+    if flags & FLAG_PRIORITY:
+        priority_offset = end + -end % 8
+        end = priority_offset + 8 * count
+    if size < end:
+        raise ValueError(f"{path} is truncated")
+
+    arrival = np.frombuffer(mapped, dtype="<i8", count=count, offset=HEADER_SIZE)
+    burst = np.frombuffer(mapped, dtype="<i8", count=count, offset=HEADER_SIZE + 8 * count)
+    pids = np.frombuffer(
+        mapped, dtype=f"S{pid_width}", count=count, offset=HEADER_SIZE + 16 * count
+    )
+    priority = None
+    if flags & FLAG_PRIORITY:
+        priority = np.frombuffer(mapped, dtype="<i8", count=count, offset=priority_offset)
+    return Workload(PidTable(pids), arrival, burst, priority)
+
+
+def convert_csv(csv_path, binary_path, pid_width=DEFAULT_PID_WIDTH, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert a CSV trace to the binary format chunk by chunk.
+
+    Returns:
+        int: Number of processes written.
+    """
+    with BinaryWriter(binary_path, pid_width) as writer:
+        for chunk in iter_csv_chunks(csv_path, chunk_size):
+            writer.write(chunk)
+    return writer.count
+
+
+def load_workload(path):
+    """
+    Load a workload from a binary (.psw), CSV (.csv) or JSON (.json) file.
+
+    JSON files hold a list of {'pid', 'arrival_time', 'burst_time'} dicts,
+    optionally with a 'priority'.
+
+    Returns:
+        Workload: The loaded workload.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return read_csv(path)
+    if extension == ".json":
+        with open(path) as f:
+            return as_workload(json.load(f))
+    return load_binary(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workload trace tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert a CSV trace to the binary format")
+    convert.add_argument("csv")
+    convert.add_argument("output")
+    convert.add_argument("--pid-width", type=int, default=DEFAULT_PID_WIDTH)
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    info = commands.add_parser("info", help="summarise a workload file")
+    info.add_argument("path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        count = convert_csv(args.csv, args.output, args.pid_width, args.chunk_size)
+        print(f"Wrote {count} processes to {args.output}")
+        return 0
+
+    workload = load_workload(args.path)
+    print(f"processes: {len(workload)}")
+    if len(workload):
+        print(f"arrival:   {workload.arrival_time.min()}..{workload.arrival_time.max()}")
+        print(f"burst:     {workload.burst_time.min()}..{workload.burst_time.max()}")
+        if workload.priority is not None:
+            print(f"priority:  {workload.priority.min()}..{workload.priority.max()}")
+        print(f"total burst: {int(workload.burst_time.sum())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""
+Automatic choice of the Round Robin time quantum.
+
+The tuner searches the quantum space for the value that minimises an
+objective built from the average waiting, turnaround and response times plus
+an optional penalty per context switch:
+
+    python3 src/tuner.py trace.csv --objective awt
+    python3 src/tuner.py --random 100000 --objective awt=1,art=1 --switch-penalty 0.5
+
+Candidates are evaluated by a metrics-only RR loop that never builds a
+schedule. The search runs on a coarse geometric grid first and then zooms in
+around the best candidate. A candidate is abandoned as soon as a lower bound
+on its score exceeds the best score so far, and runs with a larger quantum
+resume from the point where a smaller quantum first had to preempt, since the
+schedules are identical up to there.
+"""
+
+import argparse
+import json
+import sys
+from bisect import bisect_right
+from collections import deque, namedtuple
+
+from workload import as_workload
+
+METRICS = ("awt", "ata", "art")
+DEFAULT_COARSE_POINTS = 8
+DEFAULT_CHECK_EVERY = 4096
+
+# State just before the first dispatch that a quantum has to cut short.
+_Prefix = namedtuple(
+    "_Prefix",
+    "time cursor queue remaining completed wait_sum response_sum switches last_index",
+)
+
+
+def parse_objective(text):
+    """
+    Parse 'awt' or a weighted mix such as 'awt=1,art=0.5' into weights.
+
+    Returns:
+        dict: {metric: weight} over 'awt', 'ata' and 'art'.
+    """
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in METRICS:
+            raise ValueError(f"Unknown objective metric: {name}")
+        weights[name] = float(weight) if weight else 1.0
+        if weights[name] < 0:
+            raise ValueError("Objective weights must not be negative")
+    return weights
+
+
+class QuantumTuner:
+    """
+    Evaluates RR quanta on one workload, remembering results and shared
+    schedule prefixes between calls.
+
+    The score of a quantum is
+
+        sum(weights[m] * m for m in ('awt', 'ata', 'art'))
+            + switch_penalty * context_switches / n
+
+    i.e. the penalty is charged per context switch and spread over all
+    processes, in the same time units as the averages.
+
+    Args:
+        processes (list or Workload): The workload.
+        objective (str or dict): 'awt', 'ata', 'art', or weights such as
+            {'awt': 1, 'art': 0.5} (see parse_objective).
+        switch_penalty (float): Cost of one context switch.
+        check_every (int): Slices between lower-bound checks.
+    """
+
+    def __init__(self, processes, objective="awt", switch_penalty=0.0, check_every=DEFAULT_CHECK_EVERY):
+        self.workload = as_workload(processes)
+        if not len(self.workload):
+            raise ValueError("Cannot tune an empty workload")
+        self.weights = parse_objective(objective) if isinstance(objective, str) else dict(objective)
+        if switch_penalty < 0:
+            raise ValueError("The switch penalty must not be negative")
+        self.switch_penalty = switch_penalty
+        self.check_every = check_every
+        self.arrivals, self.bursts, self.order = self.workload.columns()
+        self.max_burst = max(self.bursts)
+        self.total_burst = sum(self.bursts)
+        self.results = {}
+        self.evaluations = 0
+        self.pruned = 0
+        # Quanta with a recorded prefix, ascending, and the prefixes.
+        self._prefix_quanta = []
+        self._prefixes = {}
+
+    def score(self, awt, ata, art, switches):
+        weights = self.weights
+        return (
+            weights.get("awt", 0.0) * awt
+            + weights.get("ata", 0.0) * ata
+            + weights.get("art", 0.0) * art
+            + self.switch_penalty * switches / len(self.workload)
+        )
+
+    def evaluate(self, quantum, bound=float("inf")):
+        """
+        Score one quantum.
+
+        Args:
+            quantum (int): Time quantum.
+            bound (float): Give up once the score is certain to exceed this.
+
+        Returns:
+            dict: {'quantum', 'awt', 'ata', 'art', 'context_switches',
+            'score', 'pruned'}. A pruned row only has 'quantum', 'score' (the
+            lower bound that exceeded ``bound``) and 'pruned'.
+        """
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        # Every quantum at least as long as the longest burst gives the same
+        # schedule, so they share one result.
+        quantum = min(quantum, self.max_burst)
+        row = self.results.get(quantum)
+        if row is not None and (not row["pruned"] or row["score"] > bound):
+            return row
+
+        self.evaluations += 1
+        row = self._simulate(quantum, bound)
+        if row["pruned"]:
+            self.pruned += 1
+        self.results[quantum] = row
+        return row
+
+    def _prefix_for(self, quantum):
+        # The prefix of the largest smaller quantum is shared with this one:
+        # every dispatch before it ran its process to completion, as it would
+        # with any longer quantum.
+        i = bisect_right(self._prefix_quanta, quantum)
+        if i == 0:
+            return None
+        return self._prefixes[self._prefix_quanta[i - 1]]
+
+    def _simulate(self, quantum, bound):
+        arrivals, bursts, order = self.arrivals, self.bursts, self.order
+        n = len(order)
+        prefix = self._prefix_for(quantum)
+        if prefix is None:
+            current_time = arrivals[order[0]]
+            cursor = 0
+            queue = deque()
+            remaining = list(bursts)
+            completed = wait_sum = response_sum = switches = 0
+            last_index = -1
+        else:
+            current_time, cursor = prefix.time, prefix.cursor
+            queue = deque(prefix.queue)
+            remaining = list(prefix.remaining)
+            completed, wait_sum, response_sum = prefix.completed, prefix.wait_sum, prefix.response_sum
+            switches, last_index = prefix.switches, prefix.last_index
+        recorded = quantum in self._prefixes
+        countdown = self.check_every
+
+        while completed < n:
+            while cursor < n and arrivals[order[cursor]] <= current_time:
+                queue.append(order[cursor])
+                cursor += 1
+
+            if not queue:
+                current_time = arrivals[order[cursor]]
+                continue
+
+            countdown -= 1
+            if countdown <= 0:
+                lower = self._lower_bound(
+                    current_time, queue, remaining, wait_sum, response_sum, switches
+                )
+                if lower > bound:
+                    return {"quantum": quantum, "score": lower, "pruned": True}
+                countdown = max(self.check_every, len(queue))
+
+            index = queue[0]
+            run_time = remaining[index]
+            if run_time > quantum:
+                if not recorded:
+                    self._record_prefix(
+                        quantum,
+                        _Prefix(
+                            current_time, cursor, tuple(queue), tuple(remaining),
+                            completed, wait_sum, response_sum, switches, last_index,
+                        ),
+                    )
+                    recorded = True
+                run_time = quantum
+            queue.popleft()
+
+            if remaining[index] == bursts[index]:
+                response_sum += current_time - arrivals[index]
+            if index != last_index and last_index >= 0:
+                switches += 1
+            last_index = index
+            remaining[index] -= run_time
+            current_time += run_time
+
+            if remaining[index] == 0:
+                completed += 1
+                wait_sum += current_time - arrivals[index] - bursts[index]
+            else:
+                queue.append(index)
+
+        awt = wait_sum / n
+        ata = (wait_sum + self.total_burst) / n
+        art = response_sum / n
+        return {
+            "quantum": quantum,
+            "awt": awt,
+            "ata": ata,
+            "art": art,
+            "context_switches": switches,
+            "score": self.score(awt, ata, art, switches),
+            "pruned": False,
+        }
+
+    def _record_prefix(self, quantum, prefix):
+        i = bisect_right(self._prefix_quanta, quantum)
+        self._prefix_quanta.insert(i, quantum)
+        self._prefixes[quantum] = prefix
+
+    def _lower_bound(self, time, queue, remaining, wait_sum, response_sum, switches):
+        # Finished processes contribute their final times; queued processes
+        # have at least waited, and if never started been unanswered, for as
+        # long as they have been in the system; processes yet to arrive
+        # contribute at least zero.
+        arrivals, bursts = self.arrivals, self.bursts
+        waited = wait_sum
+        unanswered = response_sum
+        for index in queue:
+            waited += time - arrivals[index] - (bursts[index] - remaining[index])
+            if remaining[index] == bursts[index]:
+                unanswered += time - arrivals[index]
+        n = len(self.workload)
+        return self.score(waited / n, (waited + self.total_burst) / n, unanswered / n, switches)
+
+    def tune(self, low=1, high=None, coarse_points=DEFAULT_COARSE_POINTS):
+        """
+        Find the quantum in [low, high] with the lowest score.
+
+        A geometric grid of about ``coarse_points`` quanta is evaluated first;
+        the search then repeatedly evaluates a finer grid between the best
+        candidate's neighbours until the step is 1. The objective is not
+        guaranteed to be unimodal, so this is a heuristic search, but every
+        candidate it reports is scored exactly.
+
+        Args:
+            low (int): Smallest quantum to consider.
+            high (int, optional): Largest quantum, defaults to the longest burst
+                (every longer quantum gives the same schedule).
+            coarse_points (int): Size of the initial grid.
+
+        Returns:
+            tuple: (best_row, rows)
+                - best_row: The evaluate() row of the best quantum
+                - rows: Every evaluated row, ordered by quantum
+        """
+        if low <= 0:
+            raise ValueError("Quantum must be positive")
+        high = min(self.max_burst if high is None else high, self.max_burst)
+        low = min(low, high)
+
+        grid = _geometric(low, high, coarse_points)
+        best = None
+        for quantum in grid:
+            best = self._consider(quantum, best)
+
+        while True:
+            i = grid.index(best["quantum"])
+            left = grid[i - 1] if i > 0 else best["quantum"]
+            right = grid[i + 1] if i + 1 < len(grid) else best["quantum"]
+            if right - left <= 2:
+                for quantum in range(left, right + 1):
+                    best = self._consider(quantum, best)
+                break
+            step = max(1, (right - left) // coarse_points)
+            grid = sorted(set(range(left, right + 1, step)) | {right, best["quantum"]})
+            for quantum in grid:
+                best = self._consider(quantum, best)
+
+        rows = [self.results[q] for q in sorted(self.results)]
+        return best, rows
+
+    def _consider(self, quantum, best):
+        row = self.evaluate(quantum, best["score"] if best is not None else float("inf"))
+        if row["pruned"]:
+            return best
+        if best is None or (row["score"], row["quantum"]) < (best["score"], best["quantum"]):
+            return row
+        return best
+
+
+def _geometric(low, high, points):
+    # About ``points`` integers spread evenly on a log scale, ends included.
+    if points < 2 or low == high:
+        return sorted({low, high})
+    ratio = (high / low) ** (1 / (points - 1))
+    return sorted({min(high, round(low * ratio**i)) for i in range(points)} | {low, high})
+
+
+def tune_quantum(
+    processes,
+    objective="awt",
+    switch_penalty=0.0,
+    low=1,
+    high=None,
+    coarse_points=DEFAULT_COARSE_POINTS,
+):
+    """
+    Find a good RR quantum for a workload. See QuantumTuner for the
+    objective and QuantumTuner.tune for the search.
+
+    Returns:
+        tuple: (best_row, rows)
+    """
+    tuner = QuantumTuner(processes, objective, switch_penalty)
+    return tuner.tune(low, high, coarse_points)
+
+
+def format_rows(rows):
+    """
+    Returns:
+        str: The tuner rows as an aligned text table.
+    """
+    lines = [f"{'quantum':>8}{'AWT':>14}{'ATA':>14}{'ART':>14}{'switches':>12}{'score':>14}"]
+    for row in rows:
+        if row["pruned"]:
+            lines.append(f"{row['quantum']:>8}{'pruned':>54}{'>' + format(row['score'], '.3f'):>14}")
+        else:
+            lines.append(
+                f"{row['quantum']:>8}{row['awt']:>14.3f}{row['ata']:>14.3f}{row['art']:>14.3f}"
+                f"{row['context_switches']:>12}{row['score']:>14.3f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the best RR time quantum for a workload.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("workload", nargs="?", help="workload file (.psw, .csv or .json)")
+    source.add_argument("--random", type=int, metavar="N", help="use a synthetic workload of N processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--objective", default="awt", help="awt, ata, art or weights such as awt=1,art=0.5"
+    )
+    parser.add_argument("--switch-penalty", type=float, default=0.0, help="cost per context switch")
+    parser.add_argument("--range", default=None, metavar="LOW-HIGH", help="quanta to search")
+    parser.add_argument("--json", action="store_true", help="print the rows as JSON")
+    args = parser.parse_args(argv)
+
+    if args.random is not None:
+        from benchmark import make_workload
+
+        processes = make_workload(args.random, seed=args.seed)
+    else:
+        from traces import load_workload
+
+        processes = load_workload(args.workload)
+
+    low, high = 1, None
+    if args.range:
+        low, high = (int(value) for value in args.range.split("-"))
+
+    best, rows = tune_quantum(processes, args.objective, args.switch_penalty, low, high)
+    if args.json:
+        print(json.dumps({"best": best, "rows": rows}, indent=2))
+    else:
+        print(format_rows(rows))
+        print(f"\nBest quantum: {best['quantum']} (score {best['score']:.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
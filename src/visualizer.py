@@ -1,7 +1,25 @@
-import matplotlib.pyplot as plt
 from fractions import Fraction
+from itertools import islice
 
-from algorithms import tats_and_rts
+import numpy as np
+from matplotlib.colors import to_rgba
+
+from metrics import compute_metrics
+from sketches import MetricsAccumulator, format_summary
+from schedule import as_schedule
+
+# Larger workloads are summarised instead of listed per process, in the
+# console as well as in the chart title.
+MAX_LISTED_PROCESSES = 10
+
+
+def _print_per_process(label, values):
+    # One line per process up to MAX_LISTED_PROCESSES; printing hundreds of
+    # thousands of lines would block the GUI thread for seconds.
+    for pid, value in islice(values.items(), MAX_LISTED_PROCESSES):
+        print(f"\t{label}({pid}) = {value}")
+    if len(values) > MAX_LISTED_PROCESSES:
+        print(f"\t... {len(values) - MAX_LISTED_PROCESSES} more processes")
 
 
 def visualize_results(
@@ -11,33 +29,41 @@ def visualize_results(
     mode="gui",
     algorithm="Unknown",
     processes=None,
+    output=None,
 ):
     """
     Visualize the scheduling results with a Gantt Chart and display waiting times.
 
     Args:
-        schedule (list): List of dicts [{'process': str, 'start': int, 'end': int}, ...]
+        schedule (Schedule or list): Schedule, or a list of dicts
+            [{'process': str, 'start': int, 'end': int}, ...]
         waiting_times (dict): Waiting times {'pid': int, ...}
         avg_waiting_time (float): Average waiting time
-        mode (str): 'gui' for Matplotlib
+        mode (str): 'gui' for Matplotlib, 'replay' for an animated chart
+            (see replay.GanttReplay)
         algorithm (str): Name of the scheduling algorithm (e.g., 'FCFS', 'SJF', 'RR', 'SRTF', 'LJF')
         processes (list): List of process dicts [{'pid': str, 'burst_time': int, ...}, ...]
+        output (str, optional): Save the chart to this file (PNG, SVG, ...)
+            offscreen instead of opening a window.
     """
-    if mode == "gui":
-        print(f"\nShowing results for {algorithm}: {processes}")
+    if mode in ("gui", "replay"):
+        schedule = as_schedule(schedule)
+        if processes is not None and len(processes) > MAX_LISTED_PROCESSES:
+            print(f"\nShowing results for {algorithm}: {len(processes)} processes")
+        else:
+            print(f"\nShowing results for {algorithm}: {processes}")
         awt_n, awt_d = (
             Fraction.from_float(avg_waiting_time).limit_denominator().as_integer_ratio()
         )
         print("Waiting Times:")
-        for pid, wt in waiting_times.items():
-            print(f"\tWT({pid}) = {wt}")
+        _print_per_process("WT", waiting_times)
         print("Average WT is %s=%s/%s" % (avg_waiting_time, awt_n, awt_d))
 
-        turn_around_times, response_times = tats_and_rts(schedule)
+        metrics = compute_metrics(schedule, processes)
+
         print("Turn Around Times:")
-        for pid, tat in turn_around_times.items():
-            print(f"\tTAT({pid}) = {tat}")
-        avg_turn_around_time = sum(turn_around_times.values()) / len(turn_around_times)
+        _print_per_process("TAT", metrics.as_dict("turnaround_time"))
+        avg_turn_around_time = metrics.avg_turnaround_time
         ata_n, ata_d = (
             Fraction.from_float(avg_turn_around_time)
             .limit_denominator()
@@ -46,9 +72,8 @@ def visualize_results(
         print("Average TAT is %s=%s/%s" % (avg_turn_around_time, ata_n, ata_d))
 
         print("Response Times:")
-        for pid, rt in response_times.items():
-            print(f"\tRT({pid}) = {rt}")
-        avg_response_time = sum(response_times.values()) / len(response_times)
+        _print_per_process("RT", metrics.as_dict("response_time"))
+        avg_response_time = metrics.avg_response_time
         art_n, art_d = (
             Fraction.from_float(avg_response_time)
             .limit_denominator()
@@ -56,8 +81,16 @@ def visualize_results(
         )
         print("Average RT is %s=%s/%s" % (avg_response_time, art_n, art_d))
 
+        accumulator = MetricsAccumulator()
+        accumulator.add_metrics(metrics)
+        print("Percentiles:")
+        for line in format_summary(accumulator.summary()).splitlines():
+            print(f"\t{line}")
+
         burst_times_str = "No Processes"
-        if processes:
+        if processes is not None and len(processes) > MAX_LISTED_PROCESSES:
+            burst_times_str = f"{len(processes)} processes"
+        elif processes:
             try:
                 burst_times_str = ", ".join(
                     [f"{p['pid']}={p['burst_time']}" for p in processes]
@@ -65,21 +98,218 @@ def visualize_results(
             except (KeyError, TypeError):
                 burst_times_str = "Invalid Processes"
 
-        # Gantt Chart
+        title = f"Gantt Chart ({algorithm}, Processes: {burst_times_str}, AWT: {avg_waiting_time:.2f} = {awt_n}/{awt_d}, ATA: {avg_turn_around_time:.2f} = {ata_n}/{ata_d}, ART: {avg_response_time:.2f} = {art_n}/{art_d})"
+
+        if output is not None:
+            save_gantt(schedule, output, title)
+            return
+        if mode == "replay":
+            from replay import replay
+
+            replay(schedule, title)
+            return
+
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 4))
-        for s in schedule:
-            try:
-                ax.barh(
-                    s["process"], s["end"] - s["start"], left=s["start"], height=0.4
-                )
-            except (KeyError, TypeError):
-                print(f"Error: Invalid schedule entry {s}")
-                continue
+        draw_gantt(ax, schedule)
+        ax.set_title(title)
+        plt.tight_layout()
+        plt.show()
+
+
+# Above this many processes the chart uses a single collection for all rows.
+MAX_PROCESS_COLLECTIONS = 256
+# Above this many processes the y axis gets numeric ticks instead of pids.
+MAX_LABELLED_ROWS = 40
+
+
+def merge_segments(key, start, end, min_width):
+    """
+    Group segments by key and coalesce neighbours closer than ``min_width``.
+
+    The grouping is stable, so each group stays chronological. Used to
+    decimate a schedule to the screen resolution before drawing it.
+
+    Args:
+        key (numpy.ndarray): Group of each segment, e.g. its process row.
+        start (numpy.ndarray): Start time of each segment.
+        end (numpy.ndarray): End time of each segment.
+        min_width (float): Gaps shorter than this are closed.
+
+    Returns:
+        tuple: (key, start, end) arrays of the merged segments, ordered by key.
+    """
+    # Segments never overlap in time, so within a group the ends are sorted too.
+    order = np.argsort(key, kind="stable")
+    key, start, end = key[order], start[order], end[order]
+    if len(key) == 0:
+        return key, start, end
+    breaks = np.ones(len(key), dtype=bool)
+    breaks[1:] = (key[1:] != key[:-1]) | (start[1:] - end[:-1] >= min_width)
+    first = np.flatnonzero(breaks)
+    last = np.append(first[1:], len(key)) - 1
+    return key[first], start[first], end[last]
+
+
+def draw_gantt(ax, schedule, pixel_width=None, pixel_height=None):
+    """
+    Draw a schedule onto ``ax`` with one broken_barh collection per process.
+
+    Segments of the same process that are less than one pixel apart at the
+    axes' current size are merged first, so the number of drawn rectangles is
+    bounded by the resolution rather than by the schedule length. Beyond
+    MAX_PROCESS_COLLECTIONS processes all rows share a single PolyCollection,
+    and rows that fall into the same pixel band are merged as well. Every
+    rectangle is at least one pixel wide so short segments stay visible.
+
+    Args:
+        ax (matplotlib.axes.Axes): Target axes.
+        schedule (Schedule or list): The schedule to draw.
+        pixel_width (float, optional): Width of the plot area in pixels.
+            Defaults to the axes' current width.
+        pixel_height (float, optional): Height of the plot area in pixels.
+            Defaults to the axes' current height.
+
+    Returns:
+        int: Number of rectangles drawn.
+    """
+    schedule = as_schedule(schedule)
+    index, start, end = schedule.index, schedule.start, schedule.end
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Processes")
+    if len(index) == 0:
+        return 0
 
+    extent = ax.get_window_extent()
+    pixel_width = extent.width if pixel_width is None else pixel_width
+    pixel_height = extent.height if pixel_height is None else pixel_height
+    t_min, t_max = int(start.min()), int(end.max())
+    min_width = (t_max - t_min) / max(pixel_width, 1)
+
+    # Rows in order of first appearance, bottom to top, like a categorical barh.
+    seen, first_segment = np.unique(index, return_index=True)
+    by_appearance = seen[np.argsort(first_segment)]
+    appearance = np.full(len(schedule.pids), -1, dtype=np.int64)
+    appearance[by_appearance] = np.arange(len(seen))
+    row_count = len(seen)
+    rows = appearance[index]
+
+    if row_count <= MAX_PROCESS_COLLECTIONS:
+        rows, start, end = merge_segments(rows, start, end, min_width)
+        bounds = np.flatnonzero(np.diff(rows)) + 1
+        for row, starts, ends in zip(
+            rows[np.append(0, bounds)].tolist(), np.split(start, bounds), np.split(end, bounds)
+        ):
+            ax.broken_barh(
+                np.column_stack((starts, np.maximum(ends - starts, min_width))),
+                (row - 0.2, 0.4),
+                facecolors=f"C{row % 10}",
+            )
+    else:
+        from matplotlib.collections import PolyCollection
+
+        rows_per_band = max(1.0, row_count / max(pixel_height, 1))
+        bands = (rows / rows_per_band).astype(np.int64)
+        bands, start, end = merge_segments(bands, start, end, min_width)
+
+        x0 = start.astype(float)
+        x1 = np.maximum(end.astype(float), x0 + min_width)
+        y0 = bands * rows_per_band - 0.2
+        y1 = (bands + 1) * rows_per_band - 0.8
+        vertices = np.stack(
+            [np.column_stack(corner) for corner in ((x0, y0), (x0, y1), (x1, y1), (x1, y0))],
+            axis=1,
+        )
+        palette = np.array([to_rgba(f"C{i}") for i in range(10)])
+        ax.add_collection(
+            PolyCollection(vertices, facecolors=palette[bands % 10], linewidths=0)
+        )
+        rows = bands
+
+    if row_count <= MAX_LABELLED_ROWS:
+        ax.set_yticks(range(row_count), [schedule.pids[i] for i in by_appearance.tolist()])
+    ax.set_ylim(-0.5, row_count - 0.5)
+    ax.set_xlim(t_min, t_max)
+    return len(rows)
+
+
+def save_gantt(schedule, path, title=None, figsize=(10, 4), dpi=100):
+    """
+    Render a schedule offscreen with the Agg backend and save it.
+
+    No GUI toolkit or display is needed. The format (PNG, SVG, PDF, ...)
+    follows the file extension.
+
+    Args:
+        schedule (Schedule or list): The schedule to draw.
+        path (str): Output file.
+        title (str, optional): Chart title.
+        figsize (tuple): Figure size in inches.
+        dpi (int): Resolution for raster formats.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if title:
+        ax.set_title(title, fontsize="small", wrap=True)
+    fig.tight_layout()
+    draw_gantt(ax, schedule)
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def draw_comparison(fig, rows, schedules):
+    """
+    Draw one Gantt chart per compared algorithm, stacked on a shared time axis.
+
+    Args:
+        fig (matplotlib.figure.Figure): Target figure.
+        rows (list): Rows returned by compare.compare.
+        schedules (dict): Schedules returned by compare.compare.
+    """
+    axes = fig.subplots(len(rows), 1, sharex=True, squeeze=False)[:, 0]
+    fig.tight_layout()
+    for ax, row in zip(axes, rows):
+        draw_gantt(ax, schedules[row["algorithm"]])
+        name = row["algorithm"].upper()
+        if row["quantum"] is not None:
+            name += f" (q={row['quantum']})"
         ax.set_title(
-            f"Gantt Chart ({algorithm}, Processes: {burst_times_str}, AWT: {avg_waiting_time:.2f} = {awt_n}/{awt_d}, ATA: {avg_turn_around_time:.2f} = {ata_n}/{ata_d}, ART: {avg_response_time:.2f} = {art_n}/{art_d})"
+            f"{name}: AWT {row['awt']:.2f}, ATA {row['ata']:.2f}, ART {row['art']:.2f}",
+            fontsize="small",
         )
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Processes")
-        plt.tight_layout()
-        plt.show()
+        ax.set_xlabel("")
+    axes[-1].set_xlabel("Time")
+    # draw_gantt fits each axis to its own schedule; show them on one range.
+    t_min = min(ax.get_xlim()[0] for ax in axes)
+    t_max = max(ax.get_xlim()[1] for ax in axes)
+    axes[-1].set_xlim(t_min, t_max)
+    fig.tight_layout()
+
+
+def show_comparison(rows, schedules):
+    """
+    Open a window with the stacked Gantt charts of compare.compare.
+    """
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 1.8 * len(rows) + 0.5))
+    draw_comparison(fig, rows, schedules)
+    plt.show()
+
+
+def save_comparison(rows, schedules, path, dpi=100):
+    """
+    Render the stacked Gantt charts of compare.compare offscreen and save them.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 1.8 * len(rows) + 0.5), dpi=dpi)
+    FigureCanvasAgg(fig)
+    draw_comparison(fig, rows, schedules)
+    fig.savefig(path)
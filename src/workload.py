@@ -0,0 +1,189 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class Workload:
+    """
+    Columnar (struct-of-arrays) representation of a set of processes.
+
+    Arrival and burst times are stored as int64 NumPy arrays and the PIDs in
+    a sequence (normally a list), so row i describes the process ``pids[i]``. Row order is the
+    original input order, which the algorithms use for tie-breaking.
+
+    Args:
+        pids (list): Process identifiers, one per row. Any sequence, such as
+            a traces.PidTable, is kept as is; other iterables become a list.
+        arrival_time (array-like): Arrival times, one per row.
+        burst_time (array-like): Burst times, one per row.
+        priority (array-like, optional): Priorities, one per row; lower
+            values are more important. None if the workload has none.
+    """
+
+    def __init__(self, pids, arrival_time, burst_time, priority=None):
+        self.pids = pids if isinstance(pids, Sequence) and not isinstance(pids, str) else list(pids)
+        self.arrival_time = np.ascontiguousarray(arrival_time, dtype=np.int64)
+        self.burst_time = np.ascontiguousarray(burst_time, dtype=np.int64)
+        self.priority = None if priority is None else np.ascontiguousarray(priority, dtype=np.int64)
+
+        n = len(self.pids)
+        if self.arrival_time.shape != (n,) or self.burst_time.shape != (n,):
+            raise ValueError(
+                "pids, arrival_time and burst_time must be one-dimensional and of equal length"
+            )
+        if self.priority is not None and self.priority.shape != (n,):
+            raise ValueError("priority must be one-dimensional and as long as pids")
+
+    @classmethod
+    def from_processes(cls, processes):
+        """
+        Build a workload from a list of process dicts.
+
+        Args:
+            processes (list): List of dicts, each with 'pid', 'arrival_time',
+                'burst_time' and optionally 'priority'. If any process has a
+                priority, the others default to 0.
+
+        Returns:
+            Workload: The equivalent columnar workload.
+        """
+        n = len(processes)
+        pids = [p["pid"] for p in processes]
+        arrival_time = np.fromiter(
+            (p["arrival_time"] for p in processes), dtype=np.int64, count=n
+        )
+        burst_time = np.fromiter(
+            (p["burst_time"] for p in processes), dtype=np.int64, count=n
+        )
+        priority = None
+        if any("priority" in p for p in processes):
+            priority = np.fromiter(
+                (p.get("priority", 0) for p in processes), dtype=np.int64, count=n
+            )
+        return cls(pids, arrival_time, burst_time, priority)
+
+    def to_processes(self):
+        """
+        Convert back to the list-of-dicts representation.
+
+        Returns:
+            list: List of dicts, each with 'pid', 'arrival_time', 'burst_time'
+            and, if the workload has priorities, 'priority'.
+        """
+        return list(self)
+
+    def arrival_order(self):
+        """
+        Row indices sorted by arrival time, ties kept in input order.
+
+        Returns:
+            numpy.ndarray: int64 permutation of ``range(len(self))``.
+        """
+        return np.argsort(self.arrival_time, kind="stable")
+
+    def columns(self):
+        """
+        Arrival times, burst times and arrival order as Python lists, the form
+        the event-driven algorithms iterate over. Callers must not modify them.
+
+        Returns:
+            tuple: (arrival_time, burst_time, arrival_order) lists.
+        """
+        return (
+            self.arrival_time.tolist(),
+            self.burst_time.tolist(),
+            self.arrival_order().tolist(),
+        )
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __iter__(self):
+        if self.priority is not None:
+            for pid, arrival, burst, priority in zip(
+                self.pids,
+                self.arrival_time.tolist(),
+                self.burst_time.tolist(),
+                self.priority.tolist(),
+            ):
+                yield {"pid": pid, "arrival_time": arrival, "burst_time": burst, "priority": priority}
+            return
+        for pid, arrival, burst in zip(
+            self.pids, self.arrival_time.tolist(), self.burst_time.tolist()
+        ):
+            yield {"pid": pid, "arrival_time": arrival, "burst_time": burst}
+
+    def __repr__(self):
+        return f"Workload(n={len(self)})"
+
+
+class PreparedWorkload(Workload):
+    """
+    Read-only Workload that sorts by arrival and builds its columns once.
+
+    Running several algorithms on one PreparedWorkload shares the arrival
+    sort and the list conversions between them. Writable arrays are copied
+    and made read-only so the cached values cannot go stale; read-only ones,
+    such as memory-mapped traces, are used as they are.
+
+    Args:
+        pids (list): Process identifiers, one per row.
+        arrival_time (array-like): Arrival times, one per row.
+        burst_time (array-like): Burst times, one per row.
+        priority (array-like, optional): Priorities, one per row.
+    """
+
+    def __init__(self, pids, arrival_time, burst_time, priority=None):
+        super().__init__(pids, arrival_time, burst_time, priority)
+        for name in ("arrival_time", "burst_time", "priority"):
+            array = getattr(self, name)
+            if array is not None and array.flags.writeable:
+                array = array.copy()
+                array.setflags(write=False)
+                setattr(self, name, array)
+        self._order = None
+        self._columns = None
+
+    def arrival_order(self):
+        if self._order is None:
+            self._order = super().arrival_order()
+            self._order.setflags(write=False)
+        return self._order
+
+    def columns(self):
+        if self._columns is None:
+            self._columns = super().columns()
+        return self._columns
+
+
+def prepare(processes):
+    """
+    Return ``processes`` as a PreparedWorkload, converting it if needed.
+
+    Args:
+        processes (list or Workload): Processes to prepare.
+
+    Returns:
+        PreparedWorkload: ``processes`` itself if it already is one.
+    """
+    if isinstance(processes, PreparedWorkload):
+        return processes
+    workload = as_workload(processes)
+    return PreparedWorkload(
+        workload.pids, workload.arrival_time, workload.burst_time, workload.priority
+    )
+
+
+def as_workload(processes):
+    """
+    Return ``processes`` as a Workload, converting a list of dicts if needed.
+
+    Args:
+        processes (list or Workload): Processes to adapt.
+
+    Returns:
+        Workload: ``processes`` itself if it already is one, otherwise a new Workload.
+    """
+    if isinstance(processes, Workload):
+        return processes
+    return Workload.from_processes(processes)
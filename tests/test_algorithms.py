@@ -0,0 +1,304 @@
+import random
+
+import pytest
+
+import baseline_algorithms as baseline
+from algorithms import run_algorithm
+
+
+def _random_processes(rng, max_processes=12):
+    # Narrow ranges so arrival and burst ties are common; pids are shuffled
+    # so the input order differs from the arrival order.
+    n = rng.randint(1, max_processes)
+    pids = [f"p{i + 1}" for i in range(n)]
+    rng.shuffle(pids)
+    return [
+        {"pid": pid, "arrival_time": rng.randint(0, 15), "burst_time": rng.randint(1, 8)}
+        for pid in pids
+    ]
+
+
+def _assert_same(result, expected):
+    schedule, waiting_times, avg_waiting_time = result
+    expected_schedule, expected_waiting, expected_avg = expected
+    assert schedule.as_dicts() == expected_schedule
+    assert list(waiting_times.items()) == list(expected_waiting.items())
+    assert avg_waiting_time == pytest.approx(expected_avg)
+
+
+@pytest.mark.parametrize(
+    "algorithm, reference",
+    [
+        ("fcfs", baseline.fcfs),
+        ("sjf", baseline.sjf_non_preemptive),
+        ("ljf", baseline.ljf_non_preemptive),
+    ],
+)
+def test_non_preemptive_algorithms_match_the_baseline(algorithm, reference):
+    rng = random.Random(algorithm)
+    for _ in range(500):
+        processes = _random_processes(rng)
+        _assert_same(run_algorithm(processes, algorithm), reference(processes))
+
+
+def test_srtf_matches_the_baseline():
+    rng = random.Random("srtf")
+    for case in range(1000):
+        processes = _random_processes(rng)
+        if case % 2:
+            # Exercise the rule that p1 arriving at t=0 gets the first tick,
+            # often against shorter processes that also arrive at t=0.
+            next(p for p in processes if p["pid"] == "p1")["arrival_time"] = 0
+        _assert_same(run_algorithm(processes, "srtf"), baseline.srtf(processes))
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+def test_rr_matches_the_baseline(quantum):
+    rng = random.Random(quantum)
+    for _ in range(300):
+        processes = _random_processes(rng)
+        _assert_same(run_algorithm(processes, "rr", quantum), baseline.rr(processes, quantum))
+
+
+def _priority_reference(processes, aging_interval):
+    # One time unit per step: admit arrivals, age every waiting process from
+    # the moment it entered the queue, then keep or replace the running one.
+    floor = min(p.get("priority", 0) for p in processes)
+    rows = sorted(range(len(processes)), key=lambda i: processes[i]["arrival_time"])
+    remaining = [p["burst_time"] for p in processes]
+    queued = {}  # row -> (base priority, enqueue time, enqueue order)
+    enqueued = 0
+    running = running_level = None
+    segments = []
+    time, cursor, done = 0, 0, 0
+
+    def level(i):
+        base, since, _ = queued[i]
+        if aging_interval is None or base <= floor:
+            return base
+        return max(floor, base - (time - since) // aging_interval)
+
+    def enqueue(i):
+        nonlocal enqueued
+        queued[i] = (processes[i].get("priority", 0), time, enqueued)
+        enqueued += 1
+
+    def best():
+        return min(queued, key=lambda i: (level(i), queued[i][2]))
+
+    while done < len(processes):
+        while cursor < len(rows) and processes[rows[cursor]]["arrival_time"] <= time:
+            enqueue(rows[cursor])
+            cursor += 1
+        if running is None and queued:
+            running = best()
+            running_level = level(running)
+            del queued[running]
+        elif running is not None and queued and level(best()) < running_level:
+            enqueue(running)
+            running = best()
+            running_level = level(running)
+            del queued[running]
+        if running is not None:
+            pid = processes[running]["pid"]
+            if segments and segments[-1]["process"] == pid and segments[-1]["end"] == time:
+                segments[-1]["end"] += 1
+            else:
+                segments.append({"process": pid, "start": time, "end": time + 1})
+            remaining[running] -= 1
+            if not remaining[running]:
+                done += 1
+                running = None
+        time += 1
+    return segments
+
+
+def _with_priorities(rows):
+    return [
+        {"pid": pid, "arrival_time": arrival, "burst_time": burst, "priority": level}
+        for pid, arrival, burst, level in rows
+    ]
+
+
+def _segments(result):
+    return [(pid, start, end) for pid, start, end in result[0]]
+
+
+@pytest.mark.parametrize("aging_interval", [1, 3, 10, None])
+def test_priority_matches_a_tick_based_reference(aging_interval):
+    rng = random.Random(f"priority-{aging_interval}")
+    for _ in range(300):
+        processes = _random_processes(rng)
+        for p in processes:
+            p["priority"] = rng.randint(0, 5)
+        result = run_algorithm(processes, "priority", aging_interval=aging_interval)
+        assert result[0].as_dicts() == _priority_reference(processes, aging_interval), processes
+
+
+def test_priority_ages_one_level_per_interval():
+    # b waits from t=1 and gains a level at 6, 11 and 16; at level 1 it is
+    # strictly better than a (2) and preempts it. z only sets the floor.
+    processes = _with_priorities([("a", 0, 30, 2), ("b", 1, 3, 4), ("z", 100, 1, 0)])
+    assert _segments(run_algorithm(processes, "priority", aging_interval=5)) == [
+        ("a", 0, 16),
+        ("b", 16, 19),
+        ("a", 19, 33),
+        ("z", 100, 101),
+    ]
+
+
+def test_priority_aging_can_be_disabled():
+    processes = _with_priorities([("a", 0, 30, 2), ("b", 1, 3, 4), ("z", 100, 1, 0)])
+    assert _segments(run_algorithm(processes, "priority", aging_interval=None)) == [
+        ("a", 0, 30),
+        ("b", 30, 33),
+        ("z", 100, 101),
+    ]
+
+
+def test_priority_aging_stops_at_the_best_base_priority():
+    # b reaches level 0 at t=20. Without the floor it would be at -1 by 25
+    # and preempt a.
+    processes = _with_priorities([("a", 0, 30, 0), ("b", 0, 3, 4)])
+    assert _segments(run_algorithm(processes, "priority", aging_interval=5)) == [
+        ("a", 0, 30),
+        ("b", 30, 33),
+    ]
+
+
+def test_priority_preemption_needs_a_strictly_better_level():
+    # b's equal priority does not preempt a, c's better one does. a re-enters
+    # the queue behind b.
+    processes = _with_priorities([("a", 0, 5, 1), ("b", 2, 2, 1), ("c", 3, 1, 0)])
+    assert _segments(run_algorithm(processes, "priority", aging_interval=None)) == [
+        ("a", 0, 3),
+        ("c", 3, 4),
+        ("b", 4, 6),
+        ("a", 6, 8),
+    ]
+
+
+def test_priority_preempted_process_returns_at_its_base_priority():
+    # b is dispatched at t=10 after aging from 2 to 1 and is preempted by c.
+    # Back at its base level 2 it queues behind d, which arrived earlier at
+    # the same level; with its aged level it would have run before d.
+    processes = _with_priorities(
+        [("a", 0, 10, 1), ("b", 0, 20, 2), ("c", 12, 3, 0), ("d", 11, 3, 2), ("z", 1000, 1, 0)]
+    )
+    assert _segments(run_algorithm(processes, "priority", aging_interval=10)) == [
+        ("a", 0, 10),
+        ("b", 10, 12),
+        ("c", 12, 15),
+        ("d", 15, 18),
+        ("b", 18, 36),
+        ("z", 1000, 1001),
+    ]
+
+
+def _cfs_reference(processes, min_granularity, target_latency):
+    # One time unit per step, following the rules of the cfs() docstring.
+    rows = sorted(range(len(processes)), key=lambda i: processes[i]["arrival_time"])
+    remaining = [p["burst_time"] for p in processes]
+    runqueue = {}  # row -> (vruntime, enqueue order)
+    enqueued = 0
+    running, vruntime, used = None, 0, 0
+    min_vruntime = 0
+    segments = []
+    time, cursor, done = 0, 0, 0
+
+    def slice_length():
+        runnable = len(runqueue) + (running is not None)
+        return max(min_granularity, target_latency // max(runnable, 1))
+
+    while done < len(processes):
+        candidates = [v for v, _ in runqueue.values()]
+        if running is not None:
+            candidates.append(vruntime)
+        if candidates:
+            min_vruntime = max(min_vruntime, min(candidates))
+        while cursor < len(rows) and processes[rows[cursor]]["arrival_time"] <= time:
+            runqueue[rows[cursor]] = (min_vruntime, enqueued)
+            enqueued += 1
+            cursor += 1
+        if running is not None and used >= slice_length():
+            runqueue[running] = (vruntime, enqueued)
+            enqueued += 1
+            running = None
+        if running is None and runqueue:
+            running = min(runqueue, key=runqueue.get)
+            vruntime, _ = runqueue.pop(running)
+            used = 0
+        if running is not None:
+            pid = processes[running]["pid"]
+            if segments and segments[-1]["process"] == pid and segments[-1]["end"] == time:
+                segments[-1]["end"] += 1
+            else:
+                segments.append({"process": pid, "start": time, "end": time + 1})
+            remaining[running] -= 1
+            vruntime += 1
+            used += 1
+            if not remaining[running]:
+                done += 1
+                running = None
+        time += 1
+    return segments
+
+
+def _cfs(rows, **options):
+    processes = [{"pid": pid, "arrival_time": a, "burst_time": b} for pid, a, b in rows]
+    return _segments(run_algorithm(processes, "cfs", **options))
+
+
+@pytest.mark.parametrize("min_granularity, target_latency", [(1, 8), (2, 8), (1, 3), (3, 20)])
+def test_cfs_matches_a_tick_based_reference(min_granularity, target_latency):
+    rng = random.Random(f"cfs-{min_granularity}-{target_latency}")
+    for _ in range(300):
+        processes = _random_processes(rng)
+        result = run_algorithm(
+            processes, "cfs", min_granularity=min_granularity, target_latency=target_latency
+        )
+        expected = _cfs_reference(processes, min_granularity, target_latency)
+        assert result[0].as_dicts() == expected, processes
+
+
+def test_cfs_slices_the_target_latency_between_runnable_processes():
+    # Three runnable processes share a 6 unit period in slices of 2.
+    rows = [("a", 0, 6), ("b", 0, 6), ("c", 0, 6)]
+    assert _cfs(rows, min_granularity=1, target_latency=6) == [
+        (pid, start, start + 2) for start, pid in zip(range(0, 18, 2), "abcabcabc")
+    ]
+
+
+def test_cfs_slices_never_drop_below_min_granularity():
+    # 8 // 4 would be 2, the minimum granularity raises it to 3.
+    rows = [(pid, 0, 3) for pid in "abcd"]
+    assert _cfs(rows, min_granularity=3, target_latency=8) == [
+        ("a", 0, 3),
+        ("b", 3, 6),
+        ("c", 6, 9),
+        ("d", 9, 12),
+    ]
+
+
+def test_cfs_places_arrivals_at_min_vruntime():
+    # b arrives at t=10 with a's vruntime of 10, not 0, so it alternates with
+    # a instead of running until it has caught up.
+    rows = [("a", 0, 20), ("b", 10, 8)]
+    assert _cfs(rows, min_granularity=1, target_latency=8) == [
+        ("a", 0, 12),
+        ("b", 12, 16),
+        ("a", 16, 20),
+        ("b", 20, 24),
+        ("a", 24, 28),
+    ]
+
+
+def test_cfs_arrival_preempts_a_process_past_its_new_slice():
+    # Alone, a's slice is 8. b's arrival at t=5 halves it to 4, which a has
+    # already used, so b runs at once.
+    rows = [("a", 0, 20), ("b", 5, 2)]
+    assert _cfs(rows, min_granularity=1, target_latency=8) == [
+        ("a", 0, 5),
+        ("b", 5, 7),
+        ("a", 7, 22),
+    ]
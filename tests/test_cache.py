@@ -0,0 +1,77 @@
+import pytest
+
+import cache
+from algorithms import run_algorithm
+from benchmark import make_workload
+from cache import ResultCache, _result_size, cached_run_algorithm, result_key
+
+
+class _Counting:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, processes, algorithm, quantum=None, **options):
+        self.calls.append((algorithm, quantum, options))
+        return run_algorithm(processes, algorithm, quantum, **options)
+
+
+def test_hits_and_misses_are_counted():
+    compute = _Counting()
+    results = ResultCache()
+    workload = make_workload(50)
+    first = results.run(workload, "rr", 4, compute=compute)
+    second = results.run(workload, "rr", 4, compute=compute)
+    results.run(workload, "rr", 5, compute=compute)
+    # The quantum only counts for RR.
+    results.run(workload, "sjf", 4, compute=compute)
+    results.run(workload, "sjf", 7, compute=compute)
+
+    assert len(compute.calls) == 3
+    assert second[0] is first[0] and second[1] == first[1] and second[1] is not first[1]
+    stats = results.stats()
+    assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (2, 0, 3)
+    assert stats["hit_rate"] == pytest.approx(2 / 5)
+    assert stats["entries"] == 3
+
+
+def test_least_recently_used_results_are_evicted():
+    workloads = [make_workload(40, seed=seed) for seed in range(4)]
+    size = _result_size(run_algorithm(workloads[0], "fcfs"))
+    results = ResultCache(max_bytes=int(2.5 * size))
+    results.run(workloads[0], "fcfs")
+    results.run(workloads[1], "fcfs")
+    results.run(workloads[0], "fcfs")  # now the most recently used
+    results.run(workloads[2], "fcfs")
+
+    assert results.stats()["evictions"] == 1
+    assert results.stats()["bytes"] <= results.max_bytes
+    assert result_key(workloads[0], "fcfs") in results._entries
+    assert result_key(workloads[1], "fcfs") not in results._entries
+
+
+def test_results_persist_across_instances(tmp_path):
+    workload = make_workload(30)
+    expected = ResultCache(directory=str(tmp_path)).run(workload, "srtf")
+
+    compute = _Counting()
+    results = ResultCache(directory=str(tmp_path))
+    schedule, waiting_times, avg_waiting_time = results.run(workload, "srtf", compute=compute)
+    assert not compute.calls
+    assert results.stats()["disk_hits"] == 1
+    assert schedule.as_dicts() == expected[0].as_dicts()
+    assert (waiting_times, avg_waiting_time) == expected[1:]
+
+    results.clear(disk=True)
+    results.run(workload, "srtf", compute=compute)
+    assert len(compute.calls) == 1
+
+
+def test_options_are_part_of_the_key(monkeypatch):
+    monkeypatch.setattr(cache, "_default_cache", None)
+    compute = _Counting()
+    workload = make_workload(40)
+    for target_latency in (3, 20, 3):
+        result = cached_run_algorithm(workload, "cfs", compute=compute, target_latency=target_latency)
+        expected = run_algorithm(workload, "cfs", target_latency=target_latency)
+        assert result[0].as_dicts() == expected[0].as_dicts()
+    assert compute.calls == [("cfs", None, {"target_latency": 3}), ("cfs", None, {"target_latency": 20})]
@@ -0,0 +1,43 @@
+import random
+
+from algorithms import run_algorithm
+from compare import compare
+from metrics import compute_metrics
+from sweep import ALGORITHMS, evaluate
+from workload import prepare
+
+
+def _processes(rng, n):
+    return [
+        {
+            "pid": f"p{i}",
+            "arrival_time": rng.randint(0, 30),
+            "burst_time": rng.randint(1, 9),
+            "priority": rng.randint(0, 3),
+        }
+        for i in range(n)
+    ]
+
+
+def test_rows_match_run_algorithm():
+    rng = random.Random(19)
+    for _ in range(50):
+        processes = _processes(rng, rng.randint(1, 20))
+        quantum = rng.randint(1, 5)
+        rows, schedules = compare(processes, ALGORITHMS, quantum)
+        assert [row["algorithm"] for row in rows] == ALGORITHMS
+        for row in rows:
+            algorithm = row["algorithm"]
+            schedule, _, _ = run_algorithm(processes, algorithm, quantum)
+            assert schedules[algorithm].as_dicts() == schedule.as_dicts()
+            expected = {"algorithm": algorithm, "quantum": quantum if algorithm == "rr" else None}
+            expected.update(compute_metrics(schedule, processes).averages())
+            expected["segments"] = len(schedule)
+            assert row == expected
+
+
+def test_a_prepared_workload_is_reused():
+    workload = prepare(_processes(random.Random(3), 10))
+    rows, _ = compare(workload, ["sjf", "rr"], 3)
+    assert workload._columns is not None
+    assert rows == [evaluate(workload, "sjf"), evaluate(workload, "rr", 3)]
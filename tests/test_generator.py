@@ -0,0 +1,51 @@
+import pytest
+
+from generator import ARRIVALS, BURSTS, WorkloadGenerator
+from traces import load_workload
+
+
+def _columns(workload):
+    priority = None if workload.priority is None else workload.priority.tolist()
+    return (
+        list(workload.pids),
+        workload.arrival_time.tolist(),
+        workload.burst_time.tolist(),
+        priority,
+    )
+
+
+def _chunked(generator, n, chunk_size):
+    columns = ([], [], [], [])
+    for chunk in generator.chunks(n, chunk_size):
+        assert len(chunk) <= chunk_size
+        for column, values in zip(columns, _columns(chunk)):
+            if values is not None:
+                column.extend(values)
+    return columns
+
+
+@pytest.mark.parametrize("arrival", ARRIVALS)
+@pytest.mark.parametrize("burst", BURSTS)
+def test_output_does_not_depend_on_the_chunk_size(arrival, burst):
+    generator = WorkloadGenerator(arrival, burst, seed=25, priorities=4)
+    n = 2500
+    pids, arrivals, bursts, priority = _columns(generator.generate(n))
+    assert pids == [f"p{i}" for i in range(1, n + 1)]
+    assert arrivals == sorted(arrivals) and min(bursts) >= 1
+    for chunk_size in (1, 7, 999, 1000, n, 2 * n):
+        assert _chunked(generator, n, chunk_size) == (pids, arrivals, bursts, priority)
+
+
+def test_the_same_seed_gives_the_same_workload():
+    first = _columns(WorkloadGenerator("bursty", "pareto", seed=7, priorities=8).generate(3000))
+    again = _columns(WorkloadGenerator("bursty", "pareto", seed=7, priorities=8).generate(3000))
+    other = _columns(WorkloadGenerator("bursty", "pareto", seed=8, priorities=8).generate(3000))
+    assert first == again
+    assert first[1] != other[1] and first[2] != other[2] and first[3] != other[3]
+
+
+def test_written_files_match_generate(tmp_path):
+    generator = WorkloadGenerator("poisson", "lognormal", seed=3)
+    path = str(tmp_path / "generated.psw")
+    assert generator.write(path, 1234, chunk_size=100) == 1234
+    assert _columns(load_workload(path)) == _columns(generator.generate(1234))
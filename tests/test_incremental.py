@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from incremental import ALGORITHMS, IncrementalSimulator, resimulate
+
+
+def _processes(rng, n):
+    return [
+        {"pid": f"p{i + 1}", "arrival_time": rng.randint(0, 3 * n), "burst_time": rng.randint(1, 9)}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_updates_match_a_full_simulation(algorithm):
+    rng = random.Random(algorithm)
+    quantum = 3 if algorithm == "rr" else None
+    resumed = 0
+    for _ in range(20):
+        n = rng.randint(1, 200)
+        processes = _processes(rng, n)
+        # Frequent checkpoints so that edits actually resume mid-schedule.
+        sim = IncrementalSimulator(processes, algorithm, quantum, checkpoint_every=4)
+        sim.run()
+        for _ in range(10):
+            if rng.random() < 0.5:
+                result = sim.update(
+                    rng.randrange(n),
+                    arrival_time=rng.randint(0, 3 * n),
+                    burst_time=rng.randint(1, 9),
+                )
+            else:
+                rows = rng.sample(range(n), rng.randint(1, min(n, 5)))
+                result = sim.update_rows(
+                    rows,
+                    [rng.randint(0, 3 * n) for _ in rows],
+                    [rng.randint(1, 9) for _ in rows],
+                )
+            resumed += sim.resumed_from is not None
+
+            schedule, waiting_times, avg_waiting_time = result
+            expected = run_algorithm(sim.workload, algorithm, quantum)
+            assert schedule.as_dicts() == expected[0].as_dicts()
+            assert list(waiting_times.items()) == list(expected[1].items())
+            assert avg_waiting_time == pytest.approx(expected[2])
+    assert resumed
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_resimulate_follows_edits_and_added_or_removed_rows(algorithm):
+    rng = random.Random(f"resimulate-{algorithm}")
+    quantum = 2 if algorithm == "rr" else None
+    processes = _processes(rng, 60)
+    sim = IncrementalSimulator(processes, algorithm, quantum, checkpoint_every=4)
+    sim.run()
+    edited = [dict(p) for p in processes]
+    edited[30]["burst_time"] += 3
+    shorter = edited[:-5]
+    longer = shorter + [{"pid": "p99", "arrival_time": 7, "burst_time": 4}]
+    for workload in (edited, shorter, longer):
+        schedule, waiting_times, avg_waiting_time = resimulate(sim, workload)
+        expected = run_algorithm(workload, algorithm, quantum)
+        assert schedule.as_dicts() == expected[0].as_dicts()
+        assert list(waiting_times.items()) == list(expected[1].items())
+        assert avg_waiting_time == pytest.approx(expected[2])
+    assert len(sim.workload) == len(longer)
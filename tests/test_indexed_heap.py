@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from indexed_heap import IndexedHeap
+
+
+def _drain(heap):
+    popped = []
+    while heap:
+        popped.append(heap.pop())
+    return popped
+
+
+def test_pop_order_after_decrease_key_and_remove():
+    rng = random.Random(0)
+    for _ in range(200):
+        size = rng.randint(1, 40)
+        heap = IndexedHeap(size)
+        keys = {}
+        for item in rng.sample(range(size), rng.randint(1, size)):
+            keys[item] = (rng.randint(0, 20), item)
+            heap.push(item, keys[item])
+        for item in rng.sample(sorted(keys), len(keys) // 2):
+            keys[item] = (keys[item][0] - rng.randint(0, 10), item)
+            heap.decrease_key(item, keys[item])
+            assert heap.key(item) == keys[item]
+        for item in rng.sample(sorted(keys), len(keys) // 3):
+            heap.remove(item)
+            del keys[item]
+            assert item not in heap
+        assert len(heap) == len(keys)
+        assert _drain(heap) == sorted(((item, key) for item, key in keys.items()), key=lambda x: x[1])
+
+
+def test_peek_follows_decrease_key():
+    heap = IndexedHeap(3)
+    heap.push(0, 5)
+    heap.push(1, 7)
+    heap.push(2, 9)
+    heap.decrease_key(2, 1)
+    assert heap.peek() == (2, 1)
+    heap.remove(2)
+    assert heap.peek() == (0, 5)
+    assert _drain(heap) == [(0, 5), (1, 7)]
+
+
+def test_invalid_operations_raise():
+    heap = IndexedHeap(2)
+    heap.push(0, 3)
+    with pytest.raises(ValueError):
+        heap.push(0, 1)
+    with pytest.raises(ValueError):
+        heap.decrease_key(0, 4)
+    with pytest.raises(KeyError):
+        heap.decrease_key(1, 0)
+    with pytest.raises(KeyError):
+        heap.remove(1)
+    with pytest.raises(KeyError):
+        heap.key(1)
+    heap.remove(0)
+    assert not heap and 0 not in heap
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import input as gui  # noqa: E402
+
+
+class _Status:
+    def set(self, value):
+        self.value = value
+
+
+class _FailedResult:
+    def __init__(self, error):
+        self.error = error
+
+    def ready(self):
+        return True
+
+    def get(self):
+        raise self.error
+
+
+def _app(error):
+    app = SimpleNamespace(
+        pending=(_FailedResult(error), "RR on 3 processes", 0.0, None),
+        status_var=_Status(),
+        pool=SimpleNamespace(terminate=lambda: None),
+    )
+    app.finish_simulation = lambda: setattr(app, "pending", None)
+    return app
+
+
+@pytest.mark.parametrize("error", [KeyError("p1"), TypeError("bad"), ValueError("bad")])
+def test_failed_jobs_are_reported_and_reset(monkeypatch, error):
+    shown = []
+    monkeypatch.setattr(gui.messagebox, "showerror", lambda title, message: shown.append(message))
+    app = _app(error)
+    gui.InputGUI.poll_simulation(app)
+    assert app.pending is None
+    assert app.status_var.value == "RR on 3 processes failed"
+    assert len(shown) == 1
+
+
+def test_editing_a_row_out_of_view_does_nothing():
+    table = SimpleNamespace(
+        identify_row=lambda y: "7",
+        identify_column=lambda x: "#2",
+        bbox=lambda iid, column: "",
+    )
+    app = SimpleNamespace(table=table, editor=None)
+    gui.InputGUI.edit_cell(app, SimpleNamespace(x=5, y=500))
+    assert app.editor is None
@@ -0,0 +1,56 @@
+import random
+from collections import deque
+
+import pytest
+
+from algorithms import run_algorithm
+from instrumentation import schedule_counters
+
+
+def _rr_queue_high_water(processes, quantum):
+    # Round robin with a real deque, recording its length after every pop.
+    pending = sorted(processes, key=lambda p: p["arrival_time"])
+    remaining = {p["pid"]: p["burst_time"] for p in processes}
+    queue, cursor, time, longest = deque(), 0, pending[0]["arrival_time"], 0
+    while cursor < len(pending) or queue:
+        while cursor < len(pending) and pending[cursor]["arrival_time"] <= time:
+            queue.append(pending[cursor]["pid"])
+            cursor += 1
+        if not queue:
+            time = pending[cursor]["arrival_time"]
+            continue
+        pid = queue.popleft()
+        longest = max(longest, len(queue))
+        run = min(quantum, remaining[pid])
+        remaining[pid] -= run
+        time += run
+        if remaining[pid]:
+            queue.append(pid)
+    return longest
+
+
+def _processes(rows):
+    return [{"pid": pid, "arrival_time": a, "burst_time": b} for pid, a, b in rows]
+
+
+def test_max_ready_queue_counts_arrivals_at_the_next_dispatch():
+    # p6 arrives at 26 while p5 runs; the queue takes it in at 27, the same
+    # instant p5 finishes, so at most three processes wait at once.
+    processes = _processes(
+        [("p1", 25, 6), ("p2", 0, 7), ("p3", 3, 4), ("p4", 7, 8), ("p5", 8, 6), ("p6", 26, 2), ("p7", 9, 5)]
+    )
+    schedule, _, _ = run_algorithm(processes, "rr", 2)
+    assert schedule_counters(schedule, processes)["max_ready_queue"] == 3
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+def test_max_ready_queue_matches_a_round_robin_deque(quantum):
+    rng = random.Random(quantum)
+    for _ in range(300):
+        n = rng.randint(1, 12)
+        processes = _processes(
+            (f"p{i + 1}", rng.randint(0, 30), rng.randint(1, 9)) for i in range(n)
+        )
+        schedule, _, _ = run_algorithm(processes, "rr", quantum)
+        expected = _rr_queue_high_water(processes, quantum)
+        assert schedule_counters(schedule, processes)["max_ready_queue"] == expected, processes
@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+
+from main import main
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def _trace(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("pid,arrival_time,burst_time\np1,0,5\np2,1,3\np3,2,1\n")
+    return str(path)
+
+
+def test_quantum_is_only_reported_for_rr(tmp_path, capsys):
+    trace = _trace(tmp_path)
+    assert main([trace, "-a", "sjf", "-q", "4", "--json"]) == 0
+    assert main([trace, "-a", "rr", "-q", "4", "--json"]) == 0
+    sjf, rr = (json.loads(line) for line in capsys.readouterr().out.splitlines())
+    assert sjf["quantum"] is None and rr["quantum"] == 4
+
+
+def test_file_runs_do_not_import_the_generator(tmp_path):
+    script = (
+        "import sys; from main import main; "
+        f"main([{_trace(tmp_path)!r}]); print('generator' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], cwd=SRC, capture_output=True, text=True, check=True
+    ).stdout
+    assert out.splitlines()[-1] == "False"
+
+
+def test_generate_accepts_an_abbreviated_option(capsys):
+    assert main(["--gen", "50", "-a", "fcfs", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["processes"] == 50
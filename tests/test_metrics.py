@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from metrics import compute_metrics
+from workload import Workload
+
+
+def _baseline_tats_and_rts(segments):
+    # The removed algorithms.tats_and_rts: last end and first start per pid,
+    # with no arrival time subtracted.
+    tats, rts = {}, {}
+    for segment in segments:
+        rts.setdefault(segment["process"], segment["start"])
+        tats[segment["process"]] = segment["end"]
+    return tats, rts
+
+
+def test_turnaround_and_response_times_subtract_the_arrival():
+    workload = Workload(["a", "b", "c"], [0, 2, 4], [3, 4, 1])
+    schedule, _, _ = run_algorithm(workload, "fcfs")
+    # a 0-3, b 3-7, c 7-8
+    metrics = compute_metrics(schedule, workload)
+    assert metrics.as_dict("completion_time") == {"a": 3, "b": 7, "c": 8}
+    assert metrics.as_dict("turnaround_time") == {"a": 3, "b": 5, "c": 4}
+    assert metrics.as_dict("response_time") == {"a": 0, "b": 1, "c": 3}
+    assert metrics.as_dict("waiting_time") == {"a": 0, "b": 1, "c": 3}
+    # The baseline reported the raw times, which are off by the arrival.
+    tats, rts = _baseline_tats_and_rts(schedule.as_dicts())
+    assert tats == {"a": 3, "b": 7, "c": 8}
+    assert rts == {"a": 0, "b": 3, "c": 7}
+
+
+@pytest.mark.parametrize("algorithm", ["fcfs", "sjf", "srtf", "ljf", "rr"])
+def test_arrivals_at_zero_match_the_baseline_and_waiting_times(algorithm):
+    rng = random.Random(5)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        workload = Workload(
+            [f"p{i}" for i in range(n)],
+            [0] * n,
+            [rng.randint(1, 8) for _ in range(n)],
+        )
+        schedule, waiting_times, avg_waiting_time = run_algorithm(workload, algorithm, 3)
+        metrics = compute_metrics(schedule, workload)
+        tats, rts = _baseline_tats_and_rts(schedule.as_dicts())
+        assert metrics.as_dict("turnaround_time") == tats
+        assert metrics.as_dict("response_time") == rts
+        assert metrics.as_dict("waiting_time") == waiting_times
+        assert metrics.avg_waiting_time == pytest.approx(avg_waiting_time)
+
+
+def test_list_of_dicts_and_missing_processes():
+    segments = [
+        {"process": "a", "start": 0, "end": 2},
+        {"process": "b", "start": 2, "end": 3},
+        {"process": "a", "start": 3, "end": 4},
+    ]
+    # Without processes every pid arrives at t=0 with the time it ran.
+    metrics = compute_metrics(segments)
+    assert metrics.as_dict("waiting_time") == {"a": 1, "b": 2}
+    assert metrics.averages() == {"awt": 1.5, "ata": 3.5, "art": 1.0}
+
+    # A process that never ran finishes when it arrives.
+    processes = [
+        {"pid": "a", "arrival_time": 0, "burst_time": 3},
+        {"pid": "b", "arrival_time": 1, "burst_time": 1},
+        {"pid": "z", "arrival_time": 4, "burst_time": 0},
+    ]
+    metrics = compute_metrics(segments, processes)
+    assert metrics.as_dict("turnaround_time") == {"a": 4, "b": 2, "z": 0}
+    assert metrics.as_dict("response_time") == {"a": 0, "b": 1, "z": 0}
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from algorithms import run_algorithm
+from benchmark import make_workload
+from metrics import compute_metrics
+from montecarlo import RunningStats, simulate, simulate_percentiles
+from sketches import MetricsAccumulator
+
+
+def _stats(values):
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+    return stats
+
+
+def test_running_stats_match_numpy():
+    rng = np.random.default_rng(9)
+    values = rng.exponential(1000.0, 5000) + 1e6
+    stats = _stats(values)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(values.var(ddof=1), rel=1e-9)
+    assert _stats([]).variance == 0.0 and _stats([3.0]).variance == 0.0
+
+
+def test_merged_running_stats_match_numpy():
+    rng = np.random.default_rng(10)
+    values = rng.normal(50.0, 7.0, 1000)
+    for cuts in ([0, 1000], [0, 0, 1000], [0, 1, 999, 1000], [0, 250, 400, 999, 1000]):
+        merged = RunningStats()
+        for start, stop in zip(cuts, cuts[1:]):
+            merged.merge(_stats(values[start:stop]))
+        assert merged.count == len(values)
+        assert merged.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert merged.variance == pytest.approx(values.var(ddof=1), rel=1e-9)
+
+
+def test_totals_match_the_runs_done_serially():
+    totals = simulate(10, 15, ("sjf", "rr"), quantum=3, seed=4, max_workers=3)
+    for algorithm in ("sjf", "rr"):
+        averages = []
+        for run in range(10):
+            workload = make_workload(15, "saturated", "exponential", [4, run])
+            schedule, _, _ = run_algorithm(workload, algorithm, 3 if algorithm == "rr" else None)
+            averages.append(compute_metrics(schedule, workload).averages())
+        for metric in ("awt", "ata", "art"):
+            values = np.array([row[metric] for row in averages])
+            assert totals[algorithm][metric].count == 10
+            assert totals[algorithm][metric].mean == pytest.approx(values.mean())
+            assert totals[algorithm][metric].variance == pytest.approx(values.var(ddof=1))
+
+
+def test_percentiles_come_from_their_own_function():
+    totals = simulate(6, 20, ("sjf", "rr"), max_workers=2)
+    assert set(totals) == {"sjf", "rr"}
+    assert isinstance(totals["rr"]["awt"], RunningStats)
+
+    with_percentiles, accumulators = simulate_percentiles(6, 20, ("sjf", "rr"), max_workers=2)
+    assert isinstance(accumulators["sjf"], MetricsAccumulator)
+    assert len(accumulators["sjf"]) == 6 * 20
+    for algorithm in totals:
+        assert with_percentiles[algorithm]["awt"].mean == totals[algorithm]["awt"].mean
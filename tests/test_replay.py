@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from algorithms import run_algorithm  # noqa: E402
+from benchmark import make_workload  # noqa: E402
+from replay import _PALETTE, GanttReplay  # noqa: E402
+
+
+def test_segments_land_on_their_labelled_rows():
+    schedule, _, _ = run_algorithm(make_workload(30), "srtf")
+    fig, ax = plt.subplots(figsize=(8, 6), dpi=100)
+    try:
+        t_max = int(schedule.end[-1])
+        # A window this wide keeps the whole schedule on the first page.
+        player = GanttReplay(ax, schedule, window=4 * t_max)
+        player.paused = True
+        player._init()
+        player.seek(t_max)
+        player._frame(0)
+        fig.canvas.draw()
+        ax.draw_artist(player._image)
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+        height = pixels.shape[0]
+
+        labels = [label.get_text() for label in ax.get_yticklabels()]
+        for pid, start, end in list(schedule)[:5]:
+            row = labels.index(pid)
+            x, y = ax.transData.transform(((start + end) / 2, row))
+            # The canvas buffer has the top row first, display y grows upwards.
+            assert tuple(pixels[int(height - y), int(x)]) == tuple(_PALETTE[row % 10]), pid
+    finally:
+        plt.close(fig)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from schedule import Schedule, as_schedule
+
+
+def test_arrays_do_not_block_appending():
+    schedule = Schedule(["p1", "p2"])
+    assert len(schedule.index) == 0
+    schedule.append(0, 0, 3)
+    index, start, end = schedule.index, schedule.start, schedule.end
+    schedule.append(1, 3, 5)
+    schedule.append(1, 5, 6, merge=True)
+    assert index.tolist() == [0] and end.tolist() == [3]
+    assert schedule.index.tolist() == [0, 1]
+    assert schedule.start.tolist() == [0, 3]
+    assert schedule.end.tolist() == [3, 6]
+
+
+def test_arrays_are_read_only():
+    schedule = Schedule.from_arrays(["p1"], [0], [0], [2])
+    with pytest.raises(ValueError):
+        schedule.end[0] = 5
+    assert np.array_equal(schedule[:1].end, [2])
+
+
+def test_iteration_yields_tuples_and_as_dicts_keeps_the_old_format():
+    schedule = Schedule.from_arrays(["p1", "p2"], [0, 1, 0], [0, 2, 5], [2, 5, 6])
+    assert list(schedule) == [("p1", 0, 2), ("p2", 2, 5), ("p1", 5, 6)]
+    assert schedule[1] == ("p2", 2, 5)
+    segments = schedule.as_dicts()
+    assert segments == [
+        {"process": "p1", "start": 0, "end": 2},
+        {"process": "p2", "start": 2, "end": 5},
+        {"process": "p1", "start": 5, "end": 6},
+    ]
+    assert list(as_schedule(segments)) == list(schedule)
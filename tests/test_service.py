@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import pytest
+
+from service import SimulationService, _parse_request, _run_batch
+from workload import Workload
+
+
+def _workload():
+    return Workload(["p1", "p2", "p3"], [0, 1, 2], [4, 2, 3])
+
+
+def test_a_failing_job_does_not_fail_its_batch():
+    results = _run_batch(
+        [
+            (_workload(), "fcfs", None, {}),
+            (_workload(), "rr", "4", {}),
+            (_workload(), "sjf", None, {}),
+            (_workload(), "nope", None, {}),
+        ]
+    )
+    assert [ok for ok, _ in results] == [True, False, True, False]
+    assert results[0][1][1] == {"p1": 0, "p2": 3, "p3": 4}
+
+
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        {"algorithm": "rr", "quantum": 0},
+        {"algorithm": "rr", "quantum": "4"},
+        {"algorithm": "rr", "quantum": True},
+        {"algorithm": "rr"},
+        {"algorithm": "lottery"},
+        {"algorithm": "cfs", "min_granularity": 1.5},
+    ],
+)
+def test_invalid_requests_are_rejected(request_body):
+    request_body.update(pids=["p1"], arrival_time=[0], burst_time=[3])
+    with pytest.raises(ValueError):
+        _parse_request(json.dumps(request_body))
+
+
+@pytest.mark.parametrize(
+    "process",
+    [
+        {"pid": 1, "arrival_time": 0, "burst_time": 3},
+        {"pid": "", "arrival_time": 0, "burst_time": 3},
+        {"pid": "p1", "arrival_time": 0.5, "burst_time": 3},
+        {"pid": "p1", "arrival_time": "0", "burst_time": 3},
+        {"pid": "p1", "arrival_time": -1, "burst_time": 3},
+        {"pid": "p1", "arrival_time": 0, "burst_time": 2.9},
+        {"pid": "p1", "arrival_time": 0, "burst_time": "3"},
+        {"pid": "p1", "arrival_time": 0, "burst_time": 0},
+        {"pid": "p1", "arrival_time": 0, "burst_time": 3, "priority": "1"},
+    ],
+)
+def test_invalid_processes_are_rejected(process):
+    with pytest.raises(ValueError):
+        _parse_request(json.dumps({"processes": [process]}))
+    columns = {
+        "pids": [process["pid"]],
+        "arrival_time": [process["arrival_time"]],
+        "burst_time": [process["burst_time"]],
+    }
+    if "priority" in process:
+        columns["priority"] = [process["priority"]]
+    with pytest.raises(ValueError):
+        _parse_request(json.dumps(columns))
+
+
+def test_both_request_forms_give_the_same_workload():
+    _, rows = _parse_request(
+        json.dumps(
+            {
+                "processes": [
+                    {"pid": "p1", "arrival_time": 0, "burst_time": 4, "priority": 2},
+                    {"pid": "p2", "arrival_time": 1, "burst_time": 2},
+                ]
+            }
+        )
+    )
+    _, columns = _parse_request(
+        json.dumps({"pids": ["p1", "p2"], "arrival_time": [0, 1], "burst_time": [4, 2], "priority": [2, 0]})
+    )
+    assert rows.to_processes() == columns.to_processes()
+
+
+def test_invalid_request_gets_status_400():
+    async def scenario():
+        service = SimulationService(max_workers=1)
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = json.dumps(
+                {"pids": ["p1"], "arrival_time": [0], "burst_time": [3], "algorithm": "rr", "quantum": 0}
+            ).encode()
+            writer.write(
+                b"POST /simulate HTTP/1.1\r\nConnection: close\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            response = await reader.read()
+            writer.close()
+        finally:
+            server.close()
+            service.close()
+        return response
+
+    response = asyncio.run(scenario())
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"positive integer quantum" in response
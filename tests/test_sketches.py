@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from sketches import Histogram, MetricsAccumulator, QuantileSketch
+
+QUANTILES = (0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999, 1.0)
+
+
+def _samples(seed):
+    rng = np.random.default_rng(seed)
+    return np.concatenate(
+        [
+            rng.lognormal(3, 2, size=20_000),
+            -rng.exponential(50, size=2_000),
+            np.zeros(500),
+            rng.integers(1, 1000, size=5_000),
+        ]
+    )
+
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_quantiles_are_within_the_relative_error(relative_accuracy):
+    values = _samples(0)
+    sketch = QuantileSketch(relative_accuracy)
+    sketch.add(values)
+    for q in QUANTILES:
+        # The sketch estimates the value at rank floor(q * (n - 1)).
+        exact = np.percentile(values, q * 100, method="lower")
+        assert abs(sketch.quantile(q) - exact) <= relative_accuracy * abs(exact) + 1e-9, q
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(values.mean())
+
+
+def test_merged_sketches_equal_one_sketch_of_all_values():
+    parts = np.array_split(_samples(1), 7)
+    combined = QuantileSketch()
+    combined.add(np.concatenate(parts))
+    merged = QuantileSketch()
+    for part in parts:
+        sketch = QuantileSketch()
+        sketch.add(part)
+        merged.merge(sketch)
+    for q in QUANTILES:
+        assert merged.quantile(q) == combined.quantile(q)
+    assert (merged.count, merged.min, merged.max) == (combined.count, combined.min, combined.max)
+    assert merged.sum == pytest.approx(combined.sum)
+
+
+def test_merging_sketches_of_different_accuracy_fails():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_histogram_counts_and_merge():
+    values = _samples(2)
+    histogram = Histogram.exponential()
+    halves = [Histogram.exponential(), Histogram.exponential()]
+    histogram.add(values)
+    for half, part in zip(halves, np.array_split(values, 2)):
+        half.add(part)
+    halves[0].merge(halves[1])
+    assert halves[0].counts.tolist() == histogram.counts.tolist()
+    for low, high, count in histogram.buckets():
+        assert count == np.count_nonzero((values >= low) & (values < high))
+
+
+def test_merged_accumulators_summarise_all_processes():
+    rng = np.random.default_rng(3)
+    columns = rng.integers(0, 500, size=(3, 10_000))
+    combined = MetricsAccumulator()
+    combined.add(*columns)
+    merged = MetricsAccumulator()
+    for part in np.array_split(columns, 4, axis=1):
+        accumulator = MetricsAccumulator()
+        accumulator.add(*part)
+        merged.merge(accumulator)
+    assert len(merged) == 10_000
+    expected = combined.summary()
+    for metric, row in merged.summary().items():
+        assert row == pytest.approx(expected[metric])
@@ -0,0 +1,60 @@
+import itertools
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from streaming import Completion, Segment, stream_algorithm
+
+
+def _sorted_processes(rng, max_processes=15):
+    # Ties in arrival and burst are common; pids are shuffled so ties are
+    # broken by stream position, not by name.
+    n = rng.randint(1, max_processes)
+    pids = [f"p{i + 1}" for i in range(n)]
+    rng.shuffle(pids)
+    processes = [
+        {"pid": pid, "arrival_time": rng.randint(0, 20), "burst_time": rng.randint(1, 8)}
+        for pid in pids
+    ]
+    return sorted(processes, key=lambda p: p["arrival_time"])
+
+
+@pytest.mark.parametrize("algorithm", ["fcfs", "sjf", "srtf", "ljf", "rr"])
+def test_streams_match_the_batch_algorithms(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(300):
+        processes = _sorted_processes(rng)
+        quantum = rng.randint(1, 4)
+        schedule, waiting_times, _ = run_algorithm(processes, algorithm, quantum)
+        events = list(stream_algorithm(iter(processes), algorithm, quantum))
+
+        segments = [event for event in events if isinstance(event, Segment)]
+        assert [tuple(segment) for segment in segments] == list(schedule), processes
+
+        completions = [event for event in events if isinstance(event, Completion)]
+        assert {c.process: c.waiting_time for c in completions} == waiting_times
+        # A completion follows the last segment of its process.
+        last_segment = {
+            event.process: i for i, event in enumerate(events) if isinstance(event, Segment)
+        }
+        for i, event in enumerate(events):
+            if isinstance(event, Completion):
+                assert last_segment[event.process] < i
+
+
+def test_streams_start_before_the_input_ends():
+    endless = (
+        {"pid": f"p{i}", "arrival_time": 3 * i, "burst_time": 2} for i in itertools.count()
+    )
+    events = stream_algorithm(endless, "rr", 4)
+    assert next(events) == Segment("p0", 0, 2)
+
+
+def test_unordered_input_is_rejected():
+    processes = [
+        {"pid": "a", "arrival_time": 5, "burst_time": 1},
+        {"pid": "b", "arrival_time": 2, "burst_time": 1},
+    ]
+    with pytest.raises(ValueError):
+        list(stream_algorithm(processes, "fcfs"))
@@ -0,0 +1,40 @@
+from multiprocessing import shared_memory
+
+from sweep import _pack_workload, _unpack_workload, evaluate, sweep, sweep_grid
+from workload import Workload
+
+
+def _workload(priority=None):
+    return Workload(
+        ["p1", "prozess-ü", "p3", "p4", "p5"], [0, 1, 1, 4, 9], [5, 3, 8, 2, 4], priority
+    )
+
+
+def test_shared_memory_round_trip():
+    for workload in (_workload(), _workload([2, 0, 1, 0, 3])):
+        shm, n, pid_length, has_priority = _pack_workload(workload)
+        try:
+            attached = shared_memory.SharedMemory(name=shm.name)
+            unpacked = _unpack_workload(attached, n, pid_length, has_priority)
+            assert unpacked.to_processes() == workload.to_processes()
+            del unpacked
+            attached.close()
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def test_pool_rows_match_serial_runs():
+    workload = _workload([2, 0, 1, 0, 3])
+    algorithms = ["fcfs", "sjf", "srtf", "ljf", "rr", "cfs", "priority"]
+    quanta = [1, 2, 5]
+    rows = sweep(workload, algorithms, quanta, max_workers=2)
+    assert rows == [evaluate(workload, *config) for config in sweep_grid(algorithms, quanta)]
+    assert [(row["algorithm"], row["quantum"]) for row in rows][-5:] == [
+        ("rr", 1),
+        ("rr", 2),
+        ("rr", 5),
+        ("cfs", None),
+        ("priority", None),
+    ]
+    assert sweep(workload, [], quanta) == []
@@ -0,0 +1,23 @@
+import pytest
+
+from traces import BinaryWriter, convert_csv, load_binary
+
+
+def test_failed_conversion_leaves_no_file(tmp_path):
+    csv_path = tmp_path / "trace.csv"
+    rows = "".join(f"p{i},{i},3\n" for i in range(1, 50))
+    csv_path.write_text("pid,arrival_time,burst_time\n" + rows + "p50,oops,3\n")
+    binary_path = tmp_path / "trace.psw"
+
+    with pytest.raises(ValueError):
+        convert_csv(str(csv_path), str(binary_path), chunk_size=10)
+
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+def test_writer_finishes_the_file_without_an_error(tmp_path):
+    path = tmp_path / "trace.psw"
+    with BinaryWriter(str(path)) as writer:
+        writer.write([{"pid": "p1", "arrival_time": 0, "burst_time": 4}])
+    workload = load_binary(str(path))
+    assert list(workload.pids) == ["p1"] and list(workload.burst_time) == [4]
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from algorithms import run_algorithm
+from instrumentation import schedule_counters
+from metrics import compute_metrics
+from tuner import QuantumTuner, tune_quantum
+
+
+def _processes(rng, max_processes=10):
+    return [
+        {"pid": f"p{i}", "arrival_time": rng.randint(0, 20), "burst_time": rng.randint(1, 40)}
+        for i in range(rng.randint(1, max_processes))
+    ]
+
+
+def _brute_force(processes, quantum, weights, switch_penalty):
+    # Score a quantum from a full RR schedule, as tuner.py documents it.
+    schedule, _, _ = run_algorithm(processes, "rr", quantum)
+    averages = compute_metrics(schedule, processes).averages()
+    switches = schedule_counters(schedule, processes)["context_switches"]
+    return (
+        sum(weights.get(metric, 0.0) * value for metric, value in averages.items())
+        + switch_penalty * switches / len(processes)
+    )
+
+
+@pytest.mark.parametrize(
+    "objective, switch_penalty", [("awt", 0.0), ("art", 1.5), ("awt=1,ata=0.5,art=2", 0.25)]
+)
+def test_prefix_reuse_and_pruning_keep_scores_exact(objective, switch_penalty):
+    rng = random.Random(objective)
+    for _ in range(60):
+        processes = _processes(rng)
+        tuner = QuantumTuner(processes, objective, switch_penalty, check_every=1)
+        quanta = list(range(1, 45))
+        rng.shuffle(quanta)
+        bound = float("inf")
+        for quantum in quanta:
+            row = tuner.evaluate(quantum, bound)
+            exact = _brute_force(processes, quantum, tuner.weights, switch_penalty)
+            if row["pruned"]:
+                # A pruned row reports a lower bound that exceeded the bound.
+                assert bound < row["score"] <= exact + 1e-9
+            else:
+                assert row["score"] == pytest.approx(exact)
+                bound = min(bound, row["score"])
+
+
+def test_tune_reports_exact_scores_no_better_than_brute_force():
+    rng = random.Random(21)
+    for _ in range(100):
+        processes = _processes(rng)
+        best, rows = tune_quantum(processes, "awt=1,art=1", 0.5)
+        max_burst = max(p["burst_time"] for p in processes)
+        scores = {
+            quantum: _brute_force(processes, quantum, {"awt": 1, "art": 1}, 0.5)
+            for quantum in range(1, max_burst + 1)
+        }
+        assert best["score"] == pytest.approx(scores[best["quantum"]])
+        assert best["score"] >= min(scores.values()) - 1e-9
+        assert [row["quantum"] for row in rows] == sorted({row["quantum"] for row in rows})
+
+
+@pytest.mark.parametrize(
+    "processes, objective, found, optimum",
+    [
+        # The coarse grid is 1, 2, 4, 6, 9, 14, 22; zooming in around q=2
+        # only covers 1 to 4, so q=5 is never tried.
+        (
+            [
+                {"pid": "p0", "arrival_time": 17, "burst_time": 5},
+                {"pid": "p1", "arrival_time": 7, "burst_time": 22},
+            ],
+            "art",
+            (2, 5.5),
+            (5, 4.0),
+        ),
+        (
+            [
+                {"pid": "p0", "arrival_time": 2, "burst_time": 30},
+                {"pid": "p1", "arrival_time": 6, "burst_time": 10},
+            ],
+            "awt",
+            (15, 13.75),
+            (5, 13.5),
+        ),
+    ],
+)
+def test_documented_heuristic_misses(processes, objective, found, optimum):
+    # The objective is not unimodal in the quantum, so the search can settle
+    # on a local minimum. These pin known cases; if the search improves,
+    # update them.
+    best, _ = tune_quantum(processes, objective, switch_penalty=1.5)
+    assert (best["quantum"], best["score"]) == found
+    weights = {objective: 1.0}
+    assert _brute_force(processes, optimum[0], weights, 1.5) == optimum[1]
+    assert min(
+        _brute_force(processes, quantum, weights, 1.5)
+        for quantum in range(1, max(p["burst_time"] for p in processes) + 1)
+    ) == optimum[1]
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib").use("Agg")
+
+from matplotlib.figure import Figure  # noqa: E402
+
+from algorithms import run_algorithm  # noqa: E402
+from benchmark import make_workload  # noqa: E402
+from visualizer import (  # noqa: E402
+    MAX_LISTED_PROCESSES,
+    MAX_PROCESS_COLLECTIONS,
+    draw_gantt,
+    merge_segments,
+    visualize_results,
+)
+from workload import Workload  # noqa: E402
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def test_merge_segments_closes_gaps_per_key():
+    key = np.array([1, 0, 1, 0, 1])
+    start = np.array([0, 2, 3, 9, 10])
+    end = np.array([2, 3, 4, 10, 11])
+    merged = merge_segments(key, start, end, 3)
+    assert [array.tolist() for array in merged] == [[0, 0, 1, 1], [2, 9, 0, 10], [3, 10, 4, 11]]
+
+
+@pytest.mark.parametrize("processes, burst", [(8, 400), (MAX_PROCESS_COLLECTIONS * 4, 20)])
+def test_decimation_caps_the_rectangle_count(processes, burst):
+    # Quantum 1 interleaves every process, giving one segment per time unit.
+    workload = Workload([f"p{i}" for i in range(processes)], [0] * processes, [burst] * processes)
+    schedule, _, _ = run_algorithm(workload, "rr", 1)
+    width, height = 200, 50
+    drawn = draw_gantt(Figure().add_subplot(), schedule, width, height)
+    rows = min(processes, height + 1)
+    # Gaps within a row are at least one pixel wide, so every row holds at
+    # most one rectangle per pixel column.
+    assert drawn <= rows * (width + 1) < len(schedule)
+
+
+def test_save_gantt_needs_no_display(tmp_path):
+    output = tmp_path / "chart.png"
+    script = (
+        "import sys\n"
+        "from algorithms import run_algorithm\n"
+        "from visualizer import save_gantt\n"
+        "schedule, _, _ = run_algorithm("
+        "[{'pid': 'a', 'arrival_time': 0, 'burst_time': 5}, "
+        "{'pid': 'b', 'arrival_time': 1, 'burst_time': 3}], 'rr', 2)\n"
+        f"save_gantt(schedule, {str(output)!r}, title='RR')\n"
+        "assert 'matplotlib.pyplot' not in sys.modules\n"
+        "assert 'tkinter' not in sys.modules\n"
+    )
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name not in ("DISPLAY", "WAYLAND_DISPLAY", "MPLBACKEND")
+    }
+    subprocess.run([sys.executable, "-c", script], cwd=SRC, env=env, check=True)
+    assert output.read_bytes().startswith(b"\x89PNG")
+
+
+def test_large_workloads_are_summarised_on_the_console(tmp_path, capsys):
+    workload = make_workload(5000)
+    schedule, waiting_times, avg_waiting_time = run_algorithm(workload, "fcfs")
+    visualize_results(
+        schedule, waiting_times, avg_waiting_time, "gui", "FCFS", workload, str(tmp_path / "chart.png")
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert "Showing results for FCFS: 5000 processes" in lines
+    for label in ("WT", "TAT", "RT"):
+        assert sum(line.startswith(f"\t{label}(") for line in lines) == MAX_LISTED_PROCESSES
+    assert lines.count(f"\t... {5000 - MAX_LISTED_PROCESSES} more processes") == 3